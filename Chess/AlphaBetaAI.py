@@ -2,20 +2,62 @@
 # Contains the methods with respect to the alpha-beta AI for the chess game.
 # Carter Kruse (October 5, 2023)
 
+from MoveOrdering import MoveOrdering
+from Quiescence import Quiescence
 import chess
-import random
+
+# The width of the null window (Principal Variation Search), and the half-width of the aspiration window (in pawns).
+NULL_WINDOW = 0.001
+ASPIRATION_WINDOW = 1
+
+# Null-Move Pruning: The reduction of the depth for the null move.
+NULL_MOVE_REDUCTION = 2
+
+# Late-Move Reductions: The number of moves searched at the full depth (before the later quiet moves are reduced by one).
+LATE_MOVES = 3
 
 class AlphaBetaAI():
     # Constructor
-    def __init__(self, depth):
+    def __init__(self, depth, move_ordering = True, quiescence = False, quiescence_nodes = 1000, evaluator = None, variant = 'alpha_beta',
+                 null_move = False, late_move_reductions = False, check_extensions = False):
         self.depth = depth
         self.moves = 0
         self.calls = 0
+
+        # Search Variant: 'alpha_beta' (full window), or 'pvs' (Principal Variation Search, with aspiration windows)
+        self.variant = variant
+
+        # The score of the previous search (the center of the aspiration window).
+        self.previous_value = None
+
+        # Move Ordering (MVV-LVA, Killer Moves, History Heuristic)
+        self.ordering = MoveOrdering(move_ordering)
+
+        # Quiescence Search (Captures Only) At The Leaves, With A Limit On The Nodes For Each Leaf
+        self.quiescence = Quiescence(self.utility, quiescence_nodes, push = self.push, pop = self.pop) if quiescence else None
+
+        # Incremental Evaluator (Updated As Moves Are Pushed/Popped), Replacing The Material Count If Given
+        self.evaluator = evaluator
+
+        # Selective Search (Null-Move Pruning, Late-Move Reductions, Check Extensions)
+        self.null_move = null_move
+        self.late_move_reductions = late_move_reductions
+        self.check_extensions = check_extensions
+
+        # The number of calls for the most recent move, along with the effective branching factor.
+        self.move_calls = 0
+        self.branching_factor = 0
     
     # Applying the minimax algorithm to the board and displaying the recommended move.
     def choose_move(self, board):
+        calls = self.calls
         move = self.alpha_beta(board)
-        print("Alpha-Beta AI Recommended Move: " + str(move) + " (Moves: " + str(self.moves) + ", Calls: " + str(self.calls) + ", Max Depth: " + str(self.depth) + ")")
+
+        # Effective Branching Factor: The number of calls for the move, to the power of one over the depth (of the search after the root).
+        self.move_calls = self.calls - calls
+        self.branching_factor = self.move_calls ** (1 / (self.depth + 1))
+
+        print("Alpha-Beta AI Recommended Move: " + str(move) + " (Moves: " + str(self.moves) + ", Calls: " + str(self.calls) + ", Effective Branching Factor: " + "{:.2f}".format(self.branching_factor) + ", Max Depth: " + str(self.depth) + ")")
         return move
     
     # Algorithm
@@ -28,7 +70,8 @@ class AlphaBetaAI():
         # moves = list(board.legal_moves)
         # random.shuffle(moves)
 
-        moves = self.ordered_moves(board)
+        self.ordering.new_search()
+        moves = self.ordered_moves(board, 0)
 
         # Set the best value equal to the boundary, and the best move equal to a random move.
         best_value = float('-inf') if board.turn == chess.WHITE else float('inf')
@@ -40,10 +83,20 @@ class AlphaBetaAI():
         # Update the number of alpha beta moves.
         self.moves += 1
 
+        # The number of moves made before the search (to limit the check extensions).
+        self.root_ply = len(board.move_stack)
+
+        # Compute the score of the root position (updated incrementally from here).
+        if self.evaluator:
+            self.evaluator.set(board)
+
+        if self.variant == 'pvs':
+            return self.aspiration_search(board, moves, max_depth)
+
         # Cycle through the possible legal moves.
         for move in moves:
             # Update the state of the board.
-            board.push(move)
+            self.push(board, move)
             self.calls += 1
             
             # If the "new" turn is the white player, i.e. the move is the black player.
@@ -69,14 +122,86 @@ class AlphaBetaAI():
                     best_move = move
             
             # Return the board to it's previous state.
-            board.pop()
+            self.pop(board)
         
         return best_move
     
+    # Aspiration Windows
+        # Search with a window around the score of the previous search, searching again (with the full window) if the score falls outside.
+    def aspiration_search(self, board, moves, max_depth):
+        if self.previous_value is not None and abs(self.previous_value) != float('inf'):
+            alpha, beta = self.previous_value - ASPIRATION_WINDOW, self.previous_value + ASPIRATION_WINDOW
+            value, move = self.search_root(board, moves, max_depth, alpha, beta)
+
+            if alpha < value < beta:
+                self.previous_value = value
+                return move
+
+        value, move = self.search_root(board, moves, max_depth, float('-inf'), float('inf'))
+        self.previous_value = value
+        return move
+    
+    # Root Search (Principal Variation Search), narrowing the window with the best score so far.
+    def search_root(self, board, moves, max_depth, alpha, beta):
+        best_value = float('-inf') if board.turn == chess.WHITE else float('inf')
+        best_move = moves[0]
+
+        for move in moves:
+            self.push(board, move)
+            self.calls += 1
+            current_value = self.search_child(board, 0, max_depth, alpha, beta, move == moves[0])
+            self.pop(board)
+
+            if board.turn == chess.WHITE:
+                if current_value > best_value:
+                    best_value, best_move = current_value, move
+                alpha = max(alpha, best_value)
+            else:
+                if current_value < best_value:
+                    best_value, best_move = current_value, move
+                beta = min(beta, best_value)
+
+            # The score is outside of the (aspiration) window.
+            if alpha >= beta:
+                break
+
+        return best_value, best_move
+    
+    # Search the position after a move (the value of the child).
+        # Principal Variation Search: Moves after the first are searched with a null window, and searched again if they are better.
+    def search_child(self, board, current_depth, max_depth, alpha, beta, first):
+        child = self.max_value if board.turn == chess.WHITE else self.min_value
+
+        if self.variant != 'pvs' or first:
+            return child(board, current_depth, max_depth, alpha, beta)
+
+        # The move was made by the black (minimizing) player, so the move must be better than beta.
+        if board.turn == chess.WHITE:
+            if beta == float('inf'):
+                return child(board, current_depth, max_depth, alpha, beta)
+
+            value = child(board, current_depth, max_depth, beta - NULL_WINDOW, beta)
+            if alpha < value < beta:
+                value = child(board, current_depth, max_depth, alpha, beta)
+            return value
+
+        # The move was made by the white (maximizing) player, so the move must be better than alpha.
+        if alpha == float('-inf'):
+            return child(board, current_depth, max_depth, alpha, beta)
+
+        value = child(board, current_depth, max_depth, alpha, alpha + NULL_WINDOW)
+        if alpha < value < beta:
+            value = child(board, current_depth, max_depth, alpha, beta)
+        return value
+    
     # Max Value
     def max_value(self, board, current_depth, max_depth, alpha, beta):
         # Check if the cutoff conditions are satisfied.
         if self.cutoff_test(board, current_depth, max_depth):
+            # Search the captures until the position is quiet, if enabled.
+            if self.quiescence:
+                return self.quiesce(board, alpha, beta)
+
             # Return the "utility" of the board position.
             return self.utility(board)
         
@@ -85,17 +210,24 @@ class AlphaBetaAI():
         # moves = list(board.legal_moves)
         # random.shuffle(moves)
 
-        moves = self.ordered_moves(board)
+        # Null-Move Pruning
+        null_value = self.null_move_search(board, current_depth, max_depth, alpha, beta)
+        if null_value is not None:
+            return null_value
+
+        moves = self.ordered_moves(board, current_depth + 1)
 
         # Cycle through the possible legal moves, and apply the recursive algorithm.
-        for move in moves:
-            board.push(move)
+        for index, move in enumerate(moves):
+            reducible = self.reducible(board, move, index, current_depth, max_depth)
+            self.push(board, move)
             self.calls += 1
-            value = max(value, self.min_value(board, current_depth + 1, max_depth, alpha, beta))
-            board.pop()
+            value = max(value, self.search_move(board, current_depth + 1, max_depth, alpha, beta, index == 0, reducible))
+            self.pop(board)
 
             # Pruning
             if value >= beta:
+                self.ordering.cutoff(board, move, current_depth + 1, max_depth - current_depth)
                 return value
             
             # Updating the alpha value.
@@ -107,6 +239,10 @@ class AlphaBetaAI():
     def min_value(self, board, current_depth, max_depth, alpha, beta):
         # Check if the cutoff conditions are satisfied.
         if self.cutoff_test(board, current_depth, max_depth):
+            # Search the captures until the position is quiet, if enabled.
+            if self.quiescence:
+                return self.quiesce(board, alpha, beta)
+
             # Return the "utility" of the board position.
             return self.utility(board)
         
@@ -115,17 +251,24 @@ class AlphaBetaAI():
         # moves = list(board.legal_moves)
         # random.shuffle(moves)
 
-        moves = self.ordered_moves(board)
+        # Null-Move Pruning
+        null_value = self.null_move_search(board, current_depth, max_depth, alpha, beta)
+        if null_value is not None:
+            return null_value
+
+        moves = self.ordered_moves(board, current_depth + 1)
 
         # Cycle through the possible legal moves, and apply the recursive algorithm.
-        for move in moves:
-            board.push(move)
+        for index, move in enumerate(moves):
+            reducible = self.reducible(board, move, index, current_depth, max_depth)
+            self.push(board, move)
             self.calls += 1
-            value = min(value, self.max_value(board, current_depth + 1, max_depth, alpha, beta))
-            board.pop()
+            value = min(value, self.search_move(board, current_depth + 1, max_depth, alpha, beta, index == 0, reducible))
+            self.pop(board)
         
             # Pruning
             if value <= alpha:
+                self.ordering.cutoff(board, move, current_depth + 1, max_depth - current_depth)
                 return value
         
             # Updating the beta value.
@@ -133,6 +276,83 @@ class AlphaBetaAI():
         
         return value
     
+    # Search the position after a move, with the selective search options (check extensions, late-move reductions).
+    def search_move(self, board, current_depth, max_depth, alpha, beta, first, reducible):
+        # Check Extension: Moves that give check are searched one deeper (up to twice the maximum depth from the root).
+        if self.check_extensions and board.is_check() and len(board.move_stack) - self.root_ply < 2 * max_depth:
+            current_depth -= 1
+
+        # Late-Move Reduction: Late quiet moves are searched one shallower, and searched again (at the full depth) if they are better.
+        if reducible and not board.is_check():
+            value = self.search_child(board, current_depth + 1, max_depth, alpha, beta, first)
+
+            if (board.turn == chess.BLACK and value > alpha) or (board.turn == chess.WHITE and value < beta):
+                value = self.search_child(board, current_depth, max_depth, alpha, beta, first)
+            return value
+
+        return self.search_child(board, current_depth, max_depth, alpha, beta, first)
+    
+    # Late-Move Reductions: Quiet moves, ordered late, with enough depth remaining (and not in check).
+    def reducible(self, board, move, index, current_depth, max_depth):
+        return self.late_move_reductions and index >= LATE_MOVES and max_depth - current_depth >= 3 and \
+            not move.promotion and not board.is_capture(move) and not board.is_check()
+    
+    # Null-Move Pruning
+        # The player to move passes, and the position is searched (shallower) with a null window.
+        # If the position is still too good for the opponent (i.e. beyond the bound), the moves need not be searched.
+    def null_move_search(self, board, current_depth, max_depth, alpha, beta):
+        if not self.null_move or max_depth - current_depth <= NULL_MOVE_REDUCTION or board.is_check():
+            return None
+
+        # No two null moves in a row.
+        if board.move_stack and not board.peek():
+            return None
+
+        # Zugzwang: Passing may be better than any move when the player has only pawns (and the king).
+        if not board.occupied_co[board.turn] & ~(board.pawns | board.kings):
+            return None
+
+        # The white (maximizing) player passes.
+        if board.turn == chess.WHITE:
+            if beta == float('inf'):
+                return None
+
+            self.push(board, chess.Move.null())
+            self.calls += 1
+            value = self.min_value(board, current_depth + 1 + NULL_MOVE_REDUCTION, max_depth, beta - NULL_WINDOW, beta)
+            self.pop(board)
+            return value if value >= beta else None
+
+        # The black (minimizing) player passes.
+        if alpha == float('-inf'):
+            return None
+
+        self.push(board, chess.Move.null())
+        self.calls += 1
+        value = self.max_value(board, current_depth + 1 + NULL_MOVE_REDUCTION, max_depth, alpha, alpha + NULL_WINDOW)
+        self.pop(board)
+        return value if value <= alpha else None
+    
+    # Make a move (updating the evaluator, if any).
+    def push(self, board, move):
+        if self.evaluator:
+            self.evaluator.push(board, move)
+        else:
+            board.push(move)
+    
+    # Unmake a move (updating the evaluator, if any).
+    def pop(self, board):
+        if self.evaluator:
+            self.evaluator.pop(board)
+        else:
+            board.pop()
+    
+    # Quiescence Search
+    def quiesce(self, board, alpha, beta):
+        value = self.quiescence.search(board, alpha, beta)
+        self.calls += self.quiescence.nodes
+        return value
+    
     # Cutoff Test
     def cutoff_test(self, board, current_depth, max_depth):
         # The search stops if we have reached a terminal state (win/draw)
@@ -160,6 +380,9 @@ class AlphaBetaAI():
     
     # Evaluate
     def evaluate(self, board):
+        if self.evaluator:
+            return self.evaluator.evaluate(board)
+
         white_pawn, black_pawn = len(board.pieces(chess.PAWN, chess.WHITE)), len(board.pieces(chess.PAWN, chess.BLACK))
         white_knight, black_knight = len(board.pieces(chess.KNIGHT, chess.WHITE)), len(board.pieces(chess.KNIGHT, chess.BLACK))
         white_bishop, black_bishop = len(board.pieces(chess.BISHOP, chess.WHITE)), len(board.pieces(chess.BISHOP, chess.BLACK))
@@ -171,22 +394,6 @@ class AlphaBetaAI():
             (5 * (white_rook - black_rook)) + (9 * (white_queen - black_queen)) + (200 * (white_king - black_king))
     
     # Ordered Moves
-    def ordered_moves(self, board):
-        # Determine the set of legal moves/captures from the board.
-        moves = list(board.legal_moves)
-        captures = list(board.generate_legal_captures())
-
-        # Create a list of "non-capture" moves that do not capture a piece.
-        non_captures = []
-
-        # Cycle through the moves to construct the list.
-        for move in moves:
-            if move not in captures:
-                non_captures.append(move)
-        
-        # Randomize the lists separately to allow for unique movement.
-        random.shuffle(captures)
-        random.shuffle(non_captures)
-
-        return captures + non_captures
-        
\ No newline at end of file
+        # Captures (MVV-LVA), Killer Moves, Non-Captures (History Heuristic)
+    def ordered_moves(self, board, ply):
+        return self.ordering.order(board, ply)
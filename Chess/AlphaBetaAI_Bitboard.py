@@ -0,0 +1,167 @@
+# AlphaBetaAI_Bitboard.py
+# Contains the methods with respect to the alpha-beta AI (searching the compact bitboard position) for the chess game.
+# Carter Kruse (October 5, 2023)
+
+from Position import Position, PIECE_VALUES, decode_move
+import chess
+import random
+
+class AlphaBetaAI_Bitboard():
+    # Constructor
+    def __init__(self, depth, move_ordering = True):
+        self.depth = depth
+        self.moves = 0
+        self.calls = 0
+
+        # Move Ordering (Captures By MVV-LVA)
+        self.move_ordering = move_ordering
+
+    # Applying the minimax algorithm to the board and displaying the recommended move.
+        # The board is converted to the bitboard position (and the move back to python-chess) at this boundary.
+    def choose_move(self, board):
+        move = self.alpha_beta(board)
+        print("Alpha-Beta AI (Bitboard) Recommended Move: " + str(move) + " (Moves: " + str(self.moves) + ", Calls: " + str(self.calls) + ", Max Depth: " + str(self.depth) + ")")
+        return move
+
+    # Algorithm
+    def alpha_beta(self, board, alpha = float('-inf'), beta = float('inf')):
+        position = Position(board)
+
+        # Set the current depth and value equal to 0.
+        current_depth = 0
+        current_value = 0
+
+        # Determine the set of legal moves from the position (ordered, after shuffling for randomization).
+        moves = self.ordered_moves(position, position.legal_moves())
+
+        # Set the best value equal to the boundary, and the best move equal to a random move.
+        best_value = float('-inf') if board.turn == chess.WHITE else float('inf')
+        best_move = moves[0]
+
+        # Set the maximum depth equal to the instance variable.
+        max_depth = self.depth
+
+        # Update the number of alpha beta moves.
+        self.moves += 1
+
+        # Cycle through the possible legal moves.
+        for move in moves:
+            # Update the state of the position.
+            position.push(move)
+            self.calls += 1
+
+            # If the "new" turn is the white player, i.e. the move is the black player.
+            if board.turn == chess.BLACK:
+                # Begin the recursive algorithm.
+                current_value = self.max_value(position, current_depth, max_depth, alpha, beta)
+
+                # Check to see if the current value beats the best value.
+                if current_value < best_value:
+                    # Update the variables accordingly.
+                    best_value = current_value
+                    best_move = move
+
+            # Otherwise if the "new" turn is the black player, i.e. the move is the white player.
+            else:
+                # Begin the recursive algorithm.
+                current_value = self.min_value(position, current_depth, max_depth, alpha, beta)
+
+                # Check to see if the current value beats the best value.
+                if current_value > best_value:
+                    # Update the variables accordingly.
+                    best_value = current_value
+                    best_move = move
+
+            # Return the position to it's previous state.
+            position.pop()
+
+        return decode_move(best_move)
+
+    # Max Value
+    def max_value(self, position, current_depth, max_depth, alpha, beta):
+        # Check if the cutoff conditions are satisfied (at the maximum depth, only whether there are any legal moves is needed).
+        if current_depth >= max_depth:
+            return self.utility(position, position.has_legal_moves())
+
+        # The legal moves are generated once, for both the cutoff test and the utility.
+        moves = position.legal_moves()
+        if self.cutoff_test(moves, current_depth, max_depth):
+            # Return the "utility" of the position.
+            return self.utility(position, moves)
+
+        value = float('-inf')
+
+        # Cycle through the possible legal moves, and apply the recursive algorithm.
+        for move in self.ordered_moves(position, moves):
+            position.push(move)
+            self.calls += 1
+            value = max(value, self.min_value(position, current_depth + 1, max_depth, alpha, beta))
+            position.pop()
+
+            # Pruning
+            if value >= beta:
+                return value
+
+            # Updating the alpha value.
+            alpha = max(alpha, value)
+
+        return value
+
+    # Min Value
+    def min_value(self, position, current_depth, max_depth, alpha, beta):
+        # Check if the cutoff conditions are satisfied (at the maximum depth, only whether there are any legal moves is needed).
+        if current_depth >= max_depth:
+            return self.utility(position, position.has_legal_moves())
+
+        # The legal moves are generated once, for both the cutoff test and the utility.
+        moves = position.legal_moves()
+        if self.cutoff_test(moves, current_depth, max_depth):
+            # Return the "utility" of the position.
+            return self.utility(position, moves)
+
+        value = float('inf')
+
+        # Cycle through the possible legal moves, and apply the recursive algorithm.
+        for move in self.ordered_moves(position, moves):
+            position.push(move)
+            self.calls += 1
+            value = min(value, self.max_value(position, current_depth + 1, max_depth, alpha, beta))
+            position.pop()
+
+            # Pruning
+            if value <= alpha:
+                return value
+
+            # Updating the beta value.
+            beta = min(beta, value)
+
+        return value
+
+    # Cutoff Test
+    def cutoff_test(self, moves, current_depth, max_depth):
+        # The search stops if we have reached a terminal state (win/draw), i.e. there are no legal moves
+            # OR we have reached the specified maximum depth.
+        return not moves or current_depth >= max_depth
+
+    # Utility (Position State), given the legal moves (or whether there are any).
+    def utility(self, position, moves):
+        if not moves:
+            # Checkmate
+            if position.is_check():
+                return float('-inf') if position.turn == chess.WHITE else float('inf')
+
+            # Stalemate
+            return 0
+
+        # The material is updated incrementally as moves are made/unmade.
+        return float(position.material)
+
+    # Ordered Moves
+        # Shuffle for randomization, then captures first (MVV-LVA: most valuable victim, least valuable attacker).
+    def ordered_moves(self, position, moves):
+        random.shuffle(moves)
+        if not self.move_ordering:
+            return moves
+
+        squares = position.squares
+        return sorted(moves, key = lambda move: -(10 * PIECE_VALUES[squares[(move >> 6) & 63] & 7] - PIECE_VALUES[squares[move & 63] & 7]) if squares[(move >> 6) & 63] else 0)
@@ -0,0 +1,130 @@
+# AlphaBetaAI_LazySMP.py
+# Contains the methods with respect to the parallel (Lazy SMP) alpha-beta AI for the chess game.
+# Carter Kruse (October 5, 2023)
+
+from IterativeDeepeningAI_Timed import IterativeDeepeningAI_Timed
+from TranspositionTable import TranspositionTable
+from multiprocessing import shared_memory
+import contextlib
+import io
+import multiprocessing
+import os
+import queue
+import random
+import time
+
+# Each worker searches the same position (with iterative deepening), sharing results through the transposition table.
+def lazy_smp_worker(board, worker, time_limit, depth, table_size, shared_name, results):
+    # Each worker uses its own seed, so the workers search the moves in different orders.
+    random.seed(os.getpid() ^ int(time.time() * 1000))
+
+    shared = shared_memory.SharedMemory(name = shared_name)
+
+    player = IterativeDeepeningAI_Timed(time_limit, depth, table_size = 0)
+    player.table = TranspositionTable(table_size, shared.buf)
+
+    # Stagger the depths, so that half of the workers start (and stay) one depth ahead.
+    player.start_depth = 1 + worker % 2
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        move = player.iterative_deepening(board)
+
+    results.put((worker, move.uci(), player.completed_depth, player.calls))
+
+    player.table.release()
+    shared.close()
+
+class AlphaBetaAI_LazySMP():
+    # Constructor
+    def __init__(self, time_limit, workers = None, depth = 100, table_size = 64):
+        self.time_limit = time_limit
+        self.workers = workers or os.cpu_count() or 1
+        self.depth = depth
+        self.table_size = table_size
+        self.moves = 0
+        self.calls = 0
+
+        # The depth reached, and the nodes per second, for the most recent move.
+        self.completed_depth = 0
+        self.nodes_per_second = 0
+
+        # The transposition table is stored in shared memory, so that it is shared by the workers (and across moves).
+        self.shared = shared_memory.SharedMemory(create = True, size = TranspositionTable.size(table_size))
+        table = TranspositionTable(table_size, self.shared.buf)
+        table.clear()
+        table.release()
+
+    # Applying the algorithm to the board and displaying the recommended move.
+    def choose_move(self, board):
+        move = self.lazy_smp(board)
+        print("Alpha-Beta AI (Lazy SMP) Recommended Move: " + str(move) + " (Moves: " + str(self.moves) + ", Calls: " + str(self.calls) + ", Workers: " + str(self.workers) + ", Completed Depth: " + str(self.completed_depth) + ", Nodes/Second: " + str(int(self.nodes_per_second)) + ")")
+        return move
+
+    # Algorithm
+    def lazy_smp(self, board):
+        start_time = time.time()
+        results = multiprocessing.Queue()
+
+        # Update the number of alpha beta moves.
+        self.moves += 1
+
+        # Launch a process for each worker.
+        processes = [multiprocessing.Process(target = lazy_smp_worker, args = (board.copy(), worker, self.time_limit, self.depth, self.table_size, self.shared.name, results)) for worker in range(self.workers)]
+        for process in processes:
+            process.start()
+
+        # The move is taken from the worker that completed the greatest depth (the first worker, in the case of ties).
+            # The results are collected while any worker is alive, so a worker that dies (without a result) does not block the search.
+        best = None
+        calls = 0
+        received = 0
+        while received < len(processes):
+            try:
+                worker, move, completed_depth, worker_calls = results.get(timeout = 0.1)
+            except queue.Empty:
+                if any(process.is_alive() for process in processes):
+                    continue
+                # The workers have exited, so the remaining results (if any) are already in the queue.
+                try:
+                    worker, move, completed_depth, worker_calls = results.get(timeout = 1)
+                except queue.Empty:
+                    break
+
+            received += 1
+            calls += worker_calls
+
+            if best is None or (completed_depth, -worker) > (best[2], -best[0]):
+                best = (worker, move, completed_depth)
+
+        for process in processes:
+            process.join()
+
+        # If no worker returned a move, a random legal move is played.
+        if best is None:
+            print("Alpha-Beta AI (Lazy SMP): No Worker Returned A Move")
+            best = (None, random.choice(list(board.legal_moves)).uci(), 0)
+
+        self.calls += calls
+        self.completed_depth = best[2]
+        self.nodes_per_second = calls / (time.time() - start_time)
+
+        return board.parse_uci(best[1])
+
+    # Release the shared memory (once the game is over).
+        # The shared memory is also released when the AI is deleted, or at the end of a 'with' block.
+    def close(self):
+        if getattr(self, 'shared', None) is None:
+            return
+
+        self.shared.close()
+        self.shared.unlink()
+        self.shared = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        self.close()
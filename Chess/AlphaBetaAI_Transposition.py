@@ -2,27 +2,49 @@
 # Contains the methods with respect to the alpha-beta AI for the chess game.
 # Carter Kruse (October 5, 2023)
 
+from TranspositionTable import TranspositionTable, entry_value, EXACT, LOWER, UPPER
+from PersistentCache import PersistentCache
+from MoveOrdering import MoveOrdering
+from Quiescence import Quiescence
 import chess
-import random
+import chess.polyglot
 
 class AlphaBetaAI_Transposition():
     # Constructor
-    def __init__(self, depth):
+    def __init__(self, depth, table_size = 16, move_ordering = True, quiescence = False, quiescence_nodes = 1000, cache = None):
         self.depth = depth
         self.moves = 0
         self.calls = 0
-        self.table = {}
+
+        # Move Ordering (MVV-LVA, Killer Moves, History Heuristic)
+        self.ordering = MoveOrdering(move_ordering)
+
+        # Quiescence Search (Captures Only) At The Leaves, With A Limit On The Nodes For Each Leaf
+        self.quiescence = Quiescence(self.utility, quiescence_nodes) if quiescence else None
+
+        # Transposition Table (Fixed Size, In MB), With A Persistent Cache (File Name) As The Second Level If Given
+            # The scores depend on the evaluation (and quiescence search), which is the tag of the cache.
+        self.cache_tag = 'material' + (', quiescence ' + str(quiescence_nodes) if quiescence else '')
+        if isinstance(cache, str):
+            cache = PersistentCache(cache, tag = self.cache_tag)
+        elif cache is not None and cache.tag != self.cache_tag:
+            raise ValueError("Cache Tag: " + repr(cache.tag) + " (Expected: " + repr(self.cache_tag) + ")")
+        self.table = TranspositionTable(table_size, cache = cache)
+    
+    # The key of the board in the transposition table.
+    def key(self, board):
+        return chess.polyglot.zobrist_hash(board)
     
     def lookup(self, board):
-        return self.table[hash(str(board))]
+        return self.table.probe(self.key(board))
     
-    def store(self, board, value):
-        self.table[hash(str(board))] = value
+    def store(self, board, depth, value, bound, move):
+        self.table.store(self.key(board), depth, value, bound, move)
     
     # Applying the minimax algorithm to the board and displaying the recommended move.
     def choose_move(self, board):
         move = self.alpha_beta(board)
-        print("Alpha-Beta AI Recommended Move: " + str(move) + " (Moves: " + str(self.moves) + ", Calls: " + str(self.calls) + ", Max Depth: " + str(self.depth) + ")")
+        print("Alpha-Beta AI Recommended Move: " + str(move) + " (Moves: " + str(self.moves) + ", Calls: " + str(self.calls) + ", " + str(self.table) + ", Max Depth: " + str(self.depth) + ")")
         return move
     
     # Algorithm
@@ -35,7 +57,8 @@ class AlphaBetaAI_Transposition():
         # moves = list(board.legal_moves)
         # random.shuffle(moves)
 
-        moves = self.ordered_moves(board)
+        self.ordering.new_search()
+        moves = self.ordered_moves(board, 0)
 
         # Set the best value equal to the boundary, and the best move equal to a random move.
         best_value = float('-inf') if board.turn == chess.WHITE else float('inf')
@@ -84,72 +107,104 @@ class AlphaBetaAI_Transposition():
     def max_value(self, board, current_depth, max_depth, alpha, beta):
         # Check if the cutoff conditions are satisfied.
         if self.cutoff_test(board, current_depth, max_depth):
+            # Search the captures until the position is quiet, if enabled.
+            if self.quiescence:
+                return self.quiesce(board, alpha, beta)
+
             # Return the "utility" of the board position.
             return self.utility(board)
         
-        # Return the value if we already know the result of the state.
-        if hash(str(board)) in self.table:
-            return self.lookup(board)
+        # Return the value if we already know the result of the state (searched at least as deep, within the bounds).
+        entry = self.lookup(board)
+        if entry:
+            value = entry_value(entry, max_depth - current_depth, alpha, beta)
+            if value is not None:
+                return value
         
-        # Determine the set of legal moves from the board, and shuffle for randomization.
+        # Determine the set of legal moves from the board (searching the best move from the table first).
         value = float('-inf')
-        # moves = list(board.legal_moves)
-        # random.shuffle(moves)
+        best_move = None
+        original_alpha = alpha
 
-        moves = self.ordered_moves(board)
+        moves = self.ordered_moves(board, current_depth + 1, entry[3] if entry else None)
 
         # Cycle through the possible legal moves, and apply the recursive algorithm.
         for move in moves:
             board.push(move)
             self.calls += 1
-            value = max(value, self.min_value(board, current_depth + 1, max_depth, alpha, beta))
+            current_value = self.min_value(board, current_depth + 1, max_depth, alpha, beta)
             board.pop()
 
-            # Pruning
+            if current_value > value or best_move is None:
+                value = current_value
+                best_move = move
+
+            # Pruning (the value is a lower bound)
             if value >= beta:
-                self.store(board, value)
+                self.ordering.cutoff(board, move, current_depth + 1, max_depth - current_depth)
+                self.store(board, max_depth - current_depth, value, LOWER, best_move)
                 return value
             
             # Updating the alpha value.
             alpha = max(alpha, value)
         
-        self.store(board, value)
+        # The value is an upper bound if no move improved on alpha.
+        self.store(board, max_depth - current_depth, value, UPPER if value <= original_alpha else EXACT, best_move)
         return value
     
     # Min Value
     def min_value(self, board, current_depth, max_depth, alpha, beta):
         # Check if the cutoff conditions are satisfied.
         if self.cutoff_test(board, current_depth, max_depth):
+            # Search the captures until the position is quiet, if enabled.
+            if self.quiescence:
+                return self.quiesce(board, alpha, beta)
+
             # Return the "utility" of the board position.
             return self.utility(board)
         
-        # Return the value if we already know the result of the state.
-        if hash(str(board)) in self.table:
-            return self.lookup(board)
+        # Return the value if we already know the result of the state (searched at least as deep, within the bounds).
+        entry = self.lookup(board)
+        if entry:
+            value = entry_value(entry, max_depth - current_depth, alpha, beta)
+            if value is not None:
+                return value
         
-        # Determine the set of legal moves from the board, and shuffle for randomization.
+        # Determine the set of legal moves from the board (searching the best move from the table first).
         value = float('inf')
-        # moves = list(board.legal_moves)
-        # random.shuffle(moves)
+        best_move = None
+        original_beta = beta
 
-        moves = self.ordered_moves(board)
+        moves = self.ordered_moves(board, current_depth + 1, entry[3] if entry else None)
 
         # Cycle through the possible legal moves, and apply the recursive algorithm.
         for move in moves:
             board.push(move)
             self.calls += 1
-            value = min(value, self.max_value(board, current_depth + 1, max_depth, alpha, beta))
+            current_value = self.max_value(board, current_depth + 1, max_depth, alpha, beta)
             board.pop()
+
+            if current_value < value or best_move is None:
+                value = current_value
+                best_move = move
         
-            # Pruning
+            # Pruning (the value is an upper bound)
             if value <= alpha:
-                self.store(board, value)
+                self.ordering.cutoff(board, move, current_depth + 1, max_depth - current_depth)
+                self.store(board, max_depth - current_depth, value, UPPER, best_move)
                 return value
         
             # Updating the beta value.
             beta = min(beta, value)
         
-        self.store(board, value)
+        # The value is a lower bound if no move improved on beta.
+        self.store(board, max_depth - current_depth, value, LOWER if value >= original_beta else EXACT, best_move)
+        return value
+    
+    # Quiescence Search
+    def quiesce(self, board, alpha, beta):
+        value = self.quiescence.search(board, alpha, beta)
+        self.calls += self.quiescence.nodes
         return value
     
     # Cutoff Test
@@ -190,22 +245,6 @@ class AlphaBetaAI_Transposition():
             (5 * (white_rook - black_rook)) + (9 * (white_queen - black_queen)) + (200 * (white_king - black_king))
     
     # Ordered Moves
-    def ordered_moves(self, board):
-        # Determine the set of legal moves/captures from the board.
-        moves = list(board.legal_moves)
-        captures = list(board.generate_legal_captures())
-
-        # Create a list of "non-capture" moves that do not capture a piece.
-        non_captures = []
-
-        # Cycle through the moves to construct the list.
-        for move in moves:
-            if move not in captures:
-                non_captures.append(move)
-        
-        # Randomize the lists separately to allow for unique movement.
-        random.shuffle(captures)
-        random.shuffle(non_captures)
-
-        return captures + non_captures
-        
\ No newline at end of file
+        # Table Move, Captures (MVV-LVA), Killer Moves, Non-Captures (History Heuristic)
+    def ordered_moves(self, board, ply, table_move = None):
+        return self.ordering.order(board, ply, table_move)
@@ -2,62 +2,53 @@
 # Contains the methods with respect to the alpha-beta AI for the chess game.
 # Carter Kruse (October 5, 2023)
 
+from TranspositionTable import TranspositionTable, entry_value, EXACT, LOWER, UPPER
+from PersistentCache import PersistentCache
+from Zobrist import Zobrist
+from MoveOrdering import MoveOrdering
+from Quiescence import Quiescence
 import chess
-import random
 
 class AlphaBetaAI_Zobrist():
     # Constructor
-    def __init__(self, depth):
+    def __init__(self, depth, table_size = 16, move_ordering = True, quiescence = False, quiescence_nodes = 1000, cache = None):
         self.depth = depth
         self.moves = 0
         self.calls = 0
-        self.table = {}
 
-        # Zobrist Hashing
-        self.zobrist_table = {}
-        
-        # Enumerating the pieces in the chess match.
-        pieces = [chess.PAWN, chess.KNIGHT, chess.BISHOP, chess.ROOK, chess.QUEEN, chess.KING]
+        # Move Ordering (MVV-LVA, Killer Moves, History Heuristic)
+        self.ordering = MoveOrdering(move_ordering)
+
+        # Quiescence Search (Captures Only) At The Leaves, With A Limit On The Nodes For Each Leaf
+        self.quiescence = Quiescence(self.utility, quiescence_nodes) if quiescence else None
 
-        # Enumerating the colors in the chess match.
-        colors = [chess.WHITE, chess.BLACK]
+        # Transposition Table (Fixed Size, In MB), With A Persistent Cache (File Name) As The Second Level If Given
+            # The scores depend on the evaluation (and quiescence search), which is the tag of the cache.
+        self.cache_tag = 'material' + (', quiescence ' + str(quiescence_nodes) if quiescence else '')
+        if isinstance(cache, str):
+            cache = PersistentCache(cache, tag = self.cache_tag)
+        elif cache is not None and cache.tag != self.cache_tag:
+            raise ValueError("Cache Tag: " + repr(cache.tag) + " (Expected: " + repr(self.cache_tag) + ")")
+        self.table = TranspositionTable(table_size, cache = cache)
 
-        # Cycle through each of the colors, pieces, and squares on the chess board.
-        for color in colors:
-            for piece in pieces:
-                for square in range(64):
-                    self.zobrist_table[(color, piece, square)] = random.randint(0, 2**64 - 1)
+        # Zobrist Hashing (Maintained Incrementally As Moves Are Pushed/Popped)
+        self.zobrist = Zobrist()
     
-    # Zobrist Hash (Algorithm)
-        # XOR Hashes (Pieces On Squares)
+    # Zobrist Hash (Full Computation)
     def zobrist_hash(self, board):
-        hash = 0
-
-        # Cycle through the squares on the chess board.
-        for square in range(64):
-            # Determine the piece at a particular square.
-            piece = board.piece_at(square)
-            
-            # Updating the Zobrist hash according to the piece color, type, and location.
-            if piece:
-                hash ^= self.zobrist_table[(piece.color, piece.piece_type, square)]
-            
-            # Updating the Zobrist hash according to which player's turn it is.
-            if board.turn == chess.BLACK:
-                hash ^= 2**64 - 1
-
-        return hash
+        return self.zobrist.zobrist_hash(board)
     
+    # The hash of the current position is maintained by 'self.zobrist', so the board is not rescanned.
     def lookup(self, board):
-        return self.table[self.zobrist_hash(board)]
+        return self.table.probe(self.zobrist.hash)
     
-    def store(self, board, value):
-        self.table[self.zobrist_hash(board)] = value
+    def store(self, board, depth, value, bound, move):
+        self.table.store(self.zobrist.hash, depth, value, bound, move)
 
     # Applying the minimax algorithm to the board and displaying the recommended move.
     def choose_move(self, board):
         move = self.alpha_beta(board)
-        print("Alpha-Beta AI Recommended Move: " + str(move) + " (Moves: " + str(self.moves) + ", Calls: " + str(self.calls) + ", Max Depth: " + str(self.depth) + ")")
+        print("Alpha-Beta AI Recommended Move: " + str(move) + " (Moves: " + str(self.moves) + ", Calls: " + str(self.calls) + ", " + str(self.table) + ", Max Depth: " + str(self.depth) + ")")
         return move
     
     # Algorithm
@@ -70,7 +61,8 @@ class AlphaBetaAI_Zobrist():
         # moves = list(board.legal_moves)
         # random.shuffle(moves)
 
-        moves = self.ordered_moves(board)
+        self.ordering.new_search()
+        moves = self.ordered_moves(board, 0)
 
         # Set the best value equal to the boundary, and the best move equal to a random move.
         best_value = float('-inf') if board.turn == chess.WHITE else float('inf')
@@ -82,10 +74,13 @@ class AlphaBetaAI_Zobrist():
         # Update the number of alpha beta moves.
         self.moves += 1
 
+        # Compute the hash of the root position (updated incrementally from here).
+        self.zobrist.set(board)
+
         # Cycle through the possible legal moves.
         for move in moves:
             # Update the state of the board.
-            board.push(move)
+            self.zobrist.push(board, move)
             self.calls += 1
             
             # If the "new" turn is the white player, i.e. the move is the black player.
@@ -111,7 +106,7 @@ class AlphaBetaAI_Zobrist():
                     best_move = move
             
             # Return the board to it's previous state.
-            board.pop()
+            self.zobrist.pop(board)
         
         return best_move
     
@@ -119,72 +114,104 @@ class AlphaBetaAI_Zobrist():
     def max_value(self, board, current_depth, max_depth, alpha, beta):
         # Check if the cutoff conditions are satisfied.
         if self.cutoff_test(board, current_depth, max_depth):
+            # Search the captures until the position is quiet, if enabled.
+            if self.quiescence:
+                return self.quiesce(board, alpha, beta)
+
             # Return the "utility" of the board position.
             return self.utility(board)
         
-        # Return the value if we already know the result of the state.
-        if hash(str(board)) in self.table:
-            return self.lookup(board)
+        # Return the value if we already know the result of the state (searched at least as deep, within the bounds).
+        entry = self.lookup(board)
+        if entry:
+            value = entry_value(entry, max_depth - current_depth, alpha, beta)
+            if value is not None:
+                return value
         
-        # Determine the set of legal moves from the board, and shuffle for randomization.
+        # Determine the set of legal moves from the board (searching the best move from the table first).
         value = float('-inf')
-        # moves = list(board.legal_moves)
-        # random.shuffle(moves)
+        best_move = None
+        original_alpha = alpha
 
-        moves = self.ordered_moves(board)
+        moves = self.ordered_moves(board, current_depth + 1, entry[3] if entry else None)
 
         # Cycle through the possible legal moves, and apply the recursive algorithm.
         for move in moves:
-            board.push(move)
+            self.zobrist.push(board, move)
             self.calls += 1
-            value = max(value, self.min_value(board, current_depth + 1, max_depth, alpha, beta))
-            board.pop()
+            current_value = self.min_value(board, current_depth + 1, max_depth, alpha, beta)
+            self.zobrist.pop(board)
+
+            if current_value > value or best_move is None:
+                value = current_value
+                best_move = move
 
-            # Pruning
+            # Pruning (the value is a lower bound)
             if value >= beta:
-                self.store(board, value)
+                self.ordering.cutoff(board, move, current_depth + 1, max_depth - current_depth)
+                self.store(board, max_depth - current_depth, value, LOWER, best_move)
                 return value
             
             # Updating the alpha value.
             alpha = max(alpha, value)
         
-        self.store(board, value)
+        # The value is an upper bound if no move improved on alpha.
+        self.store(board, max_depth - current_depth, value, UPPER if value <= original_alpha else EXACT, best_move)
         return value
     
     # Min Value
     def min_value(self, board, current_depth, max_depth, alpha, beta):
         # Check if the cutoff conditions are satisfied.
         if self.cutoff_test(board, current_depth, max_depth):
+            # Search the captures until the position is quiet, if enabled.
+            if self.quiescence:
+                return self.quiesce(board, alpha, beta)
+
             # Return the "utility" of the board position.
             return self.utility(board)
         
-        # Return the value if we already know the result of the state.
-        if hash(str(board)) in self.table:
-            return self.lookup(board)
+        # Return the value if we already know the result of the state (searched at least as deep, within the bounds).
+        entry = self.lookup(board)
+        if entry:
+            value = entry_value(entry, max_depth - current_depth, alpha, beta)
+            if value is not None:
+                return value
         
-        # Determine the set of legal moves from the board, and shuffle for randomization.
+        # Determine the set of legal moves from the board (searching the best move from the table first).
         value = float('inf')
-        # moves = list(board.legal_moves)
-        # random.shuffle(moves)
+        best_move = None
+        original_beta = beta
 
-        moves = self.ordered_moves(board)
+        moves = self.ordered_moves(board, current_depth + 1, entry[3] if entry else None)
 
         # Cycle through the possible legal moves, and apply the recursive algorithm.
         for move in moves:
-            board.push(move)
+            self.zobrist.push(board, move)
             self.calls += 1
-            value = min(value, self.max_value(board, current_depth + 1, max_depth, alpha, beta))
-            board.pop()
+            current_value = self.max_value(board, current_depth + 1, max_depth, alpha, beta)
+            self.zobrist.pop(board)
+
+            if current_value < value or best_move is None:
+                value = current_value
+                best_move = move
         
-            # Pruning
+            # Pruning (the value is an upper bound)
             if value <= alpha:
-                self.store(board, value)
+                self.ordering.cutoff(board, move, current_depth + 1, max_depth - current_depth)
+                self.store(board, max_depth - current_depth, value, UPPER, best_move)
                 return value
         
             # Updating the beta value.
             beta = min(beta, value)
         
-        self.store(board, value)
+        # The value is a lower bound if no move improved on beta.
+        self.store(board, max_depth - current_depth, value, LOWER if value >= original_beta else EXACT, best_move)
+        return value
+    
+    # Quiescence Search
+    def quiesce(self, board, alpha, beta):
+        value = self.quiescence.search(board, alpha, beta)
+        self.calls += self.quiescence.nodes
         return value
     
     # Cutoff Test
@@ -225,22 +252,6 @@ class AlphaBetaAI_Zobrist():
             (5 * (white_rook - black_rook)) + (9 * (white_queen - black_queen)) + (200 * (white_king - black_king))
     
     # Ordered Moves
-    def ordered_moves(self, board):
-        # Determine the set of legal moves/captures from the board.
-        moves = list(board.legal_moves)
-        captures = list(board.generate_legal_captures())
-
-        # Create a list of "non-capture" moves that do not capture a piece.
-        non_captures = []
-
-        # Cycle through the moves to construct the list.
-        for move in moves:
-            if move not in captures:
-                non_captures.append(move)
-        
-        # Randomize the lists separately to allow for unique movement.
-        random.shuffle(captures)
-        random.shuffle(non_captures)
-
-        return captures + non_captures
-        
\ No newline at end of file
+        # Table Move, Captures (MVV-LVA), Killer Moves, Non-Captures (History Heuristic)
+    def ordered_moves(self, board, ply, table_move = None):
+        return self.ordering.order(board, ply, table_move)
@@ -0,0 +1,59 @@
+# BookPlayer.py
+# Contains the methods with respect to a player that consults the opening book (and tablebases) before searching.
+# Carter Kruse (October 5, 2023)
+
+import time
+
+class BookPlayer():
+    # Constructor
+        # The player searches if neither the opening book nor the tablebases (each optional) have a move.
+    def __init__(self, player, book = None, tablebase = None):
+        self.player = player
+        self.book = book
+        self.tablebase = tablebase
+
+        # The number of moves searched, along with the time taken (to estimate the time saved).
+        self.searches = 0
+        self.search_time = 0
+
+    def choose_move(self, board):
+        # Opening Book
+        if self.book:
+            move = self.book.probe(board)
+            if move:
+                print("Opening Book Move: " + str(move) + " (" + str(self.book) + ")")
+                return move
+
+        # Endgame Tablebases
+        if self.tablebase:
+            move = self.tablebase.probe(board)
+            if move:
+                print("Tablebase Move: " + str(move) + " (" + str(self.tablebase) + ")")
+                return move
+
+        start = time.time()
+        move = self.player.choose_move(board)
+
+        self.searches += 1
+        self.search_time += time.time() - start
+
+        return move
+
+    # The estimated search time saved: The number of moves from the book/tablebases, multiplied by the average search time.
+    def time_saved(self):
+        if self.searches == 0:
+            return 0
+
+        hits = (self.book.hits if self.book else 0) + (self.tablebase.hits if self.tablebase else 0)
+        probe_time = (self.book.probe_time if self.book else 0) + (self.tablebase.probe_time if self.tablebase else 0)
+
+        return hits * self.search_time / self.searches - probe_time
+
+    def __str__(self):
+        statistics = []
+        if self.book:
+            statistics.append(str(self.book))
+        if self.tablebase:
+            statistics.append(str(self.tablebase))
+
+        return ", ".join(statistics + ["Searches: " + str(self.searches), "Estimated Time Saved: " + "{:.3g}".format(self.time_saved()) + " Seconds"])
@@ -6,21 +6,48 @@ import chess
 import time
 
 class ChessGame:
-    def __init__(self, player1, player2):
+    def __init__(self, player1, player2, verbose = True, ponder = False):
         self.board = chess.Board()
         self.players = [player1, player2]
 
+        # Pondering: The players that support it search on the opponent's time (in the background).
+        self.ponder = ponder
+
+        # The time taken for the last move (displayed, if verbose).
+        self.verbose = verbose
+        self.move_time = 0
+
     def make_move(self):
         start = time.time()
         player = self.players[1 - int(self.board.turn)]
         move = player.choose_move(self.board)
         end = time.time()
-        print('(Time: {:.3g} Seconds)'.format(end - start))
+
+        self.move_time = end - start
+        if self.verbose:
+            print('(Time: {:.3g} Seconds)'.format(self.move_time))
         
         self.board.push(move) # Make the move.
+
+        if self.ponder and hasattr(player, 'ponder'):
+            player.ponder(self.board)
     
     def is_game_over(self):
-        return self.board.is_game_over()
+        # Stop the background searches once the game is over.
+        if self.board.is_game_over():
+            for player in self.players:
+                if hasattr(player, 'stop_pondering'):
+                    player.stop_pondering()
+            return True
+        return False
+
+    # Release the resources of the players (e.g. the shared memory of the Lazy SMP AI).
+    def close(self):
+        for player in self.players:
+            if hasattr(player, 'stop_pondering'):
+                player.stop_pondering()
+            if hasattr(player, 'close'):
+                player.close()
 
     def __str__(self):
         column_labels = "\n----------------\na b c d e f g h\n"
@@ -0,0 +1,206 @@
+# Evaluator.py
+# Contains an evaluator (material, piece-square tables, mobility) that is updated incrementally as moves are pushed/popped.
+# Carter Kruse (October 5, 2023)
+
+import chess
+import time
+
+# The values of the pieces (in centipawns), as in the evaluation of the AIs.
+PIECE_VALUES = [0, 100, 300, 300, 500, 900, 20000]
+
+# Piece-Square Tables (in centipawns), from the perspective of the white player, with the eighth rank first.
+PIECE_SQUARE_TABLES = [
+    None,
+    # Pawn
+    [  0,   0,   0,   0,   0,   0,   0,   0,
+      50,  50,  50,  50,  50,  50,  50,  50,
+      10,  10,  20,  30,  30,  20,  10,  10,
+       5,   5,  10,  25,  25,  10,   5,   5,
+       0,   0,   0,  20,  20,   0,   0,   0,
+       5,  -5, -10,   0,   0, -10,  -5,   5,
+       5,  10,  10, -20, -20,  10,  10,   5,
+       0,   0,   0,   0,   0,   0,   0,   0],
+    # Knight
+    [-50, -40, -30, -30, -30, -30, -40, -50,
+     -40, -20,   0,   0,   0,   0, -20, -40,
+     -30,   0,  10,  15,  15,  10,   0, -30,
+     -30,   5,  15,  20,  20,  15,   5, -30,
+     -30,   0,  15,  20,  20,  15,   0, -30,
+     -30,   5,  10,  15,  15,  10,   5, -30,
+     -40, -20,   0,   5,   5,   0, -20, -40,
+     -50, -40, -30, -30, -30, -30, -40, -50],
+    # Bishop
+    [-20, -10, -10, -10, -10, -10, -10, -20,
+     -10,   0,   0,   0,   0,   0,   0, -10,
+     -10,   0,   5,  10,  10,   5,   0, -10,
+     -10,   5,   5,  10,  10,   5,   5, -10,
+     -10,   0,  10,  10,  10,  10,   0, -10,
+     -10,  10,  10,  10,  10,  10,  10, -10,
+     -10,   5,   0,   0,   0,   0,   5, -10,
+     -20, -10, -10, -10, -10, -10, -10, -20],
+    # Rook
+    [  0,   0,   0,   0,   0,   0,   0,   0,
+       5,  10,  10,  10,  10,  10,  10,   5,
+      -5,   0,   0,   0,   0,   0,   0,  -5,
+      -5,   0,   0,   0,   0,   0,   0,  -5,
+      -5,   0,   0,   0,   0,   0,   0,  -5,
+      -5,   0,   0,   0,   0,   0,   0,  -5,
+      -5,   0,   0,   0,   0,   0,   0,  -5,
+       0,   0,   0,   5,   5,   0,   0,   0],
+    # Queen
+    [-20, -10, -10,  -5,  -5, -10, -10, -20,
+     -10,   0,   0,   0,   0,   0,   0, -10,
+     -10,   0,   5,   5,   5,   5,   0, -10,
+      -5,   0,   5,   5,   5,   5,   0,  -5,
+       0,   0,   5,   5,   5,   5,   0,  -5,
+     -10,   5,   5,   5,   5,   5,   0, -10,
+     -10,   0,   5,   0,   0,   0,   0, -10,
+     -20, -10, -10,  -5,  -5, -10, -10, -20],
+    # King (Middle Game)
+    [-30, -40, -40, -50, -50, -40, -40, -30,
+     -30, -40, -40, -50, -50, -40, -40, -30,
+     -30, -40, -40, -50, -50, -40, -40, -30,
+     -30, -40, -40, -50, -50, -40, -40, -30,
+     -20, -30, -30, -40, -40, -30, -30, -20,
+     -10, -20, -20, -20, -20, -20, -20, -10,
+      20,  20,   0,   0,   0,   0,  20,  20,
+      20,  30,  10,   0,   0,  10,  30,  20],
+]
+
+# The weights of the mobility (the number of squares attacked, not occupied by the player) for each piece.
+MOBILITY_WEIGHTS = [0, 0.1, 0.3, 0.5, 1, 1.5, 0]
+
+# The score (in centipawns, from the perspective of the white player) for each piece, color, and square.
+    # The tables are given with the eighth rank first, so the squares of the white player are mirrored.
+SCORES = {}
+for piece_type in range(chess.PAWN, chess.KING + 1):
+    for square in range(64):
+        SCORES[(piece_type, chess.WHITE, square)] = PIECE_VALUES[piece_type] + PIECE_SQUARE_TABLES[piece_type][square ^ 56]
+        SCORES[(piece_type, chess.BLACK, square)] = -(PIECE_VALUES[piece_type] + PIECE_SQUARE_TABLES[piece_type][square])
+
+class Evaluator:
+    # Constructor
+    def __init__(self, mobility = False):
+        self.mobility = mobility
+
+        # The material and piece-square score (in centipawns), from the perspective of the white player.
+        self.score = 0
+        self.stack = []
+
+    # Set the score for the board (e.g. at the root of a search).
+    def set(self, board):
+        self.score = sum(SCORES[(piece.piece_type, piece.color, square)] for square, piece in board.piece_map().items())
+        self.stack = []
+
+    # Push: Update the score according to the move, then make the move.
+    def push(self, board, move):
+        score = self.score
+
+        # A null move does not change the pieces.
+        if move:
+            color = board.turn
+            piece_type = board.piece_type_at(move.from_square)
+
+            # Move the piece (or the promoted piece) from the original square to the new square.
+            score -= SCORES[(piece_type, color, move.from_square)]
+            score += SCORES[(move.promotion or piece_type, color, move.to_square)]
+
+            # Remove the captured piece (if any).
+            if board.is_en_passant(move):
+                score -= SCORES[(chess.PAWN, not color, move.to_square + (-8 if color == chess.WHITE else 8))]
+            elif board.is_castling(move):
+                # Move the rook (from the corner to the square beside the king).
+                rank = chess.square_rank(move.from_square)
+                if chess.square_file(move.to_square) == 6:
+                    rook_from, rook_to = chess.square(7, rank), chess.square(5, rank)
+                else:
+                    rook_from, rook_to = chess.square(0, rank), chess.square(3, rank)
+                score += SCORES[(chess.ROOK, color, rook_to)] - SCORES[(chess.ROOK, color, rook_from)]
+            else:
+                captured_type = board.piece_type_at(move.to_square)
+                if captured_type:
+                    score -= SCORES[(captured_type, not color, move.to_square)]
+
+        board.push(move)
+        self.stack.append(self.score)
+        self.score = score
+
+    # Pop: Unmake the move, restoring the previous score.
+    def pop(self, board):
+        board.pop()
+        self.score = self.stack.pop()
+
+    # Evaluate (in pawns, as in the evaluation of the AIs)
+    def evaluate(self, board):
+        if self.mobility:
+            return (self.score + self.evaluate_mobility(board)) / 100
+        return self.score / 100
+
+    # Mobility (in centipawns), from the popcounts of the attack bitboards.
+    def evaluate_mobility(self, board):
+        mobility = 0
+
+        for color, sign in ((chess.WHITE, 100), (chess.BLACK, -100)):
+            # The squares attacked by the pieces (not occupied by the player).
+            available = ~board.occupied_co[color]
+
+            for piece_type in range(chess.PAWN, chess.KING):
+                squares = board.pieces_mask(piece_type, color)
+                weight = sign * MOBILITY_WEIGHTS[piece_type]
+
+                for square in chess.scan_forward(squares):
+                    mobility += weight * chess.popcount(board.attacks_mask(square) & available)
+
+        return mobility
+
+# Micro-Benchmark: The number of leaves evaluated per second (for a fixed depth), before and after.
+    # Usage: python3 Evaluator.py
+if __name__ == '__main__':
+    from AlphaBetaAI import AlphaBetaAI
+    from MinimaxAI_Mobility import MinimaxAI_Mobility
+    from openings import opening_book
+
+    depth = 3
+
+    # Visit every leaf (at a fixed depth), making the moves with the given push/pop and evaluating each leaf.
+    def visit(board, depth, push, pop, evaluate):
+        if depth == 0:
+            evaluate(board)
+            return 1
+
+        leaves = 0
+        for move in list(board.legal_moves):
+            push(board, move)
+            leaves += visit(board, depth - 1, push, pop, evaluate)
+            pop(board)
+        return leaves
+
+    def benchmark(name, push, pop, evaluate, set = None):
+        leaves = 0
+        start = time.time()
+
+        for opening_name in list(opening_book)[:4]:
+            board = chess.Board()
+            for move in opening_book[opening_name]:
+                board.push(chess.Move.from_uci(move))
+
+            if set:
+                set(board)
+            leaves += visit(board, depth, push, pop, evaluate)
+
+        seconds = time.time() - start
+        print('{:<40}{:>10}{:>10.2f}{:>16.0f}'.format(name, leaves, seconds, leaves / seconds))
+
+    board_push = lambda board, move: board.push(move)
+    board_pop = lambda board: board.pop()
+
+    print('{:<40}{:>10}{:>10}{:>16}'.format("Evaluation", "Leaves", "Seconds", "Leaves/Second"))
+    benchmark("No Evaluation (Move Generation)", board_push, board_pop, lambda board: 0)
+    benchmark("AlphaBetaAI.evaluate", board_push, board_pop, AlphaBetaAI(depth).evaluate)
+    benchmark("MinimaxAI_Mobility.evaluate", board_push, board_pop, MinimaxAI_Mobility(depth).evaluate)
+
+    evaluator = Evaluator()
+    benchmark("Evaluator (Incremental)", evaluator.push, evaluator.pop, evaluator.evaluate, evaluator.set)
+
+    evaluator = Evaluator(mobility = True)
+    benchmark("Evaluator (Incremental, Mobility)", evaluator.push, evaluator.pop, evaluator.evaluate, evaluator.set)
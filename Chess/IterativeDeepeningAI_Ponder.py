@@ -0,0 +1,102 @@
+# IterativeDeepeningAI_Ponder.py
+# Contains the methods with respect to the time-managed iterative deepening AI that searches (ponders) on the opponent's time.
+# Carter Kruse (October 5, 2023)
+
+from IterativeDeepeningAI_Timed import IterativeDeepeningAI_Timed, SearchTimeout
+import threading
+import time
+
+class IterativeDeepeningAI_Ponder(IterativeDeepeningAI_Timed):
+    # Constructor
+    def __init__(self, time_limit, depth = 100, table_size = 16):
+        super().__init__(time_limit, depth, table_size)
+
+        # The background search (thread), and the flag to stop it.
+        self.ponder_thread = None
+        self.stop = threading.Event()
+
+        # The position searched in the background (the predicted reply of the opponent), and the result of the search.
+        self.ponder_board = None
+        self.ponder_pv = []
+        self.ponder_depth = 0
+        self.ponder_start = 0
+        self.ponder_time = 0
+
+        # Statistics
+        self.ponder_hits = 0
+        self.ponder_misses = 0
+        self.response_time = 0
+
+    # Applying the algorithm to the board and displaying the recommended move.
+        # On a ponder hit (the opponent made the predicted move), the search continues from the depth reached while pondering,
+        # for the rest of the time per move (less the time spent pondering), with the table and principal variation from the background search.
+    def choose_move(self, board):
+        start = time.time()
+        hit = self.stop_pondering(board)
+
+        if hit:
+            self.ponder_hits += 1
+            self.start_depth = self.ponder_depth + 1
+            move = self.iterative_deepening(board, time_limit = max(self.time_limit - self.ponder_time, 0), pv = self.ponder_pv)
+            self.completed_depth = max(self.completed_depth, self.ponder_depth)
+            self.start_depth = 1
+        else:
+            if self.ponder_board is not None:
+                self.ponder_misses += 1
+            move = self.iterative_deepening(board)
+
+        self.ponder_board = None
+        self.response_time += time.time() - start
+
+        print("Iterative Deepening AI (Ponder) Recommended Move: " + str(move) + " (Moves: " + str(self.moves) + ", Calls: " + str(self.calls) + ", " + str(self.table) + ", Completed Depth: " + str(self.completed_depth) + ", Ponder Hits: " + str(self.ponder_hits) + "/" + str(self.ponder_hits + self.ponder_misses) + ", Average Response Time: " + "{:.3g}".format(self.response_time / self.moves) + " Seconds)")
+        return move
+
+    # Pondering: Once the move is made, search the position after the predicted reply (from the principal variation) in the background.
+        # While pondering, the search attributes (e.g. the completed depth and principal variation) belong to the background search.
+    def ponder(self, board):
+        if len(self.pv) < 2 or not board.is_legal(self.pv[1]) or board.is_game_over():
+            return
+
+        self.ponder_board = board.copy()
+        self.ponder_board.push(self.pv[1])
+
+        # There is nothing to search if the predicted reply ends the game.
+        if self.ponder_board.is_game_over():
+            self.ponder_board = None
+            return
+
+        self.ponder_pv = self.pv[2:]
+        self.ponder_depth = 0
+
+        self.stop.clear()
+        self.ponder_start = time.time()
+        self.ponder_thread = threading.Thread(target = self.ponder_search, args = (self.ponder_board.copy(),), daemon = True)
+        self.ponder_thread.start()
+
+    # The background search (without a time limit, until it is stopped or reaches the maximum depth).
+    def ponder_search(self, board):
+        moves = self.moves
+        self.iterative_deepening(board, time_limit = float('inf'), pv = self.ponder_pv)
+
+        # The pondering is not counted as a move.
+        self.moves = moves
+        self.ponder_pv = self.pv
+        self.ponder_depth = self.completed_depth
+
+    # Stop the background search (if any), returning whether the board is the position that was searched (a ponder hit).
+    def stop_pondering(self, board = None):
+        if self.ponder_thread is None:
+            return False
+
+        self.stop.set()
+        self.ponder_thread.join()
+        self.ponder_thread = None
+        self.ponder_time = time.time() - self.ponder_start
+        self.stop.clear()
+
+        return board is not None and self.ponder_depth > 0 and board == self.ponder_board
+
+    # The search stops once the time runs out, or once the background search is stopped.
+    def check_time(self):
+        if self.calls % 256 == 0 and (time.time() >= self.deadline or self.stop.is_set()):
+            raise SearchTimeout()
@@ -0,0 +1,248 @@
+# IterativeDeepeningAI_Timed.py
+# Contains the methods with respect to the time-managed iterative deepening AI (with alpha-beta) for the chess game.
+# Carter Kruse (October 5, 2023)
+
+from IterativeDeepeningAI import IterativeDeepeningAI
+from TranspositionTable import TranspositionTable, entry_value, EXACT, LOWER, UPPER
+from Zobrist import Zobrist
+import chess
+import random
+import time
+
+# Raised (from within the search) once the time for the move has run out.
+class SearchTimeout(Exception):
+    pass
+
+class IterativeDeepeningAI_Timed(IterativeDeepeningAI):
+    # Constructor
+    def __init__(self, time_limit, depth = 100, table_size = 16):
+        # The time (in seconds) per move, along with the maximum depth.
+        self.time_limit = time_limit
+        self.depth = depth
+        self.moves = 0
+        self.calls = 0
+
+        # The depth of the first iteration, and of the last completed iteration (for the most recent move).
+        self.start_depth = 1
+        self.completed_depth = 0
+
+        # The principal variation (sequence of best moves) from the previous iteration.
+        self.pv = []
+
+        self.table = TranspositionTable(table_size)
+        self.zobrist = Zobrist()
+
+    # Applying the algorithm to the board and displaying the recommended move.
+    def choose_move(self, board):
+        move = self.iterative_deepening(board)
+        print("Iterative Deepening AI (Timed) Recommended Move: " + str(move) + " (Moves: " + str(self.moves) + ", Calls: " + str(self.calls) + ", " + str(self.table) + ", Completed Depth: " + str(self.completed_depth) + ", Time Limit: " + str(self.time_limit) + ")")
+        return move
+
+    # Algorithm
+        # The time limit (by default, the time per move) and the principal variation to start from may be given (e.g. for pondering).
+    def iterative_deepening(self, board, time_limit = None, pv = None):
+        self.deadline = time.time() + (self.time_limit if time_limit is None else time_limit)
+        self.completed_depth = 0
+        self.pv = pv or []
+
+        # Update the number of iterative deepening moves.
+        self.moves += 1
+
+        # Determine the set of legal moves from the board, and shuffle for randomization.
+        moves = self.ordered_moves(board, None, None)
+        best_move = self.pv[0] if self.pv and self.pv[0] in moves else moves[0]
+
+        # The root is restored to this position (and hash) if the search runs out of time.
+        root_length = len(board.move_stack)
+        self.zobrist.set(board)
+
+        # Iterative Deepening - Max Depth
+        for max_depth in range(self.start_depth, self.depth + 1):
+            try:
+                value, scores, pv = self.search_root(board, moves, max_depth)
+            except SearchTimeout:
+                while len(board.move_stack) > root_length:
+                    self.zobrist.pop(board)
+                break
+
+            # The depth is complete, so the best move (and principal variation) are kept.
+            self.completed_depth = max_depth
+            self.pv = pv
+            best_move = pv[0]
+
+            # Order the root moves for the next iteration by their scores (best first).
+            moves.sort(key = lambda move: scores[move], reverse = board.turn == chess.WHITE)
+
+            # There is no need to search further if the game is decided (checkmate).
+            if value in (float('inf'), float('-inf')):
+                break
+
+        return best_move
+
+    # Alpha-Beta Search (Root)
+    def search_root(self, board, moves, max_depth):
+        alpha, beta = float('-inf'), float('inf')
+        best_value = float('-inf') if board.turn == chess.WHITE else float('inf')
+        best_pv = None
+        scores = {}
+
+        # The best move from the previous iteration is searched first.
+        if self.pv and self.pv[0] in moves:
+            moves.remove(self.pv[0])
+            moves.insert(0, self.pv[0])
+
+        for move in moves:
+            self.zobrist.push(board, move)
+            self.calls += 1
+
+            # Only the first move continues along the principal variation.
+            pv = []
+            on_pv = move == moves[0] and bool(self.pv)
+
+            # If the "new" turn is the white player, i.e. the move is the black player.
+            if board.turn == chess.WHITE:
+                current_value = self.max_value(board, 0, max_depth, alpha, beta, 1, on_pv, pv)
+
+                if current_value < best_value or best_pv is None:
+                    best_value, best_pv = current_value, [move] + pv
+                beta = min(beta, best_value)
+
+            # Otherwise if the "new" turn is the black player, i.e. the move is the white player.
+            else:
+                current_value = self.min_value(board, 0, max_depth, alpha, beta, 1, on_pv, pv)
+
+                if current_value > best_value or best_pv is None:
+                    best_value, best_pv = current_value, [move] + pv
+                alpha = max(alpha, best_value)
+
+            self.zobrist.pop(board)
+            scores[move] = current_value
+
+        return best_value, scores, best_pv
+
+    # Max Value
+        # The principal variation of the node is returned through 'pv' (a list of moves).
+    def max_value(self, board, current_depth, max_depth, alpha, beta, ply, on_pv, pv):
+        self.check_time()
+
+        # Check if the cutoff conditions are satisfied.
+        if self.cutoff_test(board, current_depth, max_depth):
+            # Return the "utility" of the board position.
+            return self.utility(board)
+
+        # Return the value if we already know the result of the state (searched at least as deep, within the bounds).
+        entry = self.table.probe(self.zobrist.hash)
+        if entry and not on_pv:
+            value = entry_value(entry, max_depth - current_depth, alpha, beta)
+            if value is not None:
+                return value
+
+        value = float('-inf')
+        best_move = None
+        original_alpha = alpha
+
+        pv_move = self.pv[ply] if on_pv and ply < len(self.pv) else None
+        moves = self.ordered_moves(board, pv_move, entry[3] if entry else None)
+
+        # Cycle through the possible legal moves, and apply the recursive algorithm.
+        for move in moves:
+            child_pv = []
+            self.zobrist.push(board, move)
+            self.calls += 1
+            current_value = self.min_value(board, current_depth + 1, max_depth, alpha, beta, ply + 1, on_pv and move == pv_move, child_pv)
+            self.zobrist.pop(board)
+
+            if current_value > value or best_move is None:
+                value = current_value
+                best_move = move
+                pv[:] = [move] + child_pv
+
+            # Pruning
+            if value >= beta:
+                self.table.store(self.zobrist.hash, max_depth - current_depth, value, LOWER, best_move)
+                return value
+
+            # Updating the alpha value.
+            alpha = max(alpha, value)
+
+        self.table.store(self.zobrist.hash, max_depth - current_depth, value, UPPER if value <= original_alpha else EXACT, best_move)
+        return value
+
+    # Min Value
+    def min_value(self, board, current_depth, max_depth, alpha, beta, ply, on_pv, pv):
+        self.check_time()
+
+        # Check if the cutoff conditions are satisfied.
+        if self.cutoff_test(board, current_depth, max_depth):
+            # Return the "utility" of the board position.
+            return self.utility(board)
+
+        # Return the value if we already know the result of the state (searched at least as deep, within the bounds).
+        entry = self.table.probe(self.zobrist.hash)
+        if entry and not on_pv:
+            value = entry_value(entry, max_depth - current_depth, alpha, beta)
+            if value is not None:
+                return value
+
+        value = float('inf')
+        best_move = None
+        original_beta = beta
+
+        pv_move = self.pv[ply] if on_pv and ply < len(self.pv) else None
+        moves = self.ordered_moves(board, pv_move, entry[3] if entry else None)
+
+        # Cycle through the possible legal moves, and apply the recursive algorithm.
+        for move in moves:
+            child_pv = []
+            self.zobrist.push(board, move)
+            self.calls += 1
+            current_value = self.max_value(board, current_depth + 1, max_depth, alpha, beta, ply + 1, on_pv and move == pv_move, child_pv)
+            self.zobrist.pop(board)
+
+            if current_value < value or best_move is None:
+                value = current_value
+                best_move = move
+                pv[:] = [move] + child_pv
+
+            # Pruning
+            if value <= alpha:
+                self.table.store(self.zobrist.hash, max_depth - current_depth, value, UPPER, best_move)
+                return value
+
+            # Updating the beta value.
+            beta = min(beta, value)
+
+        self.table.store(self.zobrist.hash, max_depth - current_depth, value, LOWER if value >= original_beta else EXACT, best_move)
+        return value
+
+    # Check the time (every 256 calls), stopping the search once the time has run out.
+    def check_time(self):
+        if self.calls % 256 == 0 and time.time() >= self.deadline:
+            raise SearchTimeout()
+
+    # Ordered Moves
+        # Principal Variation Move, Transposition Table Move, Captures, Non-Captures
+    def ordered_moves(self, board, pv_move, table_move):
+        # Determine the set of legal moves/captures from the board.
+        captures = []
+        non_captures = []
+
+        for move in board.legal_moves:
+            if board.is_capture(move):
+                captures.append(move)
+            else:
+                non_captures.append(move)
+
+        # Randomize the lists separately to allow for unique movement.
+        random.shuffle(captures)
+        random.shuffle(non_captures)
+
+        moves = captures + non_captures
+
+        # Search the move from the table, then the move from the principal variation, first.
+        for move in (table_move, pv_move):
+            if move is not None and move in moves:
+                moves.remove(move)
+                moves.insert(0, move)
+
+        return moves
@@ -0,0 +1,75 @@
+# MoveOrdering.py
+# Contains the methods with respect to move ordering (MVV-LVA, killer moves, history heuristic) for the alpha-beta AI.
+# Carter Kruse (October 5, 2023)
+
+import chess
+import random
+
+# The values of the pieces (as in the evaluation), used for MVV-LVA (Most Valuable Victim - Least Valuable Attacker).
+PIECE_VALUES = [0, 1, 3, 3, 5, 9, 200]
+
+# The scores of the ordering categories, so that each category is searched before the next.
+TABLE_SCORE = 1 << 30
+CAPTURE_SCORE = 1 << 28
+KILLER_SCORE = 1 << 27
+
+class MoveOrdering:
+    # Constructor
+    def __init__(self, enabled = True, killer_slots = 2):
+        # If disabled, the moves are ordered as captures then non-captures (each shuffled).
+        self.enabled = enabled
+        self.killer_slots = killer_slots
+
+        # Killer Moves: The non-captures which caused a cutoff, for each ply.
+        self.killers = {}
+
+        # History Table: The (depth-weighted) count of cutoffs for each color, from square, and to square.
+        self.history = [0] * (2 * 64 * 64)
+
+    # Order the moves: Table Move, Captures (MVV-LVA), Killer Moves, Non-Captures (History)
+    def order(self, board, ply, table_move = None):
+        moves = list(board.legal_moves)
+
+        # Randomize the moves to allow for unique movement (the sort is stable, so ties remain random).
+        random.shuffle(moves)
+
+        if self.enabled:
+            killers = self.killers.get(ply, ())
+            color = int(board.turn) * 4096
+
+            def score(move):
+                if move == table_move:
+                    return TABLE_SCORE
+                if board.is_capture(move):
+                    # The victim of an en passant capture is a pawn (not on the destination square).
+                    victim = board.piece_type_at(move.to_square) or chess.PAWN
+                    return CAPTURE_SCORE + 10 * PIECE_VALUES[victim] - PIECE_VALUES[board.piece_type_at(move.from_square)]
+                if move in killers:
+                    return KILLER_SCORE - killers.index(move)
+                return self.history[color + move.from_square * 64 + move.to_square]
+
+            moves.sort(key = score, reverse = True)
+        else:
+            moves.sort(key = lambda move: move == table_move or board.is_capture(move), reverse = True)
+
+        return moves
+
+    # Record a cutoff from a move (with the remaining depth), at the position before the move is made.
+    def cutoff(self, board, move, ply, depth):
+        # Captures are already ordered (by MVV-LVA).
+        if not self.enabled or board.is_capture(move):
+            return
+
+        # Update the killer moves for the ply (most recent first).
+        killers = self.killers.setdefault(ply, [])
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[self.killer_slots:]
+
+        # Deeper cutoffs are weighted more heavily.
+        self.history[int(board.turn) * 4096 + move.from_square * 64 + move.to_square] += depth * depth
+
+    # Start a new search: The killer moves are cleared, and the history is aged (halved).
+    def new_search(self):
+        self.killers = {}
+        self.history = [value // 2 for value in self.history]
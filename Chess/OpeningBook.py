@@ -0,0 +1,105 @@
+# OpeningBook.py
+# Contains the methods with respect to the opening book (a hashed index from positions to weighted moves) for the chess game.
+# Carter Kruse (October 5, 2023)
+
+import chess
+import chess.polyglot
+import random
+import sys
+import time
+
+class OpeningBook:
+    # Constructor
+    def __init__(self, file_name = None):
+        # The moves (with weights) for each position, indexed by the (Polyglot) Zobrist hash.
+        self.entries = {}
+
+        # Statistics
+        self.probes = 0
+        self.hits = 0
+        self.probe_time = 0
+
+        if file_name:
+            self.load(file_name)
+
+    # Add a move (with a weight) for a position.
+    def add(self, board, move, weight = 1):
+        moves = self.entries.setdefault(chess.polyglot.zobrist_hash(board), {})
+        moves[move] = moves.get(move, 0) + weight
+
+    # Load either a Polyglot book (.bin), or a book in the local format (one entry per line: key, move, weight).
+    def load(self, file_name):
+        if file_name.endswith('.bin'):
+            with chess.polyglot.open_reader(file_name) as reader:
+                for entry in reader:
+                    moves = self.entries.setdefault(entry.key, {})
+                    moves[entry.move] = moves.get(entry.move, 0) + entry.weight
+        else:
+            with open(file_name, 'r') as file:
+                for line in file:
+                    if line.strip() and not line.startswith('#'):
+                        key, move, weight = line.split()
+                        moves = self.entries.setdefault(int(key, 16), {})
+                        moves[chess.Move.from_uci(move)] = int(weight)
+
+    # Save the book in the local format.
+    def save(self, file_name):
+        with open(file_name, 'w') as file:
+            for key in sorted(self.entries):
+                for move, weight in self.entries[key].items():
+                    file.write('{:016x} {} {}\n'.format(key, move.uci(), weight))
+
+    # Create a book from sequences of moves (e.g. the opening book in 'openings.py'), weighted by the number of occurrences.
+    @staticmethod
+    def from_openings(openings):
+        book = OpeningBook()
+
+        for line in openings.values():
+            board = chess.Board()
+            for uci in line:
+                move = chess.Move.from_uci(uci)
+                book.add(board, move)
+                board.push(move)
+
+        return book
+
+    # Probe: Returns a move for the board (chosen at random, in proportion to the weights), or None.
+    def probe(self, board):
+        self.probes += 1
+        start = time.time()
+
+        moves = []
+        weights = []
+        for move, weight in self.entries.get(chess.polyglot.zobrist_hash(board), {}).items():
+            # Polyglot books give castling as the king capturing the rook (e.g. e1h1 rather than e1g1).
+            if board.piece_type_at(move.from_square) == chess.KING and board.color_at(move.to_square) == board.turn:
+                file = 6 if chess.square_file(move.to_square) > chess.square_file(move.from_square) else 2
+                move = chess.Move(move.from_square, chess.square(file, chess.square_rank(move.from_square)))
+
+            if weight > 0 and board.is_legal(move):
+                moves.append(move)
+                weights.append(weight)
+
+        move = random.choices(moves, weights)[0] if moves else None
+
+        self.probe_time += time.time() - start
+        if move:
+            self.hits += 1
+        return move
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __str__(self):
+        return "Book Hits: " + str(self.hits) + "/" + str(self.probes) + " (Probe Time: " + "{:.3g}".format(self.probe_time) + " Seconds)"
+
+if __name__ == '__main__':
+    # Convert the opening book in 'openings.py' to the local format.
+        # Usage: python3 OpeningBook.py [file_name]
+    from openings import opening_book
+
+    file_name = sys.argv[1] if len(sys.argv) > 1 else 'openings.book'
+    book = OpeningBook.from_openings(opening_book)
+    book.save(file_name)
+
+    print("Positions: " + str(len(book)) + ", File: " + file_name)
@@ -0,0 +1,172 @@
+# PersistentCache.py
+# Contains an on-disk (memory-mapped) cache of searched positions, kept across games/runs, as a second level for the transposition table.
+# Carter Kruse (October 5, 2023)
+
+from TranspositionTable import encode_move, decode_move
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+
+# The header: magic (8), number of buckets (8), generation (8), tag (8), padded to 64 bytes (so the arrays are aligned).
+    # The magic includes the version of the format, and the tag is a hash of the configuration (e.g. the evaluation) of the scores.
+MAGIC = b'CHESSPC2'
+HEADER = '<8sQQ8s'
+HEADER_SIZE = 64
+
+# The size (in bytes) of an entry: key (8), score (8), move (2), depth (1), bound (1), age (2).
+ENTRY_SIZE = 22
+
+# The number of slots in each bucket (the stalest, then shallowest, entry in the bucket is evicted).
+BUCKET_SLOTS = 4
+
+class PersistentCache:
+    # Constructor
+        # The file is created (or reset, if it is not a cache of the same size and tag) with the given size (in MB).
+        # The tag describes how the scores were computed (e.g. the evaluation, and whether quiescence search is used), so a cache is not shared between AIs with different scores.
+        # Only entries searched to at least 'min_depth' are stored (shallower entries are cheap to search again).
+    def __init__(self, file_name, size_mb = 64, min_depth = 1, tag = ''):
+        self.file_name = file_name
+        self.min_depth = min_depth
+        self.tag = tag
+        self.buckets = max(1, int(size_mb * 1024 * 1024) // (BUCKET_SLOTS * ENTRY_SIZE))
+        slots = BUCKET_SLOTS * self.buckets
+        size = HEADER_SIZE + slots * ENTRY_SIZE
+        tag_hash = hashlib.blake2b(tag.encode(), digest_size = 8).digest()
+
+        # Open the file (with an exclusive lock, as the file may be shared between processes).
+            # A missing file, or a file with a different header or size, is replaced with a new (empty) file,
+            # so a file that is mapped by another process is never truncated or cleared.
+        while True:
+            try:
+                self.file = open(file_name, 'r+b')
+            except FileNotFoundError:
+                self.create(size, tag_hash)
+                continue
+
+            fcntl.flock(self.file, fcntl.LOCK_EX)
+
+            # The file may have been replaced (by another process) while waiting for the lock.
+            try:
+                replaced = os.stat(file_name).st_ino != os.fstat(self.file.fileno()).st_ino
+            except FileNotFoundError:
+                replaced = True
+
+            if not replaced:
+                header = self.file.read(struct.calcsize(HEADER))
+                if len(header) == struct.calcsize(HEADER) and os.fstat(self.file.fileno()).st_size == size:
+                    magic, buckets, generation, file_tag = struct.unpack(HEADER, header)
+                    if magic == MAGIC and buckets == self.buckets and file_tag == tag_hash:
+                        break
+
+                self.create(size, tag_hash)
+
+            self.file.close()
+
+        self.map = mmap.mmap(self.file.fileno(), size)
+
+        # The generation is incremented each time the cache is opened (the age of an entry is the generation it was last used in).
+        self.generation = (generation + 1) & 0xFFFF
+        struct.pack_into(HEADER, self.map, 0, MAGIC, self.buckets, self.generation, tag_hash)
+        fcntl.flock(self.file, fcntl.LOCK_UN)
+
+        # The entries are stored in parallel arrays over the memory map (as in the transposition table).
+        self.view = view = memoryview(self.map)[HEADER_SIZE:]
+        self.keys = view[:8 * slots].cast('Q')
+        self.scores = view[8 * slots:16 * slots].cast('d')
+        self.score_bits = view[8 * slots:16 * slots].cast('Q') # The scores, as integers (for the check below).
+        self.moves = view[16 * slots:18 * slots].cast('H')
+        self.depths = view[18 * slots:19 * slots].cast('B') # A depth of 0 is an empty slot (the depths are stored plus one).
+        self.bounds = view[19 * slots:20 * slots].cast('B')
+        self.ages = view[20 * slots:22 * slots].cast('H')
+
+        # Statistics
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.evictions = 0
+
+    # Create an empty cache (as a temporary file, which atomically replaces the file).
+    def create(self, size, tag_hash):
+        directory = os.path.dirname(os.path.abspath(self.file_name))
+        descriptor, temporary_name = tempfile.mkstemp(dir = directory, prefix = os.path.basename(self.file_name) + '.')
+
+        with os.fdopen(descriptor, 'wb') as file:
+            file.write(struct.pack(HEADER, MAGIC, self.buckets, 0, tag_hash))
+            file.truncate(size)
+
+        os.replace(temporary_name, self.file_name)
+
+    # The key is stored XOR the data of the entry, so that an entry partially written by another process is not matched.
+    def check(self, slot):
+        return self.score_bits[slot] ^ (self.moves[slot] | (self.depths[slot] << 16) | (self.bounds[slot] << 24))
+
+    # Probe: Returns the entry (depth, score, bound, move) for the key, or None (refreshing the age of the entry).
+    def probe(self, key):
+        self.probes += 1
+        start = (key % self.buckets) * BUCKET_SLOTS
+
+        for slot in range(start, start + BUCKET_SLOTS):
+            if self.depths[slot] and self.keys[slot] ^ self.check(slot) == key:
+                self.hits += 1
+                self.ages[slot] = self.generation
+                return self.depths[slot] - 1, self.scores[slot], self.bounds[slot], decode_move(self.moves[slot])
+
+        return None
+
+    # Store: Replaces the entry for the key (if searched at least as deep), otherwise an empty slot, otherwise the stalest (then shallowest) entry.
+    def store(self, key, depth, score, bound, move = None):
+        if depth < self.min_depth:
+            return
+
+        start = (key % self.buckets) * BUCKET_SLOTS
+        slots = range(start, start + BUCKET_SLOTS)
+
+        for slot in slots:
+            if self.depths[slot] and self.keys[slot] ^ self.check(slot) == key:
+                # A deeper entry for the key is kept.
+                if depth < self.depths[slot] - 1:
+                    self.ages[slot] = self.generation
+                    return
+                replace = slot
+                break
+        else:
+            empty = [slot for slot in slots if not self.depths[slot]]
+            replace = empty[0] if empty else min(slots, key = self.priority)
+
+        if self.depths[replace] and self.keys[replace] ^ self.check(replace) != key:
+            self.evictions += 1
+        self.stores += 1
+
+        self.depths[replace] = min(depth, 254) + 1
+        self.scores[replace] = score
+        self.bounds[replace] = bound
+        self.moves[replace] = encode_move(move)
+        self.ages[replace] = self.generation
+        self.keys[replace] = key ^ self.check(replace)
+
+    # The priority of an entry (the lowest is evicted first): entries not used for more generations, then shallower entries.
+    def priority(self, slot):
+        return -((self.generation - self.ages[slot]) & 0xFFFF), self.depths[slot]
+
+    def __len__(self):
+        return sum(1 for depth in self.depths if depth)
+
+    def flush(self):
+        self.map.flush()
+
+    # Close the cache (the entries are written to the file).
+    def close(self):
+        for view in (self.keys, self.scores, self.score_bits, self.moves, self.depths, self.bounds, self.ages, self.view):
+            view.release()
+        self.map.flush()
+        self.map.close()
+        self.file.close()
+
+    def hit_rate(self):
+        return self.hits / self.probes if self.probes > 0 else 0
+
+    def __str__(self):
+        return "Cache Hits: " + str(self.hits) + "/" + str(self.probes) + " (" + "{:.1%}".format(self.hit_rate()) + ")"
@@ -0,0 +1,436 @@
+# Position.py
+# Contains a compact position (64-bit integer bitboards, with make/unmake and legal move generation) for the search loop.
+# Carter Kruse (October 5, 2023)
+
+import chess
+import time
+
+# Pieces: The piece type (1-6, as in python-chess), plus 8 for the white pieces (0 is an empty square).
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = chess.PAWN, chess.KNIGHT, chess.BISHOP, chess.ROOK, chess.QUEEN, chess.KING
+WHITE, BLACK = 1, 0
+
+# The values of the pieces (in pawns), as in the evaluation of the AIs.
+PIECE_VALUES = [0, 1, 3, 3, 5, 9, 200]
+
+# Moves: The from square, the to square (shifted by 6), and the promotion piece type (shifted by 12).
+    # Castling is the king moving two squares, and en passant is a pawn moving to the en passant square.
+def encode_move(move):
+    return move.from_square | (move.to_square << 6) | ((move.promotion or 0) << 12)
+
+def decode_move(move):
+    return chess.Move(move & 63, (move >> 6) & 63, (move >> 12) or None)
+
+# Attack Tables (from python-chess)
+KNIGHT_ATTACKS = chess.BB_KNIGHT_ATTACKS
+KING_ATTACKS = chess.BB_KING_ATTACKS
+PAWN_ATTACKS = [chess.BB_PAWN_ATTACKS[chess.BLACK], chess.BB_PAWN_ATTACKS[chess.WHITE]]
+DIAG_MASKS, DIAG_ATTACKS = chess.BB_DIAG_MASKS, chess.BB_DIAG_ATTACKS
+FILE_MASKS, FILE_ATTACKS = chess.BB_FILE_MASKS, chess.BB_FILE_ATTACKS
+RANK_MASKS, RANK_ATTACKS = chess.BB_RANK_MASKS, chess.BB_RANK_ATTACKS
+RAYS = chess.BB_RAYS
+BETWEEN = [[chess.between(a, b) for b in range(64)] for a in range(64)]
+
+BB_ALL = chess.BB_ALL
+BB_RANK_1, BB_RANK_8 = chess.BB_RANK_1, chess.BB_RANK_8
+BB_RANK_3, BB_RANK_6 = chess.BB_RANK_3, chess.BB_RANK_6
+
+# Castling Rights: White kingside, white queenside, black kingside, black queenside (the rights lost when a piece moves from/to each square).
+WHITE_KINGSIDE, WHITE_QUEENSIDE, BLACK_KINGSIDE, BLACK_QUEENSIDE = 1, 2, 4, 8
+CASTLING_MASKS = [15] * 64
+CASTLING_MASKS[chess.E1] = 15 ^ (WHITE_KINGSIDE | WHITE_QUEENSIDE)
+CASTLING_MASKS[chess.H1] = 15 ^ WHITE_KINGSIDE
+CASTLING_MASKS[chess.A1] = 15 ^ WHITE_QUEENSIDE
+CASTLING_MASKS[chess.E8] = 15 ^ (BLACK_KINGSIDE | BLACK_QUEENSIDE)
+CASTLING_MASKS[chess.H8] = 15 ^ BLACK_KINGSIDE
+CASTLING_MASKS[chess.A8] = 15 ^ BLACK_QUEENSIDE
+
+# The rook move for each castling move (by the king's to square).
+CASTLING_ROOKS = {chess.G1: (chess.H1, chess.F1), chess.C1: (chess.A1, chess.D1), chess.G8: (chess.H8, chess.F8), chess.C8: (chess.A8, chess.D8)}
+
+def bishop_attacks(square, occupied):
+    return DIAG_ATTACKS[square][DIAG_MASKS[square] & occupied]
+
+def rook_attacks(square, occupied):
+    return RANK_ATTACKS[square][RANK_MASKS[square] & occupied] | FILE_ATTACKS[square][FILE_MASKS[square] & occupied]
+
+class Position:
+    # Constructor
+        # The position is converted from a python-chess board (the starting position, by default).
+    def __init__(self, board = None):
+        board = board or chess.Board()
+
+        # Bitboards for each piece type (both colors) and for each color, along with the piece on each square.
+        self.pieces = [0] * 7
+        self.occupied_co = [0, 0]
+        self.occupied = 0
+        self.squares = [0] * 64
+
+        # The material (in pawns), from the perspective of the white player.
+        self.material = 0
+
+        for square, piece in board.piece_map().items():
+            self.place(square, piece.piece_type + 8 * piece.color)
+
+        self.turn = WHITE if board.turn == chess.WHITE else BLACK
+        self.castling = (WHITE_KINGSIDE if board.has_kingside_castling_rights(chess.WHITE) else 0) | \
+            (WHITE_QUEENSIDE if board.has_queenside_castling_rights(chess.WHITE) else 0) | \
+            (BLACK_KINGSIDE if board.has_kingside_castling_rights(chess.BLACK) else 0) | \
+            (BLACK_QUEENSIDE if board.has_queenside_castling_rights(chess.BLACK) else 0)
+        self.ep_square = board.ep_square if board.ep_square is not None else -1
+        self.halfmove_clock = board.halfmove_clock
+        self.fullmove_number = board.fullmove_number
+
+        # The information needed to unmake each move.
+        self.stack = []
+
+    # Convert the position to a python-chess board.
+    def board(self):
+        board = chess.Board(None)
+        for square in range(64):
+            if self.squares[square]:
+                board.set_piece_at(square, chess.Piece(self.squares[square] & 7, self.squares[square] >> 3 == WHITE))
+
+        board.turn = self.turn == WHITE
+        board.castling_rights = (chess.BB_H1 if self.castling & WHITE_KINGSIDE else 0) | (chess.BB_A1 if self.castling & WHITE_QUEENSIDE else 0) | \
+            (chess.BB_H8 if self.castling & BLACK_KINGSIDE else 0) | (chess.BB_A8 if self.castling & BLACK_QUEENSIDE else 0)
+        board.ep_square = self.ep_square if self.ep_square >= 0 else None
+        board.halfmove_clock = self.halfmove_clock
+        board.fullmove_number = self.fullmove_number
+        return board
+
+    # Place a piece on an (empty) square.
+    def place(self, square, piece):
+        bit = 1 << square
+        self.pieces[piece & 7] |= bit
+        self.occupied_co[piece >> 3] |= bit
+        self.occupied |= bit
+        self.squares[square] = piece
+        self.material += PIECE_VALUES[piece & 7] if piece >> 3 else -PIECE_VALUES[piece & 7]
+
+    # Remove the piece from a square.
+    def remove(self, square):
+        piece = self.squares[square]
+        bit = ~(1 << square)
+        self.pieces[piece & 7] &= bit
+        self.occupied_co[piece >> 3] &= bit
+        self.occupied &= bit
+        self.squares[square] = 0
+        self.material -= PIECE_VALUES[piece & 7] if piece >> 3 else -PIECE_VALUES[piece & 7]
+        return piece
+
+    # The pieces of the given color attacking a square (with the given occupancy).
+    def attackers(self, color, square, occupied):
+        pieces = self.pieces
+        queens = pieces[QUEEN]
+        return self.occupied_co[color] & ((KNIGHT_ATTACKS[square] & pieces[KNIGHT]) | (KING_ATTACKS[square] & pieces[KING]) |
+                                          (PAWN_ATTACKS[color ^ 1][square] & pieces[PAWN]) |
+                                          (rook_attacks(square, occupied) & (pieces[ROOK] | queens)) |
+                                          (bishop_attacks(square, occupied) & (pieces[BISHOP] | queens)))
+
+    def king(self, color):
+        return (self.pieces[KING] & self.occupied_co[color]).bit_length() - 1
+
+    def is_check(self):
+        return self.attackers(self.turn ^ 1, self.king(self.turn), self.occupied) != 0
+
+    def is_capture(self, move):
+        return self.squares[(move >> 6) & 63] != 0 or ((move >> 6) & 63 == self.ep_square and self.squares[move & 63] & 7 == PAWN)
+
+    # Legal Moves (generated once for each node)
+        # Moves out of check are restricted to capturing/blocking the checker, and pinned pieces to the ray of the pin.
+    def legal_moves(self):
+        us = self.turn
+        them = us ^ 1
+        occupied = self.occupied
+        own = self.occupied_co[us]
+        enemy = self.occupied_co[them]
+        pieces = self.pieces
+        squares = self.squares
+        king = self.king(us)
+        moves = []
+
+        # King Moves (to squares not attacked, with the king removed from the occupancy, so it cannot step along the ray of a slider)
+        without_king = occupied & ~(1 << king)
+        targets = KING_ATTACKS[king] & ~own
+        while targets:
+            to = (targets & -targets).bit_length() - 1
+            targets &= targets - 1
+            if not self.attackers(them, to, without_king):
+                moves.append(king | (to << 6))
+
+        checkers = self.attackers(them, king, occupied)
+
+        # Double Check: Only the king can move.
+        if checkers & (checkers - 1):
+            return moves
+
+        # Single Check: The other pieces must capture the checker, or block the check.
+        if checkers:
+            mask = BETWEEN[king][checkers.bit_length() - 1] | checkers
+        else:
+            mask = BB_ALL
+
+            # Castling (the king is not in check, the squares between are empty, and the squares the king crosses are not attacked)
+            if us == WHITE:
+                if self.castling & WHITE_KINGSIDE and not occupied & (chess.BB_F1 | chess.BB_G1) and \
+                        not self.attackers(them, chess.F1, occupied) and not self.attackers(them, chess.G1, occupied):
+                    moves.append(chess.E1 | (chess.G1 << 6))
+                if self.castling & WHITE_QUEENSIDE and not occupied & (chess.BB_B1 | chess.BB_C1 | chess.BB_D1) and \
+                        not self.attackers(them, chess.D1, occupied) and not self.attackers(them, chess.C1, occupied):
+                    moves.append(chess.E1 | (chess.C1 << 6))
+            else:
+                if self.castling & BLACK_KINGSIDE and not occupied & (chess.BB_F8 | chess.BB_G8) and \
+                        not self.attackers(them, chess.F8, occupied) and not self.attackers(them, chess.G8, occupied):
+                    moves.append(chess.E8 | (chess.G8 << 6))
+                if self.castling & BLACK_QUEENSIDE and not occupied & (chess.BB_B8 | chess.BB_C8 | chess.BB_D8) and \
+                        not self.attackers(them, chess.D8, occupied) and not self.attackers(them, chess.C8, occupied):
+                    moves.append(chess.E8 | (chess.C8 << 6))
+
+        pinned, pin_rays = self.pins(king)
+
+        # Knights, Bishops, Rooks, Queens (pinned knights cannot move)
+        targets_mask = mask & ~own
+        movers = own & ~pieces[PAWN] & ~pieces[KING]
+        while movers:
+            square = (movers & -movers).bit_length() - 1
+            movers &= movers - 1
+            piece_type = squares[square] & 7
+
+            if piece_type == KNIGHT:
+                if pinned >> square & 1:
+                    continue
+                targets = KNIGHT_ATTACKS[square]
+            elif piece_type == BISHOP:
+                targets = bishop_attacks(square, occupied)
+            elif piece_type == ROOK:
+                targets = rook_attacks(square, occupied)
+            else:
+                targets = bishop_attacks(square, occupied) | rook_attacks(square, occupied)
+
+            targets &= targets_mask
+            if pinned >> square & 1:
+                targets &= pin_rays[square]
+
+            while targets:
+                to = (targets & -targets).bit_length() - 1
+                targets &= targets - 1
+                moves.append(square | (to << 6))
+
+        # Pawns (pushes, double pushes, captures, promotions)
+        pawns = pieces[PAWN] & own
+        empty = ~occupied & BB_ALL
+        if us == WHITE:
+            forward, start_rank, last_rank = 8, BB_RANK_3, BB_RANK_8
+            single = (pawns << 8) & empty
+            double = ((single & start_rank) << 8) & empty
+        else:
+            forward, start_rank, last_rank = -8, BB_RANK_6, BB_RANK_1
+            single = (pawns >> 8) & empty
+            double = ((single & start_rank) >> 8) & empty
+
+        for targets, distance in ((single & mask, forward), (double & mask, 2 * forward)):
+            while targets:
+                to = (targets & -targets).bit_length() - 1
+                targets &= targets - 1
+                square = to - distance
+                if pinned >> square & 1 and not pin_rays[square] >> to & 1:
+                    continue
+                self.pawn_moves(moves, square, to, last_rank)
+
+        attackers = pawns
+        while attackers:
+            square = (attackers & -attackers).bit_length() - 1
+            attackers &= attackers - 1
+            targets = PAWN_ATTACKS[us][square] & enemy & mask
+            if pinned >> square & 1:
+                targets &= pin_rays[square]
+            while targets:
+                to = (targets & -targets).bit_length() - 1
+                targets &= targets - 1
+                self.pawn_moves(moves, square, to, last_rank)
+
+        # En Passant (checked by removing both pawns from the occupancy, as the capture can expose the king along the rank)
+        if self.ep_square >= 0:
+            captured = self.ep_square - forward
+            attackers = PAWN_ATTACKS[them][self.ep_square] & pawns
+            while attackers:
+                square = (attackers & -attackers).bit_length() - 1
+                attackers &= attackers - 1
+                after = (occupied & ~(1 << square) & ~(1 << captured)) | (1 << self.ep_square)
+                sliders = ((rook_attacks(king, after) & (pieces[ROOK] | pieces[QUEEN])) | (bishop_attacks(king, after) & (pieces[BISHOP] | pieces[QUEEN]))) & enemy
+                if not sliders and not checkers & (pieces[KNIGHT] | pieces[PAWN]) & ~(1 << captured):
+                    moves.append(square | (self.ep_square << 6))
+
+        return moves
+
+    # Pins: Own pieces that are the only piece between the king and an enemy slider (restricted to the ray of the slider).
+    def pins(self, king):
+        pieces = self.pieces
+        occupied = self.occupied
+        own = self.occupied_co[self.turn]
+        pinned = 0
+        pin_rays = {}
+
+        snipers = ((rook_attacks(king, 0) & (pieces[ROOK] | pieces[QUEEN])) | (bishop_attacks(king, 0) & (pieces[BISHOP] | pieces[QUEEN]))) & self.occupied_co[self.turn ^ 1]
+        while snipers:
+            sniper = (snipers & -snipers).bit_length() - 1
+            snipers &= snipers - 1
+            blockers = BETWEEN[king][sniper] & occupied
+            if blockers and not blockers & (blockers - 1) and blockers & own:
+                pinned |= blockers
+                pin_rays[blockers.bit_length() - 1] = RAYS[king][sniper]
+
+        return pinned, pin_rays
+
+    # Whether there are any legal moves (for the terminal test at the leaves, without generating all of the moves).
+        # Outside of check, a move by a piece that is not pinned (or along the ray of the pin) is legal.
+    def has_legal_moves(self):
+        king = self.king(self.turn)
+        if self.attackers(self.turn ^ 1, king, self.occupied):
+            return len(self.legal_moves()) > 0
+
+        pieces = self.pieces
+        occupied = self.occupied
+        own = self.occupied_co[self.turn]
+        pinned, pin_rays = self.pins(king)
+
+        # Pawn Pushes
+        pawns = pieces[PAWN] & own & ~pinned
+        if (pawns << 8 if self.turn == WHITE else pawns >> 8) & ~occupied & BB_ALL:
+            return True
+
+        # Knights, Bishops, Rooks, Queens
+        movers = own & (pieces[KNIGHT] | pieces[BISHOP] | pieces[ROOK] | pieces[QUEEN])
+        while movers:
+            square = (movers & -movers).bit_length() - 1
+            movers &= movers - 1
+            piece_type = self.squares[square] & 7
+
+            if piece_type == KNIGHT:
+                targets = 0 if pinned >> square & 1 else KNIGHT_ATTACKS[square]
+            elif piece_type == BISHOP:
+                targets = bishop_attacks(square, occupied)
+            elif piece_type == ROOK:
+                targets = rook_attacks(square, occupied)
+            else:
+                targets = bishop_attacks(square, occupied) | rook_attacks(square, occupied)
+
+            if pinned >> square & 1:
+                targets &= pin_rays[square]
+            if targets & ~own:
+                return True
+
+        return len(self.legal_moves()) > 0
+
+    # Add a pawn move (with each of the promotions, on the last rank).
+    @staticmethod
+    def pawn_moves(moves, square, to, last_rank):
+        move = square | (to << 6)
+        if last_rank >> to & 1:
+            moves.extend((move | (QUEEN << 12), move | (ROOK << 12), move | (BISHOP << 12), move | (KNIGHT << 12)))
+        else:
+            moves.append(move)
+
+    # Make a move.
+    def push(self, move):
+        square = move & 63
+        to = (move >> 6) & 63
+        promotion = move >> 12
+        piece = self.squares[square]
+        piece_type = piece & 7
+
+        # The captured piece (and its square, which differs for en passant).
+        captured_square = to
+        if piece_type == PAWN and to == self.ep_square:
+            captured_square = to - 8 if self.turn == WHITE else to + 8
+        captured = self.remove(captured_square) if self.squares[captured_square] else 0
+
+        self.stack.append((move, captured, captured_square, self.castling, self.ep_square, self.halfmove_clock))
+
+        self.remove(square)
+        self.place(to, (promotion + 8 * self.turn) if promotion else piece)
+
+        # Castling (moving the rook)
+        if piece_type == KING and abs(to - square) == 2:
+            rook_square, rook_to = CASTLING_ROOKS[to]
+            self.place(rook_to, self.remove(rook_square))
+
+        self.castling &= CASTLING_MASKS[square] & CASTLING_MASKS[to]
+        self.ep_square = (square + to) >> 1 if piece_type == PAWN and abs(to - square) == 16 else -1
+        self.halfmove_clock = 0 if piece_type == PAWN or captured else self.halfmove_clock + 1
+        if self.turn == BLACK:
+            self.fullmove_number += 1
+        self.turn ^= 1
+
+    # Unmake the last move.
+    def pop(self):
+        move, captured, captured_square, self.castling, self.ep_square, self.halfmove_clock = self.stack.pop()
+        square = move & 63
+        to = (move >> 6) & 63
+
+        self.turn ^= 1
+        if self.turn == BLACK:
+            self.fullmove_number -= 1
+
+        piece = self.remove(to)
+        self.place(square, (PAWN + 8 * self.turn) if move >> 12 else piece)
+
+        if piece & 7 == KING and abs(to - square) == 2:
+            rook_square, rook_to = CASTLING_ROOKS[to]
+            self.place(rook_square, self.remove(rook_to))
+
+        if captured:
+            self.place(captured_square, captured)
+
+    # Perft: The number of leaf nodes of the legal move tree at the given depth (to verify the move generation).
+    def perft(self, depth):
+        moves = self.legal_moves()
+        if depth <= 1:
+            return len(moves) if depth == 1 else 1
+
+        nodes = 0
+        for move in moves:
+            self.push(move)
+            nodes += self.perft(depth - 1)
+            self.pop()
+        return nodes
+
+# The number of leaf nodes with python-chess (for comparison).
+def board_perft(board, depth):
+    if depth <= 1:
+        return board.legal_moves.count() if depth == 1 else 1
+
+    nodes = 0
+    for move in board.legal_moves:
+        board.push(move)
+        nodes += board_perft(board, depth - 1)
+        board.pop()
+    return nodes
+
+# Perft Suite: Positions with the known number of leaf nodes for each depth.
+    # https://www.chessprogramming.org/Perft_Results
+PERFT_POSITIONS = [
+    ('Starting Position', chess.STARTING_FEN, [20, 400, 8902, 197281]),
+    ('Kiwipete', 'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1', [48, 2039, 97862]),
+    ('Position 3', '8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1', [14, 191, 2812, 43238]),
+    ('Position 4', 'r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1', [6, 264, 9467]),
+    ('Position 5', 'rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8', [44, 1486, 62379]),
+    ('Position 6', 'r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10', [46, 2079, 89890]),
+]
+
+if __name__ == '__main__':
+    # Verify the move generation against the perft suite, comparing the time taken with python-chess.
+        # Usage: python3 Position.py
+    print('{:<20}{:>6}{:>12}{:>8}{:>14}{:>14}{:>10}'.format("Position", "Depth", "Nodes", "Correct", "Time", "python-chess", "Speedup"))
+
+    for name, fen, counts in PERFT_POSITIONS:
+        for depth, expected in enumerate(counts, 1):
+            start = time.time()
+            nodes = Position(chess.Board(fen)).perft(depth)
+            position_time = time.time() - start
+
+            start = time.time()
+            board_perft(chess.Board(fen), depth)
+            board_time = time.time() - start
+
+            print('{:<20}{:>6}{:>12}{:>8}{:>14.3f}{:>14.3f}{:>10.2f}'.format(name, depth, nodes, str(nodes == expected), position_time, board_time, board_time / max(position_time, 1e-9)))
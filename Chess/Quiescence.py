@@ -0,0 +1,88 @@
+# Quiescence.py
+# Contains the methods with respect to quiescence search (captures only) at the leaves of the alpha-beta AI.
+# Carter Kruse (October 5, 2023)
+
+from MoveOrdering import PIECE_VALUES
+import chess
+
+class Quiescence:
+    # Constructor
+    def __init__(self, utility, max_nodes = 1000, delta_margin = 2, push = None, pop = None):
+        # The (static) utility of the board, from the perspective of the white player.
+        self.utility = utility
+
+        # The methods to make/unmake a move (e.g. to update an incremental evaluator), by default those of the board.
+        self.push = push or (lambda board, move: board.push(move))
+        self.pop = pop or (lambda board: board.pop())
+
+        # The maximum number of nodes for each quiescence search (from a leaf).
+        self.max_nodes = max_nodes
+
+        # Delta Pruning: Captures that cannot raise the value to within the margin of the bound are skipped.
+        self.delta_margin = delta_margin
+
+        # The number of nodes for the most recent search, and in total.
+        self.nodes = 0
+        self.total_nodes = 0
+
+    # Search the captures from the board until the position is quiet (or the node limit is reached).
+    def search(self, board, alpha, beta):
+        self.nodes = 0
+        value = self.value(board, alpha, beta)
+        self.total_nodes += self.nodes
+        return value
+
+    def value(self, board, alpha, beta):
+        # Stand Pat: The player to move may decline to capture, so the static value is a bound.
+        stand_pat = self.utility(board)
+        value = stand_pat
+
+        if board.turn == chess.WHITE:
+            if stand_pat >= beta:
+                return stand_pat
+            alpha = max(alpha, stand_pat)
+        else:
+            if stand_pat <= alpha:
+                return stand_pat
+            beta = min(beta, stand_pat)
+
+        for move, gain in self.captures(board):
+            if self.nodes >= self.max_nodes:
+                break
+
+            # Delta Pruning
+            if board.turn == chess.WHITE and stand_pat + gain + self.delta_margin <= alpha:
+                continue
+            if board.turn == chess.BLACK and stand_pat - gain - self.delta_margin >= beta:
+                continue
+
+            self.push(board, move)
+            self.nodes += 1
+            current_value = self.value(board, alpha, beta)
+            self.pop(board)
+
+            if board.turn == chess.WHITE:
+                value = max(value, current_value)
+                if value >= beta:
+                    return value
+                alpha = max(alpha, value)
+            else:
+                value = min(value, current_value)
+                if value <= alpha:
+                    return value
+                beta = min(beta, value)
+
+        return value
+
+    # The captures from the board, along with the material gained, ordered by MVV-LVA.
+    def captures(self, board):
+        captures = []
+
+        for move in board.generate_legal_captures():
+            # The victim of an en passant capture is a pawn (not on the destination square).
+            victim = board.piece_type_at(move.to_square) or chess.PAWN
+            gain = PIECE_VALUES[victim] + (PIECE_VALUES[move.promotion] - PIECE_VALUES[chess.PAWN] if move.promotion else 0)
+            captures.append((10 * gain - PIECE_VALUES[board.piece_type_at(move.from_square)], move, gain))
+
+        captures.sort(key = lambda capture: capture[0], reverse = True)
+        return [(move, gain) for _, move, gain in captures]
@@ -0,0 +1,62 @@
+# Tablebase.py
+# Contains the methods with respect to probing (Syzygy) endgame tablebases for the chess game.
+# Carter Kruse (October 5, 2023)
+
+import chess
+import chess.syzygy
+import os
+import time
+
+class Tablebase:
+    # Constructor
+    def __init__(self, directory = None, max_pieces = 5):
+        # The tablebases are optional, and only probed if the directory exists.
+        self.tablebase = chess.syzygy.open_tablebase(directory) if directory and os.path.isdir(directory) else None
+
+        # The tablebases are only probed with (at most) the given number of pieces.
+        self.max_pieces = max_pieces
+
+        # Statistics
+        self.probes = 0
+        self.hits = 0
+        self.probe_time = 0
+
+    # Probe: Returns the best move for the board (according to the tablebases), or None.
+    def probe(self, board):
+        if self.tablebase is None or chess.popcount(board.occupied) > self.max_pieces:
+            return None
+
+        self.probes += 1
+        start = time.time()
+
+        best_move, best_key = None, None
+        try:
+            for move in board.legal_moves:
+                board.push(move)
+                try:
+                    # The result (win/draw/loss) and distance to zeroing (capture or pawn move), for the opponent.
+                    wdl = self.tablebase.probe_wdl(board)
+                    dtz = self.tablebase.probe_dtz(board)
+                finally:
+                    board.pop()
+
+                # The best move is the worst result for the opponent, winning as quickly (or losing as slowly) as possible.
+                key = (wdl, -dtz)
+                if best_key is None or key < best_key:
+                    best_move, best_key = move, key
+
+        # The tables for the position (or one of the positions after a move) are missing.
+        except (KeyError, chess.syzygy.MissingTableError):
+            best_move = None
+
+        self.probe_time += time.time() - start
+        if best_move:
+            self.hits += 1
+        return best_move
+
+    def close(self):
+        if self.tablebase:
+            self.tablebase.close()
+
+    def __str__(self):
+        return "Tablebase Hits: " + str(self.hits) + "/" + str(self.probes) + " (Probe Time: " + "{:.3g}".format(self.probe_time) + " Seconds)"
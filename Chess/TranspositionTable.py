@@ -0,0 +1,135 @@
+# TranspositionTable.py
+# Contains a fixed-size transposition table (with depth, bound, and best move entries) for the alpha-beta AI.
+# Carter Kruse (October 5, 2023)
+
+from array import array
+import chess
+
+# Bound Types: The stored score is either exact, or a lower/upper bound (from a cutoff).
+EXACT, LOWER, UPPER = 0, 1, 2
+
+# The size (in bytes) of an entry: key (8), score (8), move (2), depth (1), bound (1).
+ENTRY_SIZE = 20
+
+# Moves are encoded in 16 bits: from square (6), to square (6), promotion piece (3), where 0 is no move.
+def encode_move(move):
+    if move is None:
+        return 0
+    return move.from_square | (move.to_square << 6) | ((move.promotion or 0) << 12)
+
+def decode_move(code):
+    if code == 0:
+        return None
+    return chess.Move(code & 63, (code >> 6) & 63, (code >> 12) or None)
+
+class TranspositionTable:
+    # Constructor
+        # The entries may be stored in a given buffer (e.g. shared memory), which must hold 'size(size_mb)' bytes.
+        # The cache (optional) is the second level (e.g. a persistent cache), probed on a miss, with the entries stored to both.
+    def __init__(self, size_mb = 16, buffer = None, cache = None):
+        # Each bucket has two slots: the first is depth-preferred, the second is always replaced.
+        self.buckets = max(1, int(size_mb * 1024 * 1024) // (2 * ENTRY_SIZE))
+        slots = 2 * self.buckets
+
+        if buffer is None:
+            buffer = bytearray(slots * ENTRY_SIZE)
+            empty = True
+        else:
+            empty = False
+
+        # The entries are stored in parallel arrays over one buffer (rather than a dictionary), so the memory is fixed.
+        self.view = view = memoryview(buffer)[:slots * ENTRY_SIZE]
+        self.keys = view[:8 * slots].cast('Q')
+        self.scores = view[8 * slots:16 * slots].cast('d')
+        self.score_bits = view[8 * slots:16 * slots].cast('Q') # The scores, as integers (for the check below).
+        self.moves = view[16 * slots:18 * slots].cast('H')
+        self.depths = view[18 * slots:19 * slots].cast('b') # A depth of -1 is an empty slot.
+        self.bounds = view[19 * slots:20 * slots].cast('B')
+
+        if empty:
+            self.clear()
+
+        self.cache = cache
+
+        # Statistics
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    # The size (in bytes) of the buffer for a table of the given size (in MB).
+    @staticmethod
+    def size(size_mb):
+        return 2 * max(1, int(size_mb * 1024 * 1024) // (2 * ENTRY_SIZE)) * ENTRY_SIZE
+
+    # The key is stored XOR the data of the entry, so that an entry partially written by another process is not matched.
+    def check(self, slot):
+        return self.score_bits[slot] ^ (self.moves[slot] | ((self.depths[slot] & 255) << 16) | (self.bounds[slot] << 24))
+
+    # Probe: Returns the entry (depth, score, bound, move) for the key, or None.
+    def probe(self, key):
+        self.probes += 1
+        slot = (key % self.buckets) * 2
+
+        for slot in (slot, slot + 1):
+            if self.depths[slot] >= 0 and self.keys[slot] ^ self.check(slot) == key:
+                self.hits += 1
+                return self.depths[slot], self.scores[slot], self.bounds[slot], decode_move(self.moves[slot])
+
+        # Second Level: The entry is copied to the table, so that the next probe finds it here.
+        if self.cache is not None:
+            entry = self.cache.probe(key)
+            if entry:
+                self.hits += 1
+                self.store(key, *entry, write_through = False)
+                return entry
+
+        return None
+
+    # Store: Replaces the depth-preferred slot if the new entry is (at least) as deep, otherwise the always-replace slot.
+    def store(self, key, depth, score, bound, move = None, write_through = True):
+        if self.cache is not None and write_through:
+            self.cache.store(key, depth, score, bound, move)
+
+        slot = (key % self.buckets) * 2
+
+        if self.keys[slot] ^ self.check(slot) != key and depth < self.depths[slot]:
+            slot += 1
+
+        if self.depths[slot] >= 0 and self.keys[slot] ^ self.check(slot) != key:
+            self.overwrites += 1
+        self.stores += 1
+
+        self.depths[slot] = min(depth, 127)
+        self.scores[slot] = score
+        self.bounds[slot] = bound
+        self.moves[slot] = encode_move(move)
+        self.keys[slot] = key ^ self.check(slot)
+
+    def clear(self):
+        self.depths[:] = array('b', [-1]) * (2 * self.buckets)
+
+    # Release the views of the buffer (required before shared memory is closed).
+    def release(self):
+        for view in (self.keys, self.scores, self.score_bits, self.moves, self.depths, self.bounds, self.view):
+            view.release()
+
+    def hit_rate(self):
+        return self.hits / self.probes if self.probes > 0 else 0
+
+    def __str__(self):
+        table = "Table Hits: " + str(self.hits) + "/" + str(self.probes) + " (" + "{:.1%}".format(self.hit_rate()) + ")"
+        return table + ", " + str(self.cache) if self.cache is not None else table
+
+# Determine the value of an entry (if usable), given the remaining depth and the alpha/beta window.
+def entry_value(entry, depth, alpha, beta):
+    entry_depth, score, bound, move = entry
+
+    # An entry from a shallower search is not usable (other than for move ordering).
+    if entry_depth < depth:
+        return None
+
+    if bound == EXACT or (bound == LOWER and score >= beta) or (bound == UPPER and score <= alpha):
+        return score
+
+    return None
@@ -0,0 +1,112 @@
+# Zobrist.py
+# Contains the methods with respect to Zobrist hashing, maintained incrementally as moves are pushed/popped.
+# Carter Kruse (October 5, 2023)
+
+import chess
+import chess.polyglot
+
+# The random keys are the Polyglot keys, so the hash matches 'chess.polyglot.zobrist_hash()' (and opening books).
+    # Pieces: 0 - 767, Castling Rights: 768 - 771, En Passant File: 772 - 779, Turn (White): 780
+KEYS = chess.polyglot.POLYGLOT_RANDOM_ARRAY
+
+# The key for a piece (of a given type and color) on a square.
+def piece_key(piece_type, color, square):
+    return KEYS[64 * ((piece_type - 1) * 2 + int(color)) + square]
+
+class Zobrist:
+    # Constructor
+    def __init__(self):
+        self.hash = 0
+        self.stack = []
+
+    # Zobrist Hash (Full Computation)
+    def zobrist_hash(self, board):
+        hash = 0
+
+        # XOR the keys of the pieces on the squares.
+        for square, piece in board.piece_map().items():
+            hash ^= piece_key(piece.piece_type, piece.color, square)
+
+        return hash ^ self.castling_hash(board) ^ self.en_passant_hash(board) ^ (KEYS[780] if board.turn == chess.WHITE else 0)
+
+    # Castling Rights
+    def castling_hash(self, board):
+        hash = 0
+        rights = board.clean_castling_rights()
+
+        if rights & chess.BB_H1:
+            hash ^= KEYS[768]
+        if rights & chess.BB_A1:
+            hash ^= KEYS[769]
+        if rights & chess.BB_H8:
+            hash ^= KEYS[770]
+        if rights & chess.BB_A8:
+            hash ^= KEYS[771]
+
+        return hash
+
+    # En Passant File (only if a pawn of the player to move is able to capture)
+    def en_passant_hash(self, board):
+        if board.ep_square is None:
+            return 0
+
+        # Determine the squares from which a pawn may capture en passant.
+        if board.turn == chess.WHITE:
+            mask = chess.shift_down(chess.BB_SQUARES[board.ep_square])
+        else:
+            mask = chess.shift_up(chess.BB_SQUARES[board.ep_square])
+        mask = chess.shift_left(mask) | chess.shift_right(mask)
+
+        if mask & board.pawns & board.occupied_co[board.turn]:
+            return KEYS[772 + chess.square_file(board.ep_square)]
+        return 0
+
+    # Set the hash for the board (e.g. at the root of a search).
+    def set(self, board):
+        self.hash = self.zobrist_hash(board)
+        self.stack = []
+
+    # Push: Update the hash according to the move, then make the move.
+    def push(self, board, move):
+        hash = self.hash ^ self.castling_hash(board) ^ self.en_passant_hash(board)
+
+        # A null move only changes the turn (and en passant square).
+        if move:
+            color = board.turn
+            piece_type = board.piece_type_at(move.from_square)
+
+            # Remove the piece from the original square.
+            hash ^= piece_key(piece_type, color, move.from_square)
+
+            # Remove the captured piece (if any).
+            if board.is_en_passant(move):
+                captured_square = move.to_square + (-8 if color == chess.WHITE else 8)
+                hash ^= piece_key(chess.PAWN, not color, captured_square)
+            elif board.is_castling(move):
+                # Move the rook (from the corner to the square beside the king).
+                rank = chess.square_rank(move.from_square)
+                if chess.square_file(move.to_square) == 6:
+                    rook_from, rook_to = chess.square(7, rank), chess.square(5, rank)
+                else:
+                    rook_from, rook_to = chess.square(0, rank), chess.square(3, rank)
+                hash ^= piece_key(chess.ROOK, color, rook_from) ^ piece_key(chess.ROOK, color, rook_to)
+            else:
+                captured_type = board.piece_type_at(move.to_square)
+                if captured_type:
+                    hash ^= piece_key(captured_type, not color, move.to_square)
+
+            # Place the piece (or the promoted piece) on the new square.
+            hash ^= piece_key(move.promotion or piece_type, color, move.to_square)
+
+        board.push(move)
+
+        # Update the castling rights, en passant file, and turn.
+        hash ^= self.castling_hash(board) ^ self.en_passant_hash(board) ^ KEYS[780]
+
+        self.stack.append(self.hash)
+        self.hash = hash
+
+    # Pop: Unmake the move, restoring the previous hash.
+    def pop(self, board):
+        board.pop()
+        self.hash = self.stack.pop()
@@ -0,0 +1,183 @@
+# benchmark.py
+# A benchmark suite for the chess AIs: perft (move generation throughput) and fixed-depth searches (nodes, nodes/second, table hit rate, time to depth).
+# Includes: MinimaxAI, MinimaxAI_Mobility, IterativeDeepeningAI, IterativeDeepeningAI_Timed, AlphaBetaAI, AlphaBetaAI_Transposition, AlphaBetaAI_Zobrist, AlphaBetaAI_Bitboard
+# Carter Kruse (October 5, 2023)
+
+# Usage: python3 benchmark.py [--depth N] [--perft-depth N] [--ais NAME ...] [--categories NAME ...] [--cache FILE] [--output FILE]
+
+import argparse
+import chess
+import contextlib
+import io
+import json
+import platform
+import random
+import sys
+import time
+
+from MinimaxAI import MinimaxAI
+from MinimaxAI_Mobility import MinimaxAI_Mobility
+from IterativeDeepeningAI import IterativeDeepeningAI
+from IterativeDeepeningAI_Timed import IterativeDeepeningAI_Timed
+from AlphaBetaAI import AlphaBetaAI
+from AlphaBetaAI_Transposition import AlphaBetaAI_Transposition
+from AlphaBetaAI_Zobrist import AlphaBetaAI_Zobrist
+from AlphaBetaAI_Bitboard import AlphaBetaAI_Bitboard
+from Position import Position, PERFT_POSITIONS, board_perft
+from PersistentCache import PersistentCache
+from openings import opening_book
+
+# The AIs (searching to a fixed depth), by name.
+    # The timed iterative deepening AI is given a time limit long enough that it always reaches the depth.
+    # The Lazy SMP AI is not included, as the depth it reaches depends on the time limit (and the number of cores).
+    # The persistent cache (if any) is the second level of the transposition table, for the AIs with one.
+AIS = {
+    'MinimaxAI': lambda depth, cache: MinimaxAI(depth),
+    'MinimaxAI_Mobility': lambda depth, cache: MinimaxAI_Mobility(depth),
+    'IterativeDeepeningAI': lambda depth, cache: IterativeDeepeningAI(depth),
+    'IterativeDeepeningAI_Timed': lambda depth, cache: IterativeDeepeningAI_Timed(float('inf'), depth),
+    'AlphaBetaAI': lambda depth, cache: AlphaBetaAI(depth),
+    'AlphaBetaAI_Transposition': lambda depth, cache: AlphaBetaAI_Transposition(depth, cache = cache),
+    'AlphaBetaAI_Zobrist': lambda depth, cache: AlphaBetaAI_Zobrist(depth, cache = cache),
+    'AlphaBetaAI_Bitboard': lambda depth, cache: AlphaBetaAI_Bitboard(depth),
+}
+
+# Positions: The final position of each line of the opening book, along with standard middlegame and endgame tests.
+def benchmark_positions():
+    positions = []
+
+    for opening_name, line in opening_book.items():
+        board = chess.Board()
+        for move in line:
+            board.push(chess.Move.from_uci(move))
+        positions.append((opening_name, 'opening', board.fen()))
+
+    categories = {'Starting Position': 'opening', 'Position 3': 'endgame'}
+    for name, fen, _ in PERFT_POSITIONS:
+        positions.append((name, categories.get(name, 'middlegame'), fen))
+
+    positions.append(('Lucena Position', 'endgame', '1K1k4/1P6/8/8/8/8/r7/2R5 w - - 0 1'))
+    positions.append(('Lasker-Reichhelm', 'endgame', '8/k7/3p4/p2P1p2/P2P1P2/8/8/K7 w - - 0 1'))
+    positions.append(('King And Rook', 'endgame', '8/8/8/4k3/8/8/8/R3K3 w Q - 0 1'))
+
+    return positions
+
+# Perft: The number of leaf nodes (and the time taken) with python-chess and with the bitboard position.
+def run_perft(positions, depth):
+    expected = {fen: counts for _, fen, counts in PERFT_POSITIONS}
+    results = []
+
+    for name, category, fen in positions:
+        for engine in ['python-chess', 'Position']:
+            start = time.perf_counter()
+            nodes = board_perft(chess.Board(fen), depth) if engine == 'python-chess' else Position(chess.Board(fen)).perft(depth)
+            seconds = time.perf_counter() - start
+
+            counts = expected.get(fen, [])
+            results.append({'position': name, 'category': category, 'fen': fen, 'engine': engine, 'depth': depth, 'nodes': nodes,
+                            'time': seconds, 'nps': nodes / seconds if seconds > 0 else 0,
+                            'correct': nodes == counts[depth - 1] if depth <= len(counts) else None})
+
+    return results
+
+# Search a position with a fresh AI (and seed, so the search is repeatable), with the output of the AI suppressed.
+def search(ai_name, depth, fen, cache = None):
+    random.seed(0)
+    player = AIS[ai_name](depth, cache)
+    board = chess.Board(fen)
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        move = player.choose_move(board)
+    seconds = time.perf_counter() - start
+
+    table = getattr(player, 'table', None)
+    return player, move, seconds, table.hit_rate() if table else None
+
+# Fixed-Depth Searches: The nodes (calls), nodes/second, and table hit rate at the depth, and the time to reach each depth.
+def run_search(positions, ai_names, depth, cache = None):
+    results = []
+
+    for ai_name in ai_names:
+        for name, category, fen in positions:
+            # A board with no legal moves cannot be searched.
+            if not any(chess.Board(fen).legal_moves):
+                continue
+
+            time_to_depth = [search(ai_name, search_depth, fen, cache)[2] for search_depth in range(1, depth)]
+            player, move, seconds, hit_rate = search(ai_name, depth, fen, cache)
+            time_to_depth.append(seconds)
+
+            results.append({'ai': ai_name, 'position': name, 'category': category, 'fen': fen, 'depth': depth, 'move': move.uci(),
+                            'nodes': player.calls, 'time': seconds, 'nps': player.calls / seconds if seconds > 0 else 0,
+                            'table_hit_rate': hit_rate, 'time_to_depth': time_to_depth})
+
+    return results
+
+# Summary: The total nodes and time (and the overall nodes/second) for each engine/AI.
+def summarize(results, key):
+    summary = {}
+    for result in results:
+        total = summary.setdefault(result[key], {'nodes': 0, 'time': 0})
+        total['nodes'] += result['nodes']
+        total['time'] += result['time']
+
+    for total in summary.values():
+        total['nps'] = total['nodes'] / total['time'] if total['time'] > 0 else 0
+    return summary
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = "Perft and nodes/second benchmark for the chess AIs.")
+    parser.add_argument('--depth', type = int, default = 2, help = "the depth of the searches")
+    parser.add_argument('--perft-depth', type = int, default = 3, help = "the depth of perft (0 to skip)")
+    parser.add_argument('--ais', nargs = '+', choices = list(AIS), default = list(AIS), help = "the AIs to search with")
+    parser.add_argument('--categories', nargs = '+', choices = ['opening', 'middlegame', 'endgame'], default = ['opening', 'middlegame', 'endgame'])
+    parser.add_argument('--cache', default = None, help = "the file of the persistent cache (kept across runs), if any")
+    parser.add_argument('--output', default = 'benchmark.json', help = "the file for the results (JSON), or - for standard output")
+    args = parser.parse_args()
+
+    positions = [position for position in benchmark_positions() if position[1] in args.categories]
+
+    # The tables are displayed on standard error (so the results may be written to standard output).
+    log = sys.stderr if args.output == '-' else sys.stdout
+
+    perft_results = run_perft(positions, args.perft_depth) if args.perft_depth > 0 else []
+    perft_summary = summarize(perft_results, 'engine')
+
+    print("Perft (Depth: " + str(args.perft_depth) + ", Positions: " + str(len(positions)) + ")", file = log)
+    print('{:<28}{:>14}{:>12}{:>14}'.format("Engine", "Nodes", "Time", "Nodes/Second"), file = log)
+    for engine, total in perft_summary.items():
+        print('{:<28}{:>14}{:>12.2f}{:>14.0f}'.format(engine, total['nodes'], total['time'], total['nps']), file = log)
+
+    incorrect = [result['position'] for result in perft_results if result['correct'] is False]
+    if incorrect:
+        print("Incorrect Perft: " + ", ".join(incorrect), file = log)
+
+    # The AIs with a table use the default evaluation (without quiescence search), so they share the cache.
+    cache = PersistentCache(args.cache, tag = 'material') if args.cache else None
+    search_results = run_search(positions, args.ais, args.depth, cache)
+    if cache is not None:
+        cache.close()
+    search_summary = summarize(search_results, 'ai')
+
+    print(file = log)
+    print("Search (Depth: " + str(args.depth) + ", Positions: " + str(len(positions)) + ")", file = log)
+    print('{:<28}{:>14}{:>12}{:>14}{:>12}'.format("AI", "Nodes", "Time", "Nodes/Second", "Table Hits"), file = log)
+    for ai_name, total in search_summary.items():
+        hit_rates = [result['table_hit_rate'] for result in search_results if result['ai'] == ai_name and result['table_hit_rate'] is not None]
+        hit_rate = '{:.1%}'.format(sum(hit_rates) / len(hit_rates)) if hit_rates else '-'
+        print('{:<28}{:>14}{:>12.2f}{:>14.0f}{:>12}'.format(ai_name, total['nodes'], total['time'], total['nps'], hit_rate), file = log)
+
+    results = {'settings': {'depth': args.depth, 'perft_depth': args.perft_depth, 'python': platform.python_version(), 'python_chess': chess.__version__,
+                            'platform': platform.platform(), 'cache': args.cache},
+               'perft': perft_results, 'perft_summary': perft_summary,
+               'search': search_results, 'search_summary': search_summary}
+
+    if args.output == '-':
+        json.dump(results, sys.stdout, indent = 2)
+        print()
+    else:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent = 2)
+        print(file = log)
+        print("Results: " + args.output, file = log)
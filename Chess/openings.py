@@ -0,0 +1,24 @@
+# openings.py
+# Contains the opening book (sequences of moves in UCI format) for the chess game.
+# Carter Kruse (October 5, 2023)
+
+# List out all of the openings.
+opening_book = {'vienna_game': ['e2e4', 'e7e5', 'b1c3'],
+                 'scotch_game': ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'd2d4'],
+                 'italian_game': ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'b1c3'],
+                 'ruy_lopez': ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'b1c3', 'a7a6'],
+                 'sicilian_defense': ['e2e4', 'c7c5'],
+                 'french_defense': ['e2e4', 'e7e6'],
+                 'caro-kann_defense': ['e2e4', 'c7c6'],
+                 'pirc_defense': ['e2e4', 'd7d6', 'g1f3', 'g8f6'],
+                 'queens_gambit': ['d2d4', 'd7d5', 'c2c4'],
+                 'slav_defense': ['d2d4', 'd7d5', 'c2c4', 'c7c6'],
+                 'kings_indian_defense': ['d2d4', 'g8f6', 'c2c4', 'g7g6'],
+                 'grunfeld_defense': ['d2d4', 'g8f6', 'c2c4', 'g7g6', 'b1c3', 'd7d5'],
+                 'english_opening': ['c2c4'],
+                 'reti_opening': ['g1f3'],
+                 'giuoco_piano': ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'b1c3', 'g8f6', 'd2d4', 'e5d4', 'f3d4', 'b7b5'],
+                 'two_knights_defense': ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'b1c3', 'g8f6', 'g2g4'],
+                 'queens_gambit_declined': ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'c4d5', 'f6e4'],
+                 'sicilian_najdorf': ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'a7a6']
+                 }
@@ -13,9 +13,13 @@ from RandomAI import RandomAI
 from MinimaxAI import MinimaxAI
 from MinimaxAI_Mobility import MinimaxAI_Mobility
 from IterativeDeepeningAI import IterativeDeepeningAI
+from IterativeDeepeningAI_Timed import IterativeDeepeningAI_Timed
 from AlphaBetaAI import AlphaBetaAI
 from AlphaBetaAI_Transposition import AlphaBetaAI_Transposition
 from AlphaBetaAI_Zobrist import AlphaBetaAI_Zobrist
+from AlphaBetaAI_LazySMP import AlphaBetaAI_LazySMP
+from AlphaBetaAI_Bitboard import AlphaBetaAI_Bitboard
+from IterativeDeepeningAI_Ponder import IterativeDeepeningAI_Ponder
 from ChessGame import ChessGame
 
 # player1 = HumanPlayer()
@@ -23,26 +27,38 @@ player1 = RandomAI()
 # player1 = MinimaxAI(1)
 # player1 = MinimaxAI_Mobility(2)
 # player1 = IterativeDeepeningAI(2)
+# player1 = IterativeDeepeningAI_Timed(5)
 # player1 = AlphaBetaAI(2)
 # player1 = AlphaBetaAI_Transposition(2)
 # player1 = AlphaBetaAI_Zobrist(2)
+# player1 = AlphaBetaAI_LazySMP(5)
+# player1 = AlphaBetaAI_Bitboard(3)
+# player1 = IterativeDeepeningAI_Ponder(5)
 
 # player2 = HumanPlayer()s
 # player2 = RandomAI()
 player2 = MinimaxAI(1)
 # player2 = MinimaxAI_Mobility(2)
 # player2 = IterativeDeepeningAI(2)
+# player2 = IterativeDeepeningAI_Timed(5)
 # player2 = AlphaBetaAI(2)
 # player2 = AlphaBetaAI_Transposition(2)
 # player2 = AlphaBetaAI_Zobrist(2)
+# player2 = AlphaBetaAI_LazySMP(5)
+# player2 = AlphaBetaAI_Bitboard(3)
+# player2 = IterativeDeepeningAI_Ponder(5)
 
 # Initialize the chess game with the corresponding players.
 game = ChessGame(player1, player2)
+# game = ChessGame(player1, player2, ponder = True)
 
-# Run the chess game, allowing for moves to be made.
-while not game.is_game_over():
-    print(game)
-    game.make_move()
+# Run the chess game, allowing for moves to be made (the players are closed, even if the game is interrupted).
+try:
+    while not game.is_game_over():
+        print(game)
+        game.make_move()
+finally:
+    game.close()
 
 print()
 print("WHITE - BLACK")
@@ -17,7 +17,10 @@ from IterativeDeepeningAI import IterativeDeepeningAI
 from AlphaBetaAI import AlphaBetaAI
 from AlphaBetaAI_Transposition import AlphaBetaAI_Transposition
 from AlphaBetaAI_Zobrist import AlphaBetaAI_Zobrist
+from BookPlayer import BookPlayer
+from OpeningBook import OpeningBook
 from ChessGame import ChessGame
+from openings import opening_book
 
 # player1 = HumanPlayer()
 player1 = RandomAI()
@@ -34,32 +37,12 @@ player1 = RandomAI()
 # player2 = AlphaBetaAI(2)
 # player2 = AlphaBetaAI_Transposition(2)
 player2 = AlphaBetaAI_Zobrist(2)
+# player2 = BookPlayer(AlphaBetaAI_Zobrist(2), OpeningBook.from_openings(opening_book))
 
 # Initialize the chess game with the corresponding players.
 game = ChessGame(player1, player2)
 print(game)
 
-# List out all of the openings.
-opening_book = {'vienna_game': ['e2e4', 'e7e5', 'b1c3'],
-                 'scotch_game': ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'd2d4'],
-                 'italian_game': ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'b1c3'],
-                 'ruy_lopez': ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'b1c3', 'a7a6'],
-                 'sicilian_defense': ['e2e4', 'c7c5'],
-                 'french_defense': ['e2e4', 'e7e6'],
-                 'caro-kann_defense': ['e2e4', 'c7c6'],
-                 'pirc_defense': ['e2e4', 'd7d6', 'g1f3', 'g8f6'],
-                 'queens_gambit': ['d2d4', 'd7d5', 'c2c4'],
-                 'slav_defense': ['d2d4', 'd7d5', 'c2c4', 'c7c6'],
-                 'kings_indian_defense': ['d2d4', 'g8f6', 'c2c4', 'g7g6'],
-                 'grunfeld_defense': ['d2d4', 'g8f6', 'c2c4', 'g7g6', 'b1c3', 'd7d5'],
-                 'english_opening': ['c2c4'],
-                 'reti_opening': ['g1f3'],
-                 'giuoco_piano': ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'b1c3', 'g8f6', 'd2d4', 'e5d4', 'f3d4', 'b7b5'],
-                 'two_knights_defense': ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'b1c3', 'g8f6', 'g2g4'],
-                 'queens_gambit_declined': ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'c4d5', 'f6e4'],
-                 'sicilian_najdorf': ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'a7a6']
-                 }
-
 # # # # # # # # # #
 
 # UNCOMMENT
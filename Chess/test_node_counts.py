@@ -0,0 +1,88 @@
+# test_node_counts.py
+# A file to compare the number of nodes searched (calls) with and without move ordering, for each search variant, and with the selective search options, at a fixed depth.
+# Includes: AlphaBetaAI, AlphaBetaAI_Transposition, AlphaBetaAI_Zobrist
+# Carter Kruse (October 5, 2023)
+
+# Usage: python3 test_node_counts.py [depth]
+
+import chess
+import sys
+import time
+import random
+
+from AlphaBetaAI import AlphaBetaAI
+from AlphaBetaAI_Transposition import AlphaBetaAI_Transposition
+from AlphaBetaAI_Zobrist import AlphaBetaAI_Zobrist
+from openings import opening_book
+
+depth = int(sys.argv[1]) if len(sys.argv) > 1 else 2
+positions = sum(len(line) for line in opening_book.values())
+
+# Search each of the positions along the lines of the opening book, returning the total number of calls and the time taken.
+def count_nodes(player_class, search_depth = depth, **options):
+    calls = 0
+    start = time.time()
+
+    for opening_name in opening_book:
+        board = chess.Board()
+
+        # A fresh player (and seed) for each opening, so the searches are repeatable.
+            # The positions along the line are searched in order (so the aspiration window is centered on the previous score).
+        random.seed(0)
+        player = player_class(search_depth, **options)
+
+        for move in opening_book[opening_name]:
+            board.push(chess.Move.from_uci(move))
+            player.alpha_beta(board)
+
+        calls += player.calls
+
+    return calls, time.time() - start
+
+print("Depth: " + str(depth) + ", Positions: " + str(positions))
+print()
+print("Move Ordering")
+print('{:<28}{:>14}{:>14}{:>12}{:>12}{:>12}'.format("AI", "Calls (Before)", "Calls (After)", "Reduction", "Time Before", "Time After"))
+
+for player_class in [AlphaBetaAI, AlphaBetaAI_Transposition, AlphaBetaAI_Zobrist]:
+    calls_before, time_before = count_nodes(player_class, move_ordering = False)
+    calls_after, time_after = count_nodes(player_class, move_ordering = True)
+
+    print('{:<28}{:>14}{:>14}{:>12.1%}{:>12.2f}{:>12.2f}'.format(player_class.__name__, calls_before, calls_after, 1 - calls_after / calls_before, time_before, time_after))
+
+print()
+print("Search Variant (Alpha-Beta vs. Principal Variation Search With Aspiration Windows)")
+print('{:<28}{:>14}{:>14}{:>12}{:>12}{:>12}'.format("AI", "Calls (Before)", "Calls (After)", "Reduction", "Time Before", "Time After"))
+
+calls_before, time_before = count_nodes(AlphaBetaAI, variant = 'alpha_beta')
+calls_after, time_after = count_nodes(AlphaBetaAI, variant = 'pvs')
+
+print('{:<28}{:>14}{:>14}{:>12.1%}{:>12.2f}{:>12.2f}'.format("AlphaBetaAI", calls_before, calls_after, 1 - calls_after / calls_before, time_before, time_after))
+
+# The selective search options (each on its own, then together).
+selective_options = [('None', {}),
+                     ('Null-Move Pruning', {'null_move': True}),
+                     ('Late-Move Reductions', {'late_move_reductions': True}),
+                     ('Check Extensions', {'check_extensions': True}),
+                     ('All', {'null_move': True, 'late_move_reductions': True, 'check_extensions': True})]
+
+print()
+print("Selective Search (Principal Variation Search)")
+print("Effective Branching Factor: (Calls / Position) ^ (1 / (Depth + 1)), Depth Reached: The greatest depth searched in the time taken with no options.")
+print('{:<28}{:>14}{:>14}{:>12}{:>16}'.format("Options", "Calls", "Branching", "Time", "Depth Reached"))
+
+baseline_time = None
+for name, options in selective_options:
+    calls, seconds = count_nodes(AlphaBetaAI, variant = 'pvs', **options)
+    if baseline_time is None:
+        baseline_time = seconds
+
+    # Increase the depth until the searches take longer than the baseline.
+    depth_reached = 0
+    while True:
+        _, depth_seconds = count_nodes(AlphaBetaAI, depth_reached + 1, variant = 'pvs', **options)
+        if depth_seconds > baseline_time:
+            break
+        depth_reached += 1
+
+    print('{:<28}{:>14}{:>14.2f}{:>12.2f}{:>16}'.format(name, calls, (calls / positions) ** (1 / (depth + 1)), seconds, depth_reached))
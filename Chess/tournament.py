@@ -0,0 +1,156 @@
+# tournament.py
+# A headless self-play tournament between two AI configurations, playing the games in parallel (in a process pool).
+# The games start from the lines of the opening book (each played with both colors), with a time limit per move.
+# Carter Kruse (October 5, 2023)
+
+# Usage: python3 tournament.py "AlphaBetaAI(3, variant = 'pvs')" "AlphaBetaAI(3)" [--games N] [--workers N] [--time-control SECONDS] [--max-plies N]
+
+import argparse
+import contextlib
+import io
+import math
+import multiprocessing
+import random
+import time
+
+from RandomAI import RandomAI
+from MinimaxAI import MinimaxAI
+from MinimaxAI_Mobility import MinimaxAI_Mobility
+from IterativeDeepeningAI import IterativeDeepeningAI
+from IterativeDeepeningAI_Timed import IterativeDeepeningAI_Timed
+from AlphaBetaAI import AlphaBetaAI
+from AlphaBetaAI_Transposition import AlphaBetaAI_Transposition
+from AlphaBetaAI_Zobrist import AlphaBetaAI_Zobrist
+from AlphaBetaAI_Bitboard import AlphaBetaAI_Bitboard
+from Evaluator import Evaluator
+from ChessGame import ChessGame
+from openings import opening_book
+
+# The names available to the AI configurations (e.g. "AlphaBetaAI(2, evaluator = Evaluator())").
+    # The Lazy SMP AI is not available, as the processes of the pool cannot start processes of their own.
+ENGINES = {cls.__name__: cls for cls in [RandomAI, MinimaxAI, MinimaxAI_Mobility, IterativeDeepeningAI, IterativeDeepeningAI_Timed,
+                                         AlphaBetaAI, AlphaBetaAI_Transposition, AlphaBetaAI_Zobrist, AlphaBetaAI_Bitboard, Evaluator]}
+
+# Create a player from the configuration.
+def create_player(configuration):
+    return eval(configuration, {'__builtins__': {}}, dict(ENGINES))
+
+# Play a game (in a process of the pool), returning the result and the statistics for each engine.
+    # The first engine plays white if first_white is True, and the game starts from the given line of the opening book.
+def play_game(game_number, configurations, first_white, opening_name, time_control, max_plies):
+    random.seed(game_number)
+    engines = [create_player(configuration) for configuration in configurations]
+
+    # The players are white, then black.
+    players = engines if first_white else engines[::-1]
+    game = ChessGame(players[0], players[1], verbose = False)
+
+    for move in opening_book[opening_name]:
+        game.board.push_uci(move)
+
+    # The time taken and the number of calls (nodes), for each engine.
+    times = [0, 0]
+    calls = [0, 0]
+    termination = None
+
+    # The output of the AIs is suppressed (so the games are headless).
+    with contextlib.redirect_stdout(io.StringIO()):
+        while not game.board.is_game_over(claim_draw = True):
+            if len(game.board.move_stack) >= max_plies:
+                termination = 'max plies'
+                break
+
+            engine = 0 if (game.board.turn == first_white) else 1
+            calls_before = getattr(engines[engine], 'calls', 0)
+
+            game.make_move()
+
+            times[engine] += game.move_time
+            calls[engine] += getattr(engines[engine], 'calls', 0) - calls_before
+
+            # Time Control: The engine that takes longer than the time limit for a move loses.
+            if time_control and game.move_time > time_control:
+                termination = 'time forfeit'
+                score = 0 if engine == 0 else 1
+                break
+
+    if termination is None:
+        outcome = game.board.outcome(claim_draw = True)
+        termination = outcome.termination.name.lower()
+        score = 0.5 if outcome.winner is None else 1 if outcome.winner == first_white else 0
+    elif termination == 'max plies':
+        score = 0.5
+
+    return {'game': game_number, 'opening': opening_name, 'first_white': first_white, 'score': score, 'termination': termination,
+            'plies': len(game.board.move_stack), 'times': times, 'calls': calls}
+
+# Elo Difference (with the 95% confidence interval), from the score of the first engine.
+    # The error is computed from the standard deviation of the game scores, and the interval is the difference at the score plus/minus the error.
+def elo(wins, draws, losses):
+    games = wins + draws + losses
+    score = (wins + draws / 2) / games
+    variance = (wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score ** 2) / games
+    error = 1.96 * math.sqrt(variance / games)
+
+    def difference(score):
+        score = min(max(score, 1e-6), 1 - 1e-6)
+        return -400 * math.log10(1 / score - 1)
+
+    return difference(score), difference(score - error), difference(score + error)
+
+# Run the tournament, returning the results of the games (in order).
+def tournament(configurations, games, workers = None, time_control = None, max_plies = 200):
+    openings = list(opening_book)
+
+    # Each opening is played twice (alternating the colors), cycling through the openings.
+    tasks = [(number, configurations, number % 2 == 0, openings[(number // 2) % len(openings)], time_control, max_plies) for number in range(games)]
+
+    results = []
+    with multiprocessing.Pool(workers) as pool:
+        for result in pool.starmap(play_game, tasks):
+            results.append(result)
+
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = "Headless self-play tournament between two AI configurations.")
+    parser.add_argument('engine1', help = "the configuration of the first engine, e.g. \"AlphaBetaAI(3, variant = 'pvs')\"")
+    parser.add_argument('engine2', help = "the configuration of the second engine, e.g. \"AlphaBetaAI(3)\"")
+    parser.add_argument('--games', type = int, default = 2 * len(opening_book), help = "the number of games (by default, each opening with both colors)")
+    parser.add_argument('--workers', type = int, default = None, help = "the number of processes (by default, one per CPU core)")
+    parser.add_argument('--time-control', type = float, default = 10, help = "the time limit for each move, in seconds (0 for none)")
+    parser.add_argument('--max-plies', type = int, default = 200, help = "the number of plies after which the game is drawn")
+    args = parser.parse_args()
+
+    configurations = [args.engine1, args.engine2]
+
+    # Check the configurations before starting the pool.
+    for configuration in configurations:
+        create_player(configuration)
+
+    start = time.time()
+    results = tournament(configurations, args.games, args.workers, args.time_control, args.max_plies)
+    seconds = time.time() - start
+
+    wins = sum(1 for result in results if result['score'] == 1)
+    draws = sum(1 for result in results if result['score'] == 0.5)
+    losses = sum(1 for result in results if result['score'] == 0)
+
+    for result in results:
+        colors = "White" if result['first_white'] else "Black"
+        print('Game {:>3}: {:<24} Engine 1 As {:<6} Score: {:<4} ({}, {} Plies)'.format(result['game'] + 1, result['opening'], colors, result['score'], result['termination'], result['plies']))
+
+    print()
+    print("Engine 1: " + args.engine1)
+    print("Engine 2: " + args.engine2)
+    print("Games: " + str(len(results)) + ", Time: " + "{:.1f}".format(seconds) + " Seconds")
+    print("Engine 1 (W/D/L): " + str(wins) + "/" + str(draws) + "/" + str(losses))
+
+    difference, lower, upper = elo(wins, draws, losses)
+    print("Elo Difference: " + "{:+.0f}".format(difference) + " (95% Confidence: " + "{:+.0f}".format(lower) + " To " + "{:+.0f}".format(upper) + ")")
+
+    for engine in [0, 1]:
+        engine_time = sum(result['times'][engine] for result in results)
+        engine_calls = sum(result['calls'][engine] for result in results)
+        nodes_per_second = engine_calls / engine_time if engine_time > 0 else 0
+        print("Engine " + str(engine + 1) + " Nodes/Second: " + str(int(nodes_per_second)) + " (Calls: " + str(engine_calls) + ", Time: " + "{:.1f}".format(engine_time) + " Seconds)")
@@ -0,0 +1,386 @@
+# CDCL.py
+# Contains a complete (conflict-driven clause learning) SAT solver for the clause database.
+# Carter Kruse (October 24, 2023)
+
+import heapq
+
+# Literal Encoding: The variable 'v' is represented by '2v' (true) and '2v + 1' (false).
+    # The negation of a literal is given by 'literal ^ 1'.
+
+class CDCL:
+    # Constructor
+    def __init__(self, database):
+        self.database = database
+        self.n = database.index
+
+        # Assignment: The value of each literal (1 = true, -1 = false, 0 = unassigned).
+        self.value = [0] * (2 * self.n)
+        self.level = [0] * self.n
+        self.reason = [None] * self.n
+        self.polarity = [False] * self.n
+
+        # The trail of assigned literals, with the start of each decision level in 'trail_lim'.
+        self.trail = []
+        self.trail_lim = []
+        self.qhead = 0
+
+        # Clauses (lists of literals), with the clauses watching each literal.
+        self.clauses = []
+        self.learnts = []
+        self.watches = [[] for _ in range(2 * self.n)]
+
+        # VSIDS: The activity of each variable, with a heap of (negative) activities for branching.
+        self.activity = [0.0] * self.n
+        self.var_inc = 1.0
+        self.var_decay = 0.95
+        self.heap = [(0.0, v) for v in range(self.n)]
+
+        # Statistics
+        self.conflicts = 0
+        self.decisions = 0
+        self.propagations = 0
+        self.restarts = 0
+
+        # Determine if the clauses are (trivially) unsatisfiable when loaded.
+        self.ok = True
+
+        # Whether the last call to 'solve()' proved the clauses are unsatisfiable.
+        self.unsatisfiable = False
+
+        # Cycle through the clauses of the database.
+        for clause in database.clauses():
+            literals = []
+            tautology = False
+
+            # Convert the signed integers to literals, ignoring duplicates.
+            for signed in clause:
+                literal = 2 * (abs(signed) - 1) + (signed < 0)
+                if literal ^ 1 in literals:
+                    tautology = True
+                    break
+                if literal not in literals:
+                    literals.append(literal)
+
+            if not tautology:
+                self.add_clause(literals)
+
+    def add_clause(self, literals, learnt = False):
+        # An empty clause can never be satisfied.
+        if not literals:
+            self.ok = False
+            return None
+
+        # A unit clause is assigned immediately (at level 0).
+        if len(literals) == 1:
+            if self.value[literals[0]] == -1:
+                self.ok = False
+            elif self.value[literals[0]] == 0:
+                self.assign(literals[0], None)
+            return None
+
+        # Otherwise, watch the first two literals of the clause.
+        index = len(self.clauses)
+        self.clauses.append(literals)
+        self.watches[literals[0]].append(index)
+        self.watches[literals[1]].append(index)
+
+        if learnt:
+            self.learnts.append(index)
+
+        return index
+
+    def assign(self, literal, reason):
+        variable = literal >> 1
+        self.value[literal] = 1
+        self.value[literal ^ 1] = -1
+        self.level[variable] = len(self.trail_lim)
+        self.reason[variable] = reason
+        self.trail.append(literal)
+
+    # Unit Propagation (Two-Watched Literals)
+    def propagate(self):
+        value = self.value
+        clauses = self.clauses
+        watches = self.watches
+
+        while self.qhead < len(self.trail):
+            # The negation of the assigned literal has become false.
+            false_literal = self.trail[self.qhead] ^ 1
+            self.qhead += 1
+            self.propagations += 1
+
+            watching = watches[false_literal]
+            kept = []
+            i = 0
+
+            # Cycle through the clauses watching the false literal.
+            while i < len(watching):
+                index = watching[i]
+                i += 1
+                clause = clauses[index]
+
+                # Ignore (and stop watching) deleted clauses.
+                if clause is None:
+                    continue
+
+                # Ensure the false literal is the second watch.
+                if clause[0] == false_literal:
+                    clause[0], clause[1] = clause[1], false_literal
+
+                # If the first watch is true, the clause is satisfied.
+                if value[clause[0]] == 1:
+                    kept.append(index)
+                    continue
+
+                # Look for a new literal to watch (that is not false).
+                for k in range(2, len(clause)):
+                    if value[clause[k]] != -1:
+                        clause[1], clause[k] = clause[k], false_literal
+                        watches[clause[1]].append(index)
+                        break
+
+                # Otherwise, the clause is unit or conflicting.
+                else:
+                    kept.append(index)
+
+                    # Conflict: Keep the remaining watches and return the clause.
+                    if value[clause[0]] == -1:
+                        kept.extend(watching[i:])
+                        watches[false_literal] = kept
+                        self.qhead = len(self.trail)
+                        return index
+
+                    # Unit: The first watch is implied by the clause.
+                    self.assign(clause[0], index)
+
+            watches[false_literal] = kept
+
+        return None
+
+    # Conflict Analysis (First Unique Implication Point)
+    def analyze(self, conflict):
+        seen = self.seen
+        learnt = [None]
+        counter = 0
+        literal = None
+        index = len(self.trail) - 1
+        current_level = len(self.trail_lim)
+
+        while True:
+            clause = self.clauses[conflict]
+
+            # The implied literal of a reason clause is the first literal, which is skipped.
+            for q in (clause if literal is None else clause[1:]):
+                variable = q >> 1
+                if not seen[variable] and self.level[variable] > 0:
+                    seen[variable] = True
+                    self.bump(variable)
+
+                    # Literals at the current level are resolved, the others are part of the learnt clause.
+                    if self.level[variable] >= current_level:
+                        counter += 1
+                    else:
+                        learnt.append(q)
+
+            # Select the next literal (on the trail) to resolve.
+            while not seen[self.trail[index] >> 1]:
+                index -= 1
+            literal = self.trail[index]
+            index -= 1
+
+            conflict = self.reason[literal >> 1]
+            seen[literal >> 1] = False
+            counter -= 1
+
+            if counter == 0:
+                break
+
+        # The negation of the unique implication point is asserted by the learnt clause.
+        learnt[0] = literal ^ 1
+
+        for q in learnt[1:]:
+            seen[q >> 1] = False
+
+        # The backjump level is the highest level among the other literals (watched second).
+        backjump_level = 0
+        if len(learnt) > 1:
+            highest = max(range(1, len(learnt)), key = lambda k: self.level[learnt[k] >> 1])
+            learnt[1], learnt[highest] = learnt[highest], learnt[1]
+            backjump_level = self.level[learnt[1] >> 1]
+
+        return learnt, backjump_level
+
+    # Non-Chronological Backjumping
+    def backjump(self, level):
+        if len(self.trail_lim) <= level:
+            return
+
+        # Unassign the literals above the given level, saving their phase.
+        for literal in self.trail[self.trail_lim[level]:]:
+            variable = literal >> 1
+            self.value[literal] = 0
+            self.value[literal ^ 1] = 0
+            self.reason[variable] = None
+            self.polarity[variable] = (literal & 1) == 0
+            heapq.heappush(self.heap, (-self.activity[variable], variable))
+
+        del self.trail[self.trail_lim[level]:]
+        del self.trail_lim[level:]
+        self.qhead = len(self.trail)
+
+    # VSIDS: Increase the activity of a variable involved in a conflict.
+    def bump(self, variable):
+        self.activity[variable] += self.var_inc
+
+        # Rescale the activities to avoid overflow.
+        if self.activity[variable] > 1e100:
+            self.activity = [a * 1e-100 for a in self.activity]
+            self.var_inc *= 1e-100
+            self.heap = [(-self.activity[v], v) for v in range(self.n) if self.value[2 * v] == 0]
+            heapq.heapify(self.heap)
+
+        # Push the updated activity (older entries are discarded when popped).
+        elif self.value[2 * variable] == 0:
+            heapq.heappush(self.heap, (-self.activity[variable], variable))
+
+    def decide(self):
+        # Select the unassigned variable with the highest activity.
+        while self.heap:
+            activity, variable = heapq.heappop(self.heap)
+            if self.value[2 * variable] == 0 and -activity == self.activity[variable]:
+                # Assign the variable according to the saved phase.
+                return 2 * variable + (0 if self.polarity[variable] else 1)
+
+        # The heap may contain only stale entries, so check every variable.
+        for variable in range(self.n):
+            if self.value[2 * variable] == 0:
+                return 2 * variable + (0 if self.polarity[variable] else 1)
+
+        return None
+
+    # Reduce the learnt clauses, removing the longer half that are not reasons for an assignment.
+    def reduce_learnts(self):
+        def locked(index):
+            clause = self.clauses[index]
+            return self.value[clause[0]] == 1 and self.reason[clause[0] >> 1] == index
+
+        self.learnts.sort(key = lambda index: len(self.clauses[index]))
+        keep = len(self.learnts) // 2
+
+        remaining = self.learnts[:keep]
+        for index in self.learnts[keep:]:
+            if locked(index) or len(self.clauses[index]) <= 2:
+                remaining.append(index)
+            else:
+                self.clauses[index] = None
+
+        self.learnts = remaining
+
+    # Assumptions: Literals (signed integers, as in the clause database) that are assumed true for this call only.
+        # The solver may be called again with different assumptions, keeping the learnt clauses.
+    def solve(self, max_conflicts = None, stop = None, assumptions = ()):
+        self.backjump(0)
+
+        if self.unsatisfiable or not self.ok or self.propagate() is not None:
+            self.unsatisfiable = True
+            return None
+
+        assumptions = [2 * (abs(signed) - 1) + (signed < 0) for signed in assumptions]
+
+        self.seen = [False] * self.n
+        max_learnts = len(self.clauses) // 3 + 1000
+
+        restart = 1
+        restart_limit = 100 * luby(restart)
+        restart_conflicts = 0
+
+        while True:
+            conflict = self.propagate()
+
+            if conflict is not None:
+                self.conflicts += 1
+                restart_conflicts += 1
+
+                # A conflict at level 0 proves the clauses are unsatisfiable.
+                if not self.trail_lim:
+                    self.unsatisfiable = True
+                    return None
+
+                if max_conflicts is not None and self.conflicts >= max_conflicts:
+                    return None
+                
+                # Stop early if requested (checked periodically).
+                if stop is not None and self.conflicts % 100 == 0 and stop():
+                    return None
+
+                # Learn a clause, then backjump to the level where it becomes unit.
+                learnt, backjump_level = self.analyze(conflict)
+                self.backjump(backjump_level)
+
+                if len(learnt) == 1:
+                    self.assign(learnt[0], None)
+                else:
+                    index = self.add_clause(learnt, learnt = True)
+                    self.assign(learnt[0], index)
+
+                # Decay the activities (by increasing the amount of future bumps).
+                self.var_inc /= self.var_decay
+
+            else:
+                # Restart according to the Luby sequence.
+                if restart_conflicts >= restart_limit:
+                    self.restarts += 1
+                    restart += 1
+                    restart_limit = 100 * luby(restart)
+                    restart_conflicts = 0
+                    self.backjump(0)
+
+                # Reduce the learnt clauses when there are too many.
+                if len(self.learnts) - len(self.trail) >= max_learnts:
+                    self.reduce_learnts()
+                    max_learnts = int(max_learnts * 1.1)
+
+                literal = None
+
+                # The assumptions are decided first (each at its own level).
+                while len(self.trail_lim) < len(assumptions):
+                    assumption = assumptions[len(self.trail_lim)]
+
+                    # If an assumption is false, there is no model under the assumptions.
+                    if self.value[assumption] == -1:
+                        return None
+
+                    # If an assumption is already true, open an empty level.
+                    if self.value[assumption] == 1:
+                        self.trail_lim.append(len(self.trail))
+                    else:
+                        literal = assumption
+                        break
+
+                if literal is None:
+                    literal = self.decide()
+
+                # If every variable is assigned, the model satisfies the clauses.
+                if literal is None:
+                    return {variable: self.value[2 * variable] == 1 for variable in range(self.n)}
+
+                self.decisions += 1
+                self.trail_lim.append(len(self.trail))
+                self.assign(literal, None)
+
+# Luby Sequence (1, 1, 2, 1, 1, 2, 4, ...)
+def luby(i):
+    # Find the finite subsequence containing the index, along with its size.
+    x = i - 1
+    size, sequence = 1, 0
+    while size < x + 1:
+        sequence += 1
+        size = 2 * size + 1
+
+    # Descend into the subsequence until the index is the last element.
+    while size - 1 != x:
+        size = (size - 1) >> 1
+        sequence -= 1
+        x = x % size
+
+    return 1 << sequence
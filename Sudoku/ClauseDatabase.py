@@ -0,0 +1,187 @@
+# ClauseDatabase.py
+# Contains a compact, integer-encoded store of CNF clauses, along with a loader for CNF files.
+# Carter Kruse (October 24, 2023)
+
+from array import array
+import sys
+import time
+import tracemalloc
+
+class ClauseDatabase:
+    # Constructor
+    def __init__(self):
+        # Literals are signed integers (the variable index offset by one, to avoid '-0').
+        # The literals of every clause are stored in a single flat array, with the start of each clause in 'offsets'.
+        self.literals = array('i')
+        self.offsets = array('i', [0])
+
+        # Mappings between the variable/symbol names and indices.
+        self.variable_to_index = {}
+        self.index_to_variable = {}
+        self.index = 0
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def add_variable(self, name):
+        # If the variable is not already indexed, update the mappings/dictionaries, along with the index.
+        if name not in self.variable_to_index:
+            self.variable_to_index[name] = self.index
+            self.index_to_variable[self.index] = name
+            self.index += 1
+
+        return self.variable_to_index[name]
+
+    def add_clause(self, literals):
+        self.literals.extend(literals)
+        self.offsets.append(len(self.literals))
+
+    def clause(self, i):
+        return self.literals[self.offsets[i]:self.offsets[i + 1]]
+
+    def clauses(self):
+        # Cycle through the clauses, as lists of signed integers.
+        for i in range(len(self)):
+            yield self.literals[self.offsets[i]:self.offsets[i + 1]].tolist()
+
+    def literal(self, name):
+        # Determine the signed integer for a variable/symbol name (with an optional negation).
+        if name.startswith('-'):
+            return -(self.add_variable(name[1:]) + 1)
+        return self.add_variable(name) + 1
+
+    def literal_name(self, literal):
+        return ('-' if literal < 0 else '') + self.index_to_variable[abs(literal) - 1]
+
+    def clause_string(self, i):
+        return ' '.join(self.literal_name(literal) for literal in self.clause(i))
+
+    def copy(self):
+        database = ClauseDatabase()
+        database.literals = array('i', self.literals)
+        database.offsets = array('i', self.offsets)
+        database.variable_to_index = dict(self.variable_to_index)
+        database.index_to_variable = dict(self.index_to_variable)
+        database.index = self.index
+        return database
+
+    def memory_size(self):
+        # The size (in bytes) of the clause buffers.
+        return self.literals.itemsize * len(self.literals) + self.offsets.itemsize * len(self.offsets)
+
+    def load(self, file_name):
+        with open(file_name, 'r') as file:
+            lines = file.readlines()
+
+        # A DIMACS file has a 'p cnf' header, otherwise each line of the file is a clause.
+        if any(line.startswith('p cnf') for line in lines):
+            self.load_dimacs(lines)
+        else:
+            self.load_lines(lines)
+
+    def load_lines(self, lines):
+        # Local references avoid repeated attribute lookups in the loop.
+        variable_to_index = self.variable_to_index
+        literals = self.literals
+        offsets = self.offsets
+
+        # Cycle through the lines of the file, ignoring empty lines.
+        for line in lines:
+            names = line.split()
+            if not names:
+                continue
+
+            for name in names:
+                negated = name.startswith('-')
+                if negated:
+                    name = name[1:]
+
+                index = variable_to_index.get(name)
+                if index is None:
+                    index = self.add_variable(name)
+
+                literals.append(-index - 1 if negated else index + 1)
+
+            offsets.append(len(literals))
+
+    def load_dimacs(self, lines):
+        clause = []
+
+        # Cycle through the lines of the file.
+        for line in lines:
+            # Ignore comments and the header.
+            if line.startswith('c') or line.startswith('p') or line.startswith('%'):
+                if line.startswith('p cnf'):
+                    # Index the variables in order, so the variable 'n' has the index 'n - 1'.
+                    for n in range(1, int(line.split()[2]) + 1):
+                        self.add_variable(str(n))
+                continue
+
+            # Clauses are terminated by '0', and may span multiple lines.
+            for name in line.split():
+                if name == '0':
+                    self.add_clause(clause)
+                    clause = []
+                else:
+                    clause.append(self.literal(name))
+
+        # Include a final clause without a terminating '0'.
+        if clause:
+            self.add_clause(clause)
+
+# The string representation used by the original SAT constructor, for comparison.
+def load_strings(file_name):
+    clauses = []
+    variable_to_index = {}
+    index_to_variable = {}
+    index = 0
+
+    file = open(file_name, 'r')
+    for line in file:
+        clauses.append(line.replace('\n', ''))
+    file.close()
+
+    for clause in clauses:
+        for variable in clause.split():
+            var = variable.replace('-', '') if variable.startswith('-') else variable
+            if var not in variable_to_index:
+                variable_to_index[var] = index
+                index_to_variable[index] = var
+                index += 1
+
+    return clauses, variable_to_index, index_to_variable
+
+def load_database(file_name):
+    database = ClauseDatabase()
+    database.load(file_name)
+    return database
+
+# Benchmark: Loading time and memory of the string representation vs. the clause database.
+def benchmark(file_name, repeat = 20):
+    results = {}
+
+    for name, loader in [('strings', load_strings), ('database', load_database)]:
+        # Determine the average loading time.
+        start = time.perf_counter()
+        for _ in range(repeat):
+            loader(file_name)
+        end = time.perf_counter()
+
+        # Determine the memory allocated by the loaded representation (kept alive until it is measured).
+        tracemalloc.start()
+        kept = loader(file_name)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del kept
+
+        results[name] = ((end - start) / repeat, current, peak)
+
+    return results
+
+if __name__ == "__main__":
+    file_names = sys.argv[1:] if len(sys.argv) > 1 else ['data/rules.cnf', 'data/puzzle_bonus.cnf']
+
+    for file_name in file_names:
+        print(file_name)
+        for name, (seconds, current, peak) in benchmark(file_name).items():
+            print('  {:<9} Load: {:.3g} ms, Memory: {:.1f} KB (Peak: {:.1f} KB)'.format(name, seconds * 1000, current / 1024, peak / 1024))
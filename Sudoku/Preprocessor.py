@@ -0,0 +1,287 @@
+# Preprocessor.py
+# Contains an in-memory preprocessing stage to simplify the clause database before solving.
+# Carter Kruse (October 24, 2023)
+
+from ClauseDatabase import ClauseDatabase
+
+class Preprocessor:
+    # Constructor
+    def __init__(self, database, givens = None, max_occurrences = 10, max_resolvent_length = 20):
+        self.database = database
+
+        # The given (known) values, as variable names with an optional negation (e.g. '115' or '-116').
+        self.givens = givens if givens is not None else []
+
+        # Bounded Variable Elimination: Limits on the number of occurrences and the length of resolvents.
+        self.max_occurrences = max_occurrences
+        self.max_resolvent_length = max_resolvent_length
+
+        # The clauses (sets of signed integers) by identifier, along with the clauses containing each literal.
+        self.clauses = {}
+        self.occurrences = {}
+        self.next_id = 0
+
+        # The values of the variables that are fixed (by unit propagation or as pure literals).
+        self.fixed = {}
+
+        # The steps used to reconstruct the model (in order), either ('fixed', variable) or ('eliminated', variable, clauses).
+        self.steps = []
+
+        # The mapping from the variables of the reduced database to the original variables.
+        self.reduced_to_original = {}
+
+        self.unsatisfiable = False
+
+        # Statistics
+        self.units = 0
+        self.pure_literals = 0
+        self.subsumed = 0
+        self.strengthened = 0
+        self.eliminated = 0
+
+    def add_clause(self, literals):
+        clause = set(literals)
+
+        # Clauses with both a literal and its negation are always satisfied.
+        if any(-literal in clause for literal in clause):
+            return None
+
+        # Remove the literals that are false (and ignore the clause if any literal is true).
+        for literal in list(clause):
+            variable = abs(literal) - 1
+            if variable in self.fixed:
+                if self.fixed[variable] == (literal > 0):
+                    return None
+                clause.discard(literal)
+
+        if not clause:
+            self.unsatisfiable = True
+            return None
+
+        identifier = self.next_id
+        self.next_id += 1
+        self.clauses[identifier] = clause
+
+        for literal in clause:
+            self.occurrences.setdefault(literal, set()).add(identifier)
+
+        if len(clause) == 1:
+            self.queue.append(identifier)
+
+        return identifier
+
+    def remove_clause(self, identifier):
+        for literal in self.clauses.pop(identifier):
+            self.occurrences[literal].discard(identifier)
+
+    def remove_literal(self, identifier, literal):
+        clause = self.clauses[identifier]
+        clause.discard(literal)
+        self.occurrences[literal].discard(identifier)
+
+        if not clause:
+            self.unsatisfiable = True
+        elif len(clause) == 1:
+            self.queue.append(identifier)
+
+    def assign(self, literal):
+        variable = abs(literal) - 1
+        self.fixed[variable] = literal > 0
+        self.steps.append(('fixed', variable))
+
+        # The clauses containing the literal are satisfied.
+        for identifier in list(self.occurrences.get(literal, ())):
+            self.remove_clause(identifier)
+
+        # The negation of the literal is removed from the other clauses.
+        for identifier in list(self.occurrences.get(-literal, ())):
+            self.remove_literal(identifier, -literal)
+
+    # Unit Propagation
+    def propagate(self):
+        changed = False
+
+        while self.queue and not self.unsatisfiable:
+            identifier = self.queue.pop()
+
+            # The clause may have been removed or satisfied since it was queued.
+            if identifier not in self.clauses or len(self.clauses[identifier]) != 1:
+                continue
+
+            literal = next(iter(self.clauses[identifier]))
+            self.assign(literal)
+            self.units += 1
+            changed = True
+
+        return changed
+
+    # Pure Literal Elimination
+    def eliminate_pure_literals(self):
+        changed = False
+
+        for literal in list(self.occurrences):
+            variable = abs(literal) - 1
+
+            # A literal is pure if it occurs, but its negation does not.
+            if variable not in self.fixed and self.occurrences[literal] and not self.occurrences.get(-literal):
+                self.assign(literal)
+                self.pure_literals += 1
+                changed = True
+
+        return changed
+
+    # Subsumption and Self-Subsuming Resolution (Strengthening)
+    def subsume(self):
+        changed = False
+
+        # Cycle through the clauses, from shortest to longest.
+        for identifier in sorted(self.clauses, key = lambda i: len(self.clauses[i])):
+            # The clause may have been removed, or emptied (if the clauses are unsatisfiable).
+            if identifier not in self.clauses or not self.clauses[identifier]:
+                continue
+
+            clause = self.clauses[identifier]
+
+            # Any clause containing this clause is subsumed (check those containing the least frequent literal).
+            literal = min(clause, key = lambda l: len(self.occurrences[l]))
+            for other in list(self.occurrences[literal]):
+                if other != identifier and clause <= self.clauses[other]:
+                    self.remove_clause(other)
+                    self.subsumed += 1
+                    changed = True
+
+            # If the clause with one literal negated is contained in another clause, that literal is removed from the other clause.
+            for literal in list(clause):
+                rest = clause - {literal}
+                for other in list(self.occurrences.get(-literal, ())):
+                    if other in self.clauses and rest <= self.clauses[other]:
+                        self.remove_literal(other, -literal)
+                        self.strengthened += 1
+                        changed = True
+
+            if self.unsatisfiable:
+                break
+
+        return changed
+
+    # Bounded Variable Elimination
+    def eliminate_variables(self):
+        changed = False
+
+        for variable in range(self.database.index):
+            if variable in self.fixed or self.unsatisfiable:
+                continue
+
+            # Empty clauses (if the clauses are unsatisfiable) do not contain the variable, so are never resolved.
+            positive = [identifier for identifier in self.occurrences.get(variable + 1, ()) if self.clauses[identifier]]
+            negative = [identifier for identifier in self.occurrences.get(-(variable + 1), ()) if self.clauses[identifier]]
+
+            if not positive or not negative or len(positive) > self.max_occurrences or len(negative) > self.max_occurrences:
+                continue
+
+            # Determine the (non-tautological) resolvents of the clauses on the variable.
+            resolvents = []
+            bounded = True
+            for p in positive:
+                for n in negative:
+                    resolvent = (self.clauses[p] - {variable + 1}) | (self.clauses[n] - {-(variable + 1)})
+                    if any(-literal in resolvent for literal in resolvent):
+                        continue
+
+                    # The elimination must not increase the number (or size) of clauses too much.
+                    if len(resolvent) > self.max_resolvent_length or len(resolvents) >= len(positive) + len(negative):
+                        bounded = False
+                        break
+
+                    resolvents.append(resolvent)
+
+                if not bounded:
+                    break
+
+            if not bounded:
+                continue
+
+            # Replace the clauses containing the variable with the resolvents.
+            removed = [self.clauses[identifier] for identifier in positive + negative]
+            for identifier in positive + negative:
+                self.remove_clause(identifier)
+
+            self.steps.append(('eliminated', variable, removed))
+            self.eliminated += 1
+            changed = True
+
+            for resolvent in resolvents:
+                self.add_clause(resolvent)
+
+            self.propagate()
+
+        return changed
+
+    def simplify(self):
+        self.queue = []
+
+        # Load the clauses from the database.
+        for clause in self.database.clauses():
+            self.add_clause(clause)
+
+        # The given values are added as unit clauses (the database is not modified, so the names must be known).
+        for name in self.givens:
+            variable = name[1:] if name.startswith('-') else name
+            if variable not in self.database.variable_to_index:
+                raise ValueError("Unknown given: " + name)
+
+            index = self.database.variable_to_index[variable] + 1
+            self.add_clause([-index if name.startswith('-') else index])
+
+        # Apply the preprocessing steps until there is no further change (stopping once the clauses are unsatisfiable).
+        changed = True
+        while changed and not self.unsatisfiable:
+            changed = False
+            for step in (self.propagate, self.eliminate_pure_literals, self.subsume, self.eliminate_variables):
+                changed = step() or changed
+                if self.unsatisfiable:
+                    break
+
+        return self.reduced_database()
+
+    def reduced_database(self):
+        reduced = ClauseDatabase()
+        self.reduced_to_original = {}
+
+        # Index the variables of the remaining clauses (keeping the original names).
+        for identifier in sorted(self.clauses):
+            literals = []
+            for literal in sorted(self.clauses[identifier], key = abs):
+                variable = abs(literal) - 1
+                index = reduced.add_variable(self.database.index_to_variable[variable])
+                self.reduced_to_original[index] = variable
+                literals.append(index + 1 if literal > 0 else -(index + 1))
+
+            reduced.add_clause(literals)
+
+        return reduced
+
+    def extend_model(self, model):
+        # Map the values of the reduced variables to the original variables.
+        extended = {self.reduced_to_original[index]: value for index, value in model.items()}
+
+        # Reconstruct the remaining values in reverse order, so that each step sees the values it depends on.
+        for step in reversed(self.steps):
+            if step[0] == 'fixed':
+                extended[step[1]] = self.fixed[step[1]]
+            else:
+                variable, removed = step[1], step[2]
+
+                # Set the eliminated variable to satisfy every removed clause (which is always possible).
+                extended[variable] = False
+                for clause in removed:
+                    if not any(extended.get(abs(literal) - 1, False) == (literal > 0) for literal in clause):
+                        extended[variable] = True
+                        break
+
+        # Variables that no longer appear in any clause may take any value.
+        return {index: extended.get(index, False) for index in range(self.database.index)}
+
+    def __str__(self):
+        return 'Units: {}, Pure Literals: {}, Subsumed: {}, Strengthened: {}, Eliminated: {}, Clauses: {} -> {}'.format(
+            self.units, self.pure_literals, self.subsumed, self.strengthened, self.eliminated, len(self.database), len(self.clauses))
@@ -2,11 +2,14 @@
 # Contains the methods with respect to the gsat and walksat algorithms.
 # Carter Kruse (October 24, 2023)
 
+from ClauseDatabase import ClauseDatabase
+from CDCL import CDCL
+from Preprocessor import Preprocessor
 import random
 
 class SAT:
     # Constructor
-    def __init__(self, file_name):
+    def __init__(self, file_name = None, database = None):
         # Instance Variables
         self.clauses = []
         self.variable_to_index = {}
@@ -14,32 +17,63 @@ class SAT:
         self.index = 0
         self.model = {}
 
-        # Open the file.
-        file = open(file_name, 'r')
+        # The number of flips made by the last run, and an optional function to stop a run early.
+        self.flips = 0
+        self.stop = None
 
-        # Cycle through the lines of the file.
-        for line in file:
-            # Add each line to the list of clauses.
-            self.clauses.append(line.replace('\n', ''))
-        
-        # Close the file.
-        file.close()
+        # Integer Clauses (Signed Literals, Offset By One To Avoid '-0')
+        self.literal_clauses = []
 
-        # Cycle through the list of clauses.
-        for clause in self.clauses:
-            # Determine the specific variable/symbol in each clause.
-            for variable in clause.split():
-                # Update the variable/symbol to only be positive.
-                var = variable.replace('-', '') if variable.startswith('-') else variable
-
-                # If the variable is not already indexed...
-                if var not in self.variable_to_index:
-                    # Update the mappings/dictionaries, along with the index.
-                    self.variable_to_index[var] = self.index
-                    self.index_to_variable[self.index] = var
-                    self.index += 1
+        # The preprocessing stage, along with a solver for the reduced clauses (see 'preprocess()').
+        self.preprocessor = None
+        self.reduced = None
+
+        # Load the clauses into the (integer-encoded) clause database, unless a database is given.
+        if database is None:
+            database = ClauseDatabase()
+            database.load(file_name)
+        self.database = database
+
+        # Update the mappings/dictionaries, along with the index.
+        self.variable_to_index = self.database.variable_to_index
+        self.index_to_variable = self.database.index_to_variable
+        self.index = self.database.index
+
+        # Cycle through the clauses of the database.
+        for clause in self.database.clauses():
+            # The string form of each clause is used by the 'gsat' and 'walksat' algorithms.
+            self.clauses.append(' '.join(self.database.literal_name(literal) for literal in clause))
+
+            # The integer form of each clause (ignoring duplicate literals) is used by the incremental algorithms.
+            self.literal_clauses.append(list(dict.fromkeys(clause)))
+    
+    def preprocess(self, givens = None):
+        # Simplify the clauses (in memory), with a separate solver for the reduced clauses.
+        self.preprocessor = Preprocessor(self.database, givens)
+        self.reduced = SAT(database = self.preprocessor.simplify())
+        print(self.preprocessor)
     
     def sat(self, p_value, max_flips, algo, h_value):
+        # If the clauses were preprocessed, solve the reduced clauses and map the model back.
+        if self.preprocessor is not None:
+            return self.preprocessed_sat(p_value, max_flips, algo, h_value)
+
+        # The incremental algorithms maintain the clause state between flips.
+        if algo == 'gsat_incremental' or algo == 'walksat_incremental':
+            return self.incremental_sat(p_value, max_flips, algo, h_value)
+        
+        # The NumPy 'gsat' scores every variable at once.
+        if algo == 'gsat_numpy':
+            return self.numpy_sat(p_value, max_flips, h_value)
+        
+        # The clause weighting algorithms adapt the weights of the clauses to escape local minima.
+        if algo == 'saps' or algo == 'paws':
+            return self.weighted_sat(p_value, max_flips, algo)
+        
+        # The complete solver either finds a model or proves that there is none.
+        if algo == 'cdcl':
+            return self.cdcl_sat()
+
         # Create a model with a random assignment of true/false.
         for index in range(self.index):
             # Each symbol in the clauses is represented.
@@ -47,6 +81,8 @@ class SAT:
         
         # Cycle continuously until 'max_flips' is reached.
         for k in range(max_flips):
+            self.flips = k
+
             # If the model satisfies the clauses...
             if self.satisfies_clauses():
                 print("Flips: " + str(k))
@@ -54,6 +90,10 @@ class SAT:
                 # Return the model.
                 return self.model
             
+            # Stop early if requested.
+            if self.stop is not None and self.stop():
+                return None
+            
             # Select a random clause that is false in the model.
             if algo == 'walksat':
                 # The 'random.choice()' is used to select from the false clauses.
@@ -108,6 +148,358 @@ class SAT:
                 highest_variable = random.choice(best_variables)
                 self.model[highest_variable] = not self.model[highest_variable]
     
+    def incremental_sat(self, p_value, max_flips, algo, h_value):
+        # Create a model with a random assignment of true/false.
+        self.values = [random.choice([True, False]) for _ in range(self.index)]
+
+        # Build the occurrence lists, clause counts and scores for the model.
+        self.initialize_incremental(h_value)
+
+        # Cycle continuously until 'max_flips' is reached.
+        for k in range(max_flips):
+            self.flips = k
+
+            # If there are no false clauses, the model satisfies the clauses.
+            if not self.false_list:
+                print("Flips: " + str(k))
+
+                # Update the model (dictionary) from the list of values.
+                self.model = {index: self.values[index] for index in range(self.index)}
+                return self.model
+            
+            # Stop early if requested (checked periodically).
+            if self.stop is not None and k % 1000 == 0 and self.stop():
+                break
+            
+            # Select a random clause that is false in the model.
+            if algo == 'walksat_incremental':
+                random_clause = [abs(literal) - 1 for literal in self.literal_clauses[random.choice(self.false_list)]]
+            
+            # With a given probability, flip a random symbol ('gsat') or a random symbol in the clause ('walksat').
+            if random.random() < p_value:
+                random_index = random.randrange(self.index) if algo == 'gsat_incremental' else random.choice(random_clause)
+                self.flip(random_index)
+            
+            # Otherwise, flip whichever symbol in the clause maximizes the number of satisfied clauses.
+            else:
+                max_score = float('-inf')
+                best_variables = []
+
+                # The change in the score is determined by the make/break counts, without re-scoring the model.
+                loop_set = range(self.index) if algo == 'gsat_incremental' else random_clause
+                for i in loop_set:
+                    current_score = self.make_count[i] - self.break_count[i]
+
+                    # Update the max score if appropriate, along with the best variables/symbols.
+                    if current_score > max_score:
+                        best_variables.clear()
+                        max_score = current_score
+                        best_variables.append(i)
+                    
+                    # Otherwise, simply update the best variables/symbols.
+                    elif current_score == max_score:
+                        best_variables.append(i)
+                
+                # BONUS: To enhance the walksat algorithm, we introduce a further aspect of randomness.
+                if h_value != 0:
+                    if len(best_variables) >= 2:
+                        if random.random() < h_value:
+                            self.flip(random.choice(best_variables))
+                
+                # Flip the variable/symbol with the highest score (using a random choice).
+                self.flip(random.choice(best_variables))
+        
+        # Update the model (dictionary) from the list of values.
+        self.model = {index: self.values[index] for index in range(self.index)}
+    
+    # NumPy GSAT: The make/break counts of every variable are computed in one batched pass over the literal occurrences.
+    def numpy_sat(self, p_value, max_flips, h_value):
+        import numpy as np
+
+        # Ignore the clauses with both a literal and its negation (which are always satisfied).
+        clauses = [clause for clause in self.literal_clauses if not any(-literal in clause for literal in clause)]
+
+        # Literal Occurrences: The variable, sign and clause of every literal (in a flat array).
+        literals = np.array([literal for clause in clauses for literal in clause], dtype = np.int64)
+        occurrence_variable = np.abs(literals) - 1
+        occurrence_sign = literals > 0
+        occurrence_clause = np.repeat(np.arange(len(clauses)), [len(clause) for clause in clauses])
+
+        # The 'h_value' rewards satisfying clauses with fewer literals.
+        weights = np.array([1 / len(clause) if h_value != 0 else 1 for clause in clauses], dtype = np.float64)
+
+        # Create a model with a random assignment of true/false.
+        values = np.array([random.choice([True, False]) for _ in range(self.index)], dtype = bool)
+
+        # Cycle continuously until 'max_flips' is reached.
+        for k in range(max_flips):
+            self.flips = k
+
+            # Determine the number of true literals in each clause.
+            occurrence_true = values[occurrence_variable] == occurrence_sign
+            true_count = np.bincount(occurrence_clause, weights = occurrence_true, minlength = len(clauses))
+            false = true_count == 0
+
+            # If there are no false clauses, the model satisfies the clauses.
+            if not false.any():
+                print("Flips: " + str(k))
+
+                # Update the model (dictionary) from the array of values.
+                self.model = {index: bool(values[index]) for index in range(self.index)}
+                return self.model
+            
+            # Stop early if requested (checked periodically).
+            if self.stop is not None and k % 1000 == 0 and self.stop():
+                break
+            
+            # With a given probability, flip a random symbol.
+            if random.random() < p_value:
+                random_index = random.randrange(self.index)
+                values[random_index] = not values[random_index]
+                continue
+            
+            # Make: Every variable in a false clause. Break: The single true literal of a clause.
+            make = np.bincount(occurrence_variable, weights = (weights * false)[occurrence_clause], minlength = self.index)
+            critical = occurrence_true & (true_count[occurrence_clause] == 1)
+            broken = np.bincount(occurrence_variable[critical], weights = weights[occurrence_clause[critical]], minlength = self.index)
+
+            # Flip the variable/symbol with the highest score (using a random choice).
+            score = make - broken
+            best_variables = np.flatnonzero(score == score.max())
+            highest_variable = best_variables[random.randrange(len(best_variables))]
+            values[highest_variable] = not values[highest_variable]
+        
+        # Update the model (dictionary) from the array of values.
+        self.model = {index: bool(values[index]) for index in range(self.index)}
+    
+    # Clause Weighting: SAPS (Scaling And Probabilistic Smoothing) and PAWS (Pure Additive Weighting Scheme).
+        # The weights of the false clauses increase at local minima, and are periodically smoothed.
+    def weighted_sat(self, p_value, max_flips, algo, alpha = 1.3, rho = 0.8, p_smooth = 0.05, max_increases = 10):
+        # Create a model with a random assignment of true/false.
+        self.values = [random.choice([True, False]) for _ in range(self.index)]
+
+        # Build the occurrence lists, clause counts and (weighted) scores, with every weight equal to 1.
+        self.initialize_incremental(0)
+        increases = 0
+
+        # Cycle continuously until 'max_flips' is reached.
+        for k in range(max_flips):
+            self.flips = k
+
+            # If there are no false clauses, the model satisfies the clauses.
+            if not self.false_list:
+                print("Flips: " + str(k))
+
+                # Update the model (dictionary) from the list of values.
+                self.model = {index: self.values[index] for index in range(self.index)}
+                return self.model
+            
+            # Stop early if requested (checked periodically).
+            if self.stop is not None and k % 1000 == 0 and self.stop():
+                break
+            
+            # Determine the variables in the false clauses with the highest (weighted) score.
+            max_score = float('-inf')
+            best_variables = []
+            for variable in {abs(literal) - 1 for clause in self.false_list for literal in self.literal_clauses[clause]}:
+                current_score = self.make_count[variable] - self.break_count[variable]
+                if current_score > max_score:
+                    best_variables.clear()
+                    max_score = current_score
+                    best_variables.append(variable)
+                elif current_score == max_score:
+                    best_variables.append(variable)
+            
+            # If a flip reduces the (weighted) false clauses, make it.
+            if max_score > 1e-9:
+                self.flip(random.choice(best_variables))
+                continue
+            
+            # Otherwise, this is a local minimum. With a given probability, flip a random variable in a false clause.
+            if random.random() < p_value:
+                self.flip(abs(random.choice(self.literal_clauses[random.choice(self.false_list)])) - 1)
+            
+            # SAPS: Scale the weights of the false clauses, and (with a given probability) smooth every weight towards the mean.
+            elif algo == 'saps':
+                for clause in list(self.false_list):
+                    self.set_weight(clause, self.weights[clause] * alpha)
+
+                if random.random() < p_smooth:
+                    mean = sum(self.weights) / len(self.weights)
+                    for clause in range(len(self.weights)):
+                        self.set_weight(clause, rho * self.weights[clause] + (1 - rho) * mean)
+            
+            # PAWS: Increase the weights of the false clauses, and periodically decrease every weight above 1.
+            else:
+                for clause in list(self.false_list):
+                    self.set_weight(clause, self.weights[clause] + 1)
+
+                increases += 1
+                if increases % max_increases == 0:
+                    for clause in range(len(self.weights)):
+                        if self.weights[clause] > 1:
+                            self.set_weight(clause, self.weights[clause] - 1)
+        
+        # Update the model (dictionary) from the list of values.
+        self.model = {index: self.values[index] for index in range(self.index)}
+    
+    def set_weight(self, clause, weight):
+        delta = weight - self.weights[clause]
+        self.weights[clause] = weight
+
+        # Update the make/break counts that include the weight of the clause (a tautology is in neither).
+        if self.tautologies[clause]:
+            return
+        if self.true_count[clause] == 0:
+            for literal in self.literal_clauses[clause]:
+                self.make_count[abs(literal) - 1] += delta
+        elif self.true_count[clause] == 1:
+            self.break_count[self.true_sum[clause]] += delta
+    
+    def preprocessed_sat(self, p_value, max_flips, algo, h_value):
+        if self.preprocessor.unsatisfiable:
+            print("Unsatisfiable")
+            return None
+        
+        self.reduced.stop = self.stop
+        result = self.reduced.sat(p_value, max_flips, algo, h_value)
+        self.flips = self.reduced.flips
+
+        if result is None:
+            return None
+        
+        self.model = self.preprocessor.extend_model(result)
+        return self.model
+    
+    def cdcl_sat(self):
+        solver = CDCL(self.database)
+        result = solver.solve(stop = self.stop)
+        self.flips = solver.conflicts
+
+        print("Conflicts: " + str(solver.conflicts) + ", Decisions: " + str(solver.decisions) + ", Restarts: " + str(solver.restarts))
+
+        # If there is no model, the clauses are unsatisfiable (unless the solver was stopped early).
+        if result is None:
+            if solver.unsatisfiable:
+                print("Unsatisfiable")
+            return None
+        
+        self.model = result
+        return self.model
+    
+    def initialize_incremental(self, h_value):
+        # Occurrence lists: the clauses containing each variable positively and negatively.
+        self.positive_occurrences = [[] for _ in range(self.index)]
+        self.negative_occurrences = [[] for _ in range(self.index)]
+
+        # For each clause, the number of true literals and the sum of the variables of those literals.
+            # When exactly one literal is true, the sum is the variable that would break the clause.
+        self.true_count = [0] * len(self.literal_clauses)
+        self.true_sum = [0] * len(self.literal_clauses)
+
+        # The 'h_value' rewards satisfying clauses with fewer literals.
+        self.weights = [1 / len(clause) if h_value != 0 and clause else 1 for clause in self.literal_clauses]
+
+        # Make: (weighted) false clauses that flipping the variable satisfies.
+        # Break: (weighted) true clauses that flipping the variable falsifies.
+        self.make_count = [0] * self.index
+        self.break_count = [0] * self.index
+
+        # The set of false clauses, as a list with positions for constant time removal.
+        self.false_list = []
+        self.false_position = [-1] * len(self.literal_clauses)
+
+        # The clauses that are always satisfied (not included in the counts above).
+        self.tautologies = [False] * len(self.literal_clauses)
+
+        # Cycle through the clauses.
+        for clause, literals in enumerate(self.literal_clauses):
+            # Clauses with both a literal and its negation are always satisfied.
+            if any(-literal in literals for literal in literals):
+                self.tautologies[clause] = True
+                continue
+
+            for literal in literals:
+                variable = abs(literal) - 1
+
+                # Update the occurrence lists.
+                if literal > 0:
+                    self.positive_occurrences[variable].append(clause)
+                else:
+                    self.negative_occurrences[variable].append(clause)
+                
+                # Update the true literal count/sum.
+                if self.values[variable] == (literal > 0):
+                    self.true_count[clause] += 1
+                    self.true_sum[clause] += variable
+            
+            # Update the make/break counts according to the state of the clause.
+            if self.true_count[clause] == 0:
+                self.add_false_clause(clause)
+                for literal in literals:
+                    self.make_count[abs(literal) - 1] += self.weights[clause]
+            elif self.true_count[clause] == 1:
+                self.break_count[self.true_sum[clause]] += self.weights[clause]
+    
+    def flip(self, variable):
+        # Flip the symbol within the model.
+        value = not self.values[variable]
+        self.values[variable] = value
+
+        # Determine the clauses where the literal becomes true, and where it becomes false.
+        made = self.positive_occurrences[variable] if value else self.negative_occurrences[variable]
+        broken = self.negative_occurrences[variable] if value else self.positive_occurrences[variable]
+
+        # Cycle through the clauses where the literal becomes true.
+        for clause in made:
+            weight = self.weights[clause]
+            count = self.true_count[clause]
+
+            # The clause becomes satisfied, so no variable in it makes it anymore.
+            if count == 0:
+                self.remove_false_clause(clause)
+                for literal in self.literal_clauses[clause]:
+                    self.make_count[abs(literal) - 1] -= weight
+                self.break_count[variable] += weight
+            
+            # The single true literal of the clause is no longer critical.
+            elif count == 1:
+                self.break_count[self.true_sum[clause]] -= weight
+            
+            self.true_count[clause] = count + 1
+            self.true_sum[clause] += variable
+        
+        # Cycle through the clauses where the literal becomes false.
+        for clause in broken:
+            weight = self.weights[clause]
+            count = self.true_count[clause] - 1
+            self.true_count[clause] = count
+            self.true_sum[clause] -= variable
+
+            # The clause becomes false, so every variable in it makes it.
+            if count == 0:
+                self.add_false_clause(clause)
+                for literal in self.literal_clauses[clause]:
+                    self.make_count[abs(literal) - 1] += weight
+                self.break_count[variable] -= weight
+            
+            # The remaining true literal of the clause becomes critical.
+            elif count == 1:
+                self.break_count[self.true_sum[clause]] += weight
+    
+    def add_false_clause(self, clause):
+        self.false_position[clause] = len(self.false_list)
+        self.false_list.append(clause)
+    
+    def remove_false_clause(self, clause):
+        # Swap the last false clause into the position of the removed clause.
+        position = self.false_position[clause]
+        last = self.false_list.pop()
+        if last != clause:
+            self.false_list[position] = last
+            self.false_position[last] = position
+        self.false_position[clause] = -1
+    
     def score_model(self, h_value):
         score = 0
 
@@ -117,7 +509,7 @@ class SAT:
             if self.satisfies(clause):
                 # The 'h_value' is used only in an advanced algorithm.
                 if h_value != 0:
-                    score += 1 / len(clause)
+                    score += 1 / len(clause.split())
                 else:
                     score += 1
         
@@ -2,19 +2,33 @@
 # Contains the methods with respect to the Sudoku puzzle.
 # Carter Kruse (October 24, 2023)
 
+from ClauseDatabase import ClauseDatabase
+
 class Sudoku:
-    def __init__(self):
-        self.numbers = [[0 for _ in range(9)] for _ in range(9)]
+    def __init__(self, size = 9):
+        self.resize(size)
+    
+    def resize(self, size):
+        # The board is 'size' x 'size' (n^2 x n^2), with 'block' x 'block' (n x n) blocks.
+        self.size = size
+        self.block = int(round(size ** 0.5))
+        self.numbers = [[0 for _ in range(size)] for _ in range(size)]
     
     def load(self, file_name):
         file = open(file_name, 'r')
         r = 1
         for line in file:
+            # The size of the board is determined by the first line.
+            if r == 1 and len(line.split()) != self.size:
+                self.resize(len(line.split()))
+
             c = 1
             for s in line.split():
                 self.set(r, c, int(s))
                 c += 1
             r += 1
+        
+        file.close()
     
     def get(self, r, c):
         return self.numbers[r - 1][c - 1]
@@ -26,25 +40,28 @@ class Sudoku:
         file = open(file_name, 'r')
         for line in file:
             # Ignore Unset Variables
-            literal = int(line)
-            if literal > 0:
-                r = int(line[0])
-                c = int(line[1])
-                v = int(line[2])
+            line = line.strip()
+            if line and not line.startswith('-'):
+                # Larger boards separate the row, column and value (e.g. '12_3_16').
+                if '_' in line:
+                    r, c, v = [int(part) for part in line.split('_')]
+                else:
+                    r, c, v = int(line[0]), int(line[1]), int(line[2])
                 self.set(r, c, v)
         
         file.close()
     
     def __str__(self):
         s = ''
-        for r in range(1, 10):
-            if r == 4 or r == 7:
-                s += '---------------------\n'
+        width = len(str(self.size))
+        for r in range(1, self.size + 1):
+            if r != 1 and (r - 1) % self.block == 0:
+                s += '-' * ((width + 1) * self.size + 2 * (self.block - 1) - 1) + '\n'
             
-            for c in range(1, 10):
-                if c == 4 or c == 7:
+            for c in range(1, self.size + 1):
+                if c != 1 and (c - 1) % self.block == 0:
                     s += '| '
-                s = s + str(self.get(r, c))
+                s = s + str(self.get(r, c)).rjust(width)
                 s += ' '
             
             s += '\n'
@@ -52,6 +69,9 @@ class Sudoku:
         return s
     
     def sudoku_literal(self, r, c, v, neg = False):
+        # Larger boards separate the row, column and value, since they may have multiple digits.
+        if self.size > 9:
+            return ('-' if neg else '') + str(r) + '_' + str(c) + '_' + str(v)
         return ('-' if neg else '') + str(r) + str(c) + str(v)
     
     def cell_clause(self, r, c):
@@ -59,14 +79,14 @@ class Sudoku:
 
         # At least one value...
         atleastone_str = ''
-        for value in range(1, 10):
+        for value in range(1, self.size + 1):
             atleastone_str += self.sudoku_literal(r, c, value) + ' '
         atleastone_str += ' \n'
 
         s = atleastone_str
 
-        for vi in range(1, 10):
-            for vj in range(vi + 1, 10):
+        for vi in range(1, self.size + 1):
+            for vj in range(vi + 1, self.size + 1):
                 s += self.sudoku_literal(r, c, vi, neg = True) + ' '
                 s += self.sudoku_literal(r, c, vj, neg = True) + ' '
                 s += '\n'
@@ -75,8 +95,8 @@ class Sudoku:
     
     def row_clause(self, r):
         s = ''
-        for value in range(1, 10):
-            for c in range(1, 10):
+        for value in range(1, self.size + 1):
+            for c in range(1, self.size + 1):
                 s += self.sudoku_literal(r, c, value) + ' '
             s += '\n'
         
@@ -84,8 +104,8 @@ class Sudoku:
     
     def col_clause(self, c):
         s = ''
-        for value in range(1, 10):
-            for r in range(1, 10):
+        for value in range(1, self.size + 1):
+            for r in range(1, self.size + 1):
                 s += self.sudoku_literal(r, c, value) + ' '
             s += '\n'
         
@@ -94,11 +114,11 @@ class Sudoku:
     def write_block_clauses(self, file_handle):
         s = ''
 
-        for sr in range(1, 10, 3):
-            for sc in range(1, 10, 3):
-                for value in range(1, 10):
-                    for r_offset in range(3):
-                        for c_offset in range(3):
+        for sr in range(1, self.size + 1, self.block):
+            for sc in range(1, self.size + 1, self.block):
+                for value in range(1, self.size + 1):
+                    for r_offset in range(self.block):
+                        for c_offset in range(self.block):
                             r = sr + r_offset
                             c = sc + c_offset
                             s += self.sudoku_literal(r, c, value) + ' '
@@ -109,8 +129,8 @@ class Sudoku:
     
     def write_fixed_clauses(self, filehandle):
         s = ''
-        for r in range(1, 10):
-            for c in range(1, 10):
+        for r in range(1, self.size + 1):
+            for c in range(1, self.size + 1):
                 value = self.get(r, c)
                 if value !=  0:
                     s += self.sudoku_literal(r, c, value) + '\n'
@@ -118,21 +138,90 @@ class Sudoku:
         filehandle.write(s)
     
     def write_col_clauses(self, filehandle):
-        for c in range(1, 10):
+        for c in range(1, self.size + 1):
             clause = self.col_clause(c)
             filehandle.write(clause)
     
     def write_row_clauses(self, filehandle):
-        for r in range(1, 10):
+        for r in range(1, self.size + 1):
             clause = self.row_clause(r)
             filehandle.write(clause)
     
     def write_cell_clauses(self, filehandle):
-        for r in range(1, 10):
-            for c in range(1, 10):
+        for r in range(1, self.size + 1):
+            for c in range(1, self.size + 1):
                 clause = self.cell_clause(r, c)
                 filehandle.write(clause)
     
+    # Integer Clauses: The variable for (r, c, v) has the index ((r - 1) * size + (c - 1)) * size + (v - 1).
+        # The literals are signed integers (the index offset by one), as in the clause database.
+    def sudoku_variable(self, r, c, v, neg = False):
+        index = ((r - 1) * self.size + (c - 1)) * self.size + (v - 1)
+        return -(index + 1) if neg else index + 1
+    
+    def cell_clauses(self):
+        for r in range(1, self.size + 1):
+            for c in range(1, self.size + 1):
+                # At least one value...
+                yield [self.sudoku_variable(r, c, value) for value in range(1, self.size + 1)]
+
+                # At most one value...
+                for vi in range(1, self.size + 1):
+                    for vj in range(vi + 1, self.size + 1):
+                        yield [self.sudoku_variable(r, c, vi, neg = True), self.sudoku_variable(r, c, vj, neg = True)]
+    
+    def group_clauses(self, groups, at_most_one):
+        for group in groups:
+            for value in range(1, self.size + 1):
+                # At least one cell in the group has the value...
+                yield [self.sudoku_variable(r, c, value) for r, c in group]
+
+                # At most one cell in the group has the value (implied by the other rules, though it helps propagation).
+                if at_most_one:
+                    for i in range(len(group)):
+                        for j in range(i + 1, len(group)):
+                            yield [self.sudoku_variable(*group[i], value, neg = True), self.sudoku_variable(*group[j], value, neg = True)]
+    
+    def fixed_clauses(self):
+        for r in range(1, self.size + 1):
+            for c in range(1, self.size + 1):
+                value = self.get(r, c)
+                if value != 0:
+                    yield [self.sudoku_variable(r, c, value)]
+    
+    def rule_clauses(self, at_most_one = False):
+        rows = [[(r, c) for c in range(1, self.size + 1)] for r in range(1, self.size + 1)]
+        cols = [[(r, c) for r in range(1, self.size + 1)] for c in range(1, self.size + 1)]
+        blocks = [[(sr + r_offset, sc + c_offset) for r_offset in range(self.block) for c_offset in range(self.block)]
+                  for sr in range(1, self.size + 1, self.block) for sc in range(1, self.size + 1, self.block)]
+        
+        # The same clauses (in the same order) as 'generate_cnf()'.
+        yield from self.cell_clauses()
+        yield from self.group_clauses(rows, at_most_one)
+        yield from self.group_clauses(cols, at_most_one)
+        yield from self.group_clauses(blocks, at_most_one)
+    
+    def clause_database(self, database = None, fixed = True, at_most_one = False):
+        # Emit the clauses directly into the (integer-encoded) clause database, without writing a CNF file.
+        if database is None:
+            database = ClauseDatabase()
+        
+        # Index the variables in order, so the literals match 'sudoku_variable()'.
+        if database.index == 0:
+            for r in range(1, self.size + 1):
+                for c in range(1, self.size + 1):
+                    for v in range(1, self.size + 1):
+                        database.add_variable(self.sudoku_literal(r, c, v))
+        
+        for clause in self.rule_clauses(at_most_one):
+            database.add_clause(clause)
+        
+        if fixed:
+            for clause in self.fixed_clauses():
+                database.add_clause(clause)
+        
+        return database
+    
     def generate_cnf(self, filename):
         f = open(filename, 'w')
         self.write_cell_clauses(f)
@@ -0,0 +1,139 @@
+# batch_solve.py
+# Solves a corpus of Sudoku puzzles (one per line, or a directory of .sud files) across a pool of workers.
+# Carter Kruse (October 24, 2023)
+
+from Sudoku import Sudoku
+from CDCL import CDCL
+import multiprocessing
+import os
+import sys
+import time
+
+# Each worker keeps a solver for the rules of each board size, which are identical for every puzzle.
+    # Only the given values of each puzzle are added (as assumptions), so the learnt clauses are shared.
+solvers = {}
+
+def rules_solver(size):
+    if size not in solvers:
+        sudoku = Sudoku(size)
+        solvers[size] = (sudoku, CDCL(sudoku.clause_database(fixed = False, at_most_one = True)))
+
+    return solvers[size]
+
+def solve_puzzle(puzzle):
+    name, size, givens = puzzle
+
+    # An invalid puzzle (with the size None) is reported with the error, rather than solved.
+    if size is None:
+        return name, givens
+
+    sudoku, solver = rules_solver(size)
+
+    # The given values are assumed true for this puzzle only.
+    model = solver.solve(assumptions = [sudoku.sudoku_variable(r, c, v) for r, c, v in givens])
+
+    if model is None:
+        return name, None
+
+    # Determine the value of each cell from the model.
+    values = []
+    for r in range(1, size + 1):
+        for c in range(1, size + 1):
+            values.append(next(v for v in range(1, size + 1) if model[sudoku.sudoku_variable(r, c, v) - 1]))
+
+    return name, values
+
+def parse_puzzle(line):
+    # Puzzles are either whitespace-separated numbers, or one character per cell ('0' or '.' for an empty cell).
+    cells = line.split() if len(line.split()) > 1 else list(line.strip())
+    size = int(round(len(cells) ** 0.5))
+
+    if size * size != len(cells):
+        raise ValueError('Invalid Puzzle: ' + line.strip())
+
+    # The board is made of square blocks, so the size must be a square (as for the .sud files).
+    if int(round(size ** 0.5)) ** 2 != size:
+        raise ValueError('Invalid Puzzle Size: ' + str(size))
+
+    givens = []
+    for i, cell in enumerate(cells):
+        if cell not in ('0', '.'):
+            if not cell.isdigit() or not 1 <= int(cell) <= size:
+                raise ValueError('Invalid Cell: ' + cell)
+            givens.append((i // size + 1, i % size + 1, int(cell)))
+
+    return size, givens
+
+def read_puzzles(source):
+    # A directory of .sud files.
+    if os.path.isdir(source):
+        for file_name in sorted(os.listdir(source)):
+            if file_name.endswith('.sud'):
+                # A malformed file is reported (as invalid), without stopping the other puzzles.
+                try:
+                    sudoku = Sudoku()
+                    sudoku.load(os.path.join(source, file_name))
+                    if sudoku.block * sudoku.block != sudoku.size:
+                        raise ValueError('Invalid Puzzle Size: ' + str(sudoku.size))
+                    if any(not 0 <= sudoku.get(r, c) <= sudoku.size for r in range(1, sudoku.size + 1) for c in range(1, sudoku.size + 1)):
+                        raise ValueError('Invalid Cell Value')
+                except (ValueError, IndexError) as error:
+                    yield file_name, None, str(error)
+                    continue
+
+                givens = [(r, c, sudoku.get(r, c)) for r in range(1, sudoku.size + 1) for c in range(1, sudoku.size + 1) if sudoku.get(r, c) != 0]
+                yield file_name, sudoku.size, givens
+
+    # A stream of puzzles (one per line), from a file or the standard input ('-').
+    else:
+        file = sys.stdin if source == '-' else open(source, 'r')
+
+        for number, line in enumerate(file, 1):
+            if line.strip() and not line.startswith('#'):
+                # A malformed line is reported (as invalid), without stopping the other puzzles.
+                try:
+                    size, givens = parse_puzzle(line)
+                except ValueError as error:
+                    size, givens = None, str(error)
+                yield 'line ' + str(number), size, givens
+
+        if file is not sys.stdin:
+            file.close()
+
+def format_solution(values):
+    # Single digits are written as a string (as in the input), otherwise as whitespace-separated numbers.
+    if max(values) <= 9:
+        return ''.join(str(value) for value in values)
+    return ' '.join(str(value) for value in values)
+
+def batch_solve(source, workers = None, chunk_size = 8, output = sys.stdout):
+    start_time = time.time()
+    solved, unsolvable, invalid = 0, 0, 0
+
+    with multiprocessing.Pool(workers) as pool:
+        # Stream the results as they finish (in any order).
+        for name, values in pool.imap_unordered(solve_puzzle, read_puzzles(source), chunk_size):
+            if isinstance(values, str):
+                invalid += 1
+                output.write(name + ' Invalid (' + values + ')\n')
+            elif values is None:
+                unsolvable += 1
+                output.write(name + ' Unsolvable\n')
+            else:
+                solved += 1
+                output.write(name + ' ' + format_solution(values) + '\n')
+
+    seconds = time.time() - start_time
+    return solved, unsolvable, invalid, seconds
+
+if __name__ == '__main__':
+    # Usage: python3 batch_solve.py <puzzle_file | directory | -> [workers]
+    source = sys.argv[1] if len(sys.argv) > 1 else 'data'
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    solved, unsolvable, invalid, seconds = batch_solve(source, workers)
+
+    # Report the throughput (to the standard error, so the solutions may be redirected).
+    total = solved + unsolvable
+    sys.stderr.write('Solved: {}, Unsolvable: {}, Invalid: {}, Time: {:.3f} Seconds, Throughput: {:.1f} Puzzles/Second\n'.format(
+        solved, unsolvable, invalid, seconds, total / seconds if seconds > 0 else 0))
@@ -0,0 +1,125 @@
+# benchmark.py
+# Benchmarks the SAT algorithms over the CNF files in 'data', writing the results as JSON and CSV.
+# Carter Kruse (October 24, 2023)
+
+from SAT import SAT
+import argparse
+import contextlib
+import csv
+import io
+import json
+import multiprocessing
+import platform
+import random
+import resource
+import statistics
+import time
+
+FILES = ['one_cell', 'all_cells', 'rows', 'rows_and_cols', 'rules', 'puzzle1', 'puzzle2', 'puzzle_bonus', 'queens', 'map_coloring']
+ALGORITHMS = ['gsat', 'walksat', 'gsat_incremental', 'walksat_incremental', 'gsat_numpy', 'saps', 'paws', 'cdcl']
+
+# The probability of a random flip for each algorithm (the clause weighting algorithms only use it at local minima).
+P_VALUES = {'saps': 0.01, 'paws': 0.01}
+
+def run(configuration):
+    file, algo, seed, max_flips, time_limit = configuration
+
+    # Each run is in a fresh process, so the peak memory (resident set size) is for the run alone.
+    random.seed(seed)
+    start_time = time.time()
+
+    sat = SAT('data/' + file + '.cnf')
+
+    # Stop the run once the time limit is reached.
+    sat.stop = lambda: time.time() - start_time > time_limit
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = sat.sat(p_value = P_VALUES.get(algo, 0.3), max_flips = max_flips, algo = algo, h_value = 0)
+
+    seconds = time.time() - start_time
+
+    return {
+        'file': file,
+        'algo': algo,
+        'seed': seed,
+        'solved': result is not None,
+        'flips': sat.flips, # The number of conflicts, for 'cdcl'.
+        'seconds': seconds,
+        'flips_per_second': sat.flips / seconds if seconds > 0 else 0,
+        'peak_memory_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+def summarize(runs):
+    summary = []
+
+    # Group the runs by file and algorithm.
+    groups = {}
+    for result in runs:
+        groups.setdefault((result['file'], result['algo']), []).append(result)
+
+    for (file, algo), results in groups.items():
+        solved = [result for result in results if result['solved']]
+
+        summary.append({
+            'file': file,
+            'algo': algo,
+            'runs': len(results),
+            'success_rate': len(solved) / len(results),
+            'median_time_to_solution': statistics.median(result['seconds'] for result in solved) if solved else None,
+            'median_flips_to_solution': statistics.median(result['flips'] for result in solved) if solved else None,
+            'mean_flips_per_second': statistics.mean(result['flips_per_second'] for result in results),
+            'peak_memory_kb': max(result['peak_memory_kb'] for result in results),
+        })
+
+    return summary
+
+def write_results(output, runs, summary, arguments):
+    # JSON: The individual runs, the summary, and the settings (for tracking regressions over time).
+    with open(output + '.json', 'w') as file:
+        json.dump({
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'settings': vars(arguments),
+            'summary': summary,
+            'runs': runs,
+        }, file, indent = 2)
+
+    # CSV: The individual runs.
+    with open(output + '.csv', 'w', newline = '') as file:
+        writer = csv.DictWriter(file, fieldnames = list(runs[0].keys()))
+        writer.writeheader()
+        writer.writerows(runs)
+
+def print_summary(summary):
+    print('File            Algorithm             Success  Time (Median)  Flips/Second  Memory (KB)')
+    for row in summary:
+        time_to_solution = '{:.3f}'.format(row['median_time_to_solution']) if row['median_time_to_solution'] is not None else '-'
+        print('{:<15} {:<21} {:<8.0%} {:<14} {:<13.0f} {}'.format(
+            row['file'], row['algo'], row['success_rate'], time_to_solution, row['mean_flips_per_second'], row['peak_memory_kb']))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Benchmark the SAT algorithms over the CNF files in data.')
+    parser.add_argument('--files', nargs = '+', default = FILES)
+    parser.add_argument('--algorithms', nargs = '+', default = ALGORITHMS)
+    parser.add_argument('--seeds', nargs = '+', type = int, default = [1, 2, 3])
+    parser.add_argument('--max-flips', type = int, default = 100000)
+    parser.add_argument('--time-limit', type = float, default = 10, help = 'Seconds per run.')
+    parser.add_argument('--output', default = 'benchmark_results', help = 'Prefix of the JSON and CSV files.')
+    arguments = parser.parse_args()
+
+    configurations = [(file, algo, seed, arguments.max_flips, arguments.time_limit)
+                      for file in arguments.files for algo in arguments.algorithms for seed in arguments.seeds]
+
+    # Run one configuration at a time (so the timings are not affected by each other), each in a fresh process.
+    runs = []
+    with multiprocessing.Pool(1, maxtasksperchild = 1) as pool:
+        for result in pool.imap(run, configurations):
+            print('{file} {algo} (Seed {seed}): Solved: {solved}, Flips: {flips}, Time: {seconds:.3f}'.format(**result))
+            runs.append(result)
+
+    summary = summarize(runs)
+    print()
+    print_summary(summary)
+
+    write_results(arguments.output, runs, summary, arguments)
+    print('Output Files: ' + arguments.output + '.json, ' + arguments.output + '.csv')
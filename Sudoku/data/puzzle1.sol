@@ -21,23 +21,23 @@
 -133
 -134
 -135
--136
+136
 -137
-138
+-138
 -139
 -141
--142
+142
 -143
-144
+-144
 -145
 -146
 -147
 -148
 -149
 -151
-152
+-152
 -153
--154
+154
 -155
 -156
 -157
@@ -45,14 +45,14 @@
 -159
 -161
 -162
--163
+163
 -164
 -165
-166
+-166
 -167
 -168
 -169
-171
+-171
 -172
 -173
 -174
@@ -60,10 +60,10 @@
 -176
 -177
 -178
--179
--181
+179
+181
 -182
-183
+-183
 -184
 -185
 -186
@@ -77,19 +77,19 @@
 -195
 -196
 -197
--198
-199
--211
+198
+-199
+211
 -212
 -213
 -214
 -215
-216
+-216
 -217
 -218
 -219
-221
--222
+-221
+222
 -223
 -224
 -225
@@ -111,8 +111,8 @@
 -243
 -244
 -245
--246
-247
+246
+-247
 -248
 -249
 -251
@@ -126,12 +126,12 @@
 259
 -261
 -262
-263
+-263
 -264
 -265
 -266
 -267
--268
+268
 -269
 -271
 -272
@@ -143,50 +143,50 @@
 -278
 -279
 -281
-282
+-282
 -283
 -284
 -285
 -286
--287
+287
 -288
 -289
 -291
 -292
--293
+293
 -294
 -295
 -296
 -297
-298
+-298
 -299
 -311
 -312
--313
+313
 -314
 -315
 -316
 -317
 -318
-319
+-319
 -321
-322
+-322
 -323
 -324
 -325
 -326
 -327
--328
+328
 -329
 -331
 -332
-333
+-333
 -334
 -335
 -336
 -337
 -338
--339
+339
 341
 -342
 -343
@@ -200,27 +200,27 @@
 -352
 -353
 -354
--355
+355
 -356
 -357
-358
+-358
 -359
 -361
 -362
 -363
 -364
-365
+-365
 -366
--367
+367
 -368
 -369
 -371
 -372
 -373
--374
+374
 -375
 -376
-377
+-377
 -378
 -379
 -381
@@ -233,9 +233,9 @@
 -388
 -389
 -391
--392
+392
 -393
-394
+-394
 -395
 -396
 -397
@@ -252,9 +252,9 @@
 -419
 -421
 -422
-423
+-423
 -424
--425
+425
 -426
 -427
 -428
@@ -270,9 +270,9 @@
 -439
 -441
 -442
--443
+443
 -444
-445
+-445
 -446
 -447
 -448
@@ -298,31 +298,31 @@
 -471
 -472
 -473
-474
+-474
 -475
 -476
--477
+477
 -478
 -479
 -481
 -482
 -483
--484
+484
 -485
 -486
 -487
 -488
-489
+-489
 -491
 -492
 -493
 -494
 -495
 -496
-497
+-497
 -498
--499
-511
+499
+-511
 -512
 -513
 -514
@@ -330,17 +330,17 @@
 -516
 -517
 -518
--519
+519
 -521
 -522
 -523
--524
+524
 -525
-526
+-526
 -527
 -528
 -529
--531
+531
 -532
 -533
 -534
@@ -348,7 +348,7 @@
 -536
 -537
 -538
-539
+-539
 -541
 -542
 -543
@@ -370,8 +370,8 @@
 -561
 -562
 -563
-564
--565
+-564
+565
 -566
 -567
 -568
@@ -386,20 +386,20 @@
 -578
 -579
 -581
--582
+582
 -583
 -584
-585
+-585
 -586
 -587
 -588
 -589
 -591
-592
+-592
 -593
 -594
 -595
--596
+596
 -597
 -598
 -599
@@ -415,33 +415,33 @@
 -621
 -622
 -623
-624
+-624
 -625
--626
+626
 -627
 -628
 -629
 -631
 -632
--633
+633
 -634
-635
+-635
 -636
 -637
 -638
 -639
 -641
-642
+-642
 -643
--644
+644
 -645
 -646
 -647
 -648
 -649
 -651
--652
-653
+652
+-653
 -654
 -655
 -656
@@ -466,34 +466,34 @@
 -677
 678
 -679
-681
+-681
 -682
 -683
 -684
--685
+685
 -686
 -687
 -688
 -689
--691
+691
 -692
 -693
 -694
 -695
-696
+-696
 -697
 -698
 -699
 -711
 -712
 -713
-714
+-714
 -715
--716
+716
 -717
 -718
 -719
--721
+721
 -722
 -723
 -724
@@ -501,30 +501,30 @@
 -726
 -727
 -728
-729
-731
+-729
+-731
 -732
 -733
 -734
 -735
 -736
 -737
--738
+738
 -739
 -741
 -742
 -743
 -744
--745
-746
+745
+-746
 -747
 -748
 -749
 -751
 -752
--753
+753
 -754
-755
+-755
 -756
 -757
 -758
@@ -532,11 +532,11 @@
 -761
 -762
 -763
--764
+764
 -765
 -766
 -767
-768
+-768
 -769
 -771
 772
@@ -553,22 +553,22 @@
 -784
 -785
 -786
-787
+-787
 -788
--789
+789
 -791
 -792
-793
+-793
 -794
 -795
 -796
--797
+797
 -798
 -799
 -811
-812
+-812
 -813
--814
+814
 -815
 -816
 -817
@@ -576,31 +576,31 @@
 -819
 -821
 -822
--823
+823
 -824
 -825
 -826
 -827
-828
+-828
 -829
 -831
 -832
 -833
 -834
 -835
-836
--837
+-836
+837
 -838
 -839
 -841
 -842
-843
+-843
 -844
 -845
 -846
 -847
 -848
--849
+849
 851
 -852
 -853
@@ -611,12 +611,12 @@
 -858
 -859
 -861
--862
+862
 -863
 -864
 -865
 -866
-867
+-867
 -868
 -869
 -871
@@ -624,18 +624,18 @@
 -873
 -874
 -875
--876
+876
 -877
 -878
-879
+-879
 -881
 -882
 -883
-884
+-884
 -885
 -886
 -887
--888
+888
 -889
 -891
 -892
@@ -647,8 +647,8 @@
 -898
 -899
 -911
--912
-913
+912
+-913
 -914
 -915
 -916
@@ -659,18 +659,18 @@
 -922
 -923
 -924
-925
+-925
 -926
 -927
 -928
--929
+929
 -931
 -932
 -933
 -934
--935
+935
 -936
-937
+-937
 -938
 -939
 -941
@@ -679,49 +679,49 @@
 -944
 -945
 -946
--947
+947
 -948
-949
+-949
 -951
 -952
 -953
-954
+-954
 -955
 -956
 -957
--958
+958
 -959
 -961
-962
+-962
 -963
 -964
 -965
--966
+966
 -967
 -968
 -969
--971
+971
 -972
 -973
 -974
 -975
-976
+-976
 -977
 -978
 -979
 -981
 -982
--983
+983
 -984
 -985
 -986
 -987
-988
+-988
 -989
-991
+-991
 -992
 -993
--994
+994
 -995
 -996
 -997
@@ -0,0 +1,126 @@
+# portfolio.py
+# Runs a portfolio of independent SAT solvers (with different seeds, parameters and algorithms) across the CPU cores.
+# Carter Kruse (October 24, 2023)
+
+from SAT import SAT
+from solve import display_sudoku_solution
+import contextlib
+import io
+import multiprocessing
+import os
+import queue
+import random
+import sys
+import time
+
+# Each configuration is given by (seed, p_value, algo).
+def default_configurations(workers):
+    p_values = [0.3, 0.2, 0.4, 0.5]
+    algos = ['walksat_incremental', 'walksat_incremental', 'walksat_incremental', 'cdcl']
+
+    return [(seed + 1, p_values[seed % len(p_values)], algos[seed % len(algos)]) for seed in range(workers)]
+
+def portfolio_worker(cnf_file_name, configuration, max_flips, stop_event, results):
+    seed, p_value, algo = configuration
+    start_time = time.time()
+    model, flips, error = None, 0, None
+
+    # A result is always reported (with the error, if the worker fails), so the portfolio does not wait for it.
+    try:
+        # Each worker uses its own seed for the pseudo-random number generator.
+        random.seed(seed)
+
+        sat = SAT(cnf_file_name)
+
+        # The worker stops once another worker has found a model.
+        sat.stop = stop_event.is_set
+
+        # Suppress the output of the solver (the results are reported together).
+        with contextlib.redirect_stdout(io.StringIO()):
+            model = sat.sat(p_value = p_value, max_flips = max_flips, algo = algo, h_value = 0)
+        flips = sat.flips
+
+        # Signal the other workers to stop.
+        if model:
+            stop_event.set()
+    except Exception as exception:
+        error = repr(exception)
+    finally:
+        results.put((configuration, model, flips, time.time() - start_time, error))
+
+def portfolio_solve(cnf_file_name, configurations = None, max_flips = 100000):
+    if configurations is None:
+        configurations = default_configurations(os.cpu_count() or 1)
+
+    start_time = time.time()
+    stop_event = multiprocessing.Event()
+    results = multiprocessing.Queue()
+
+    # Launch a process for each configuration.
+    workers = [multiprocessing.Process(target = portfolio_worker, args = (cnf_file_name, configuration, max_flips, stop_event, results)) for configuration in configurations]
+    for worker in workers:
+        worker.start()
+
+    # Collect the results as the workers finish, the first model found wins.
+        # The results are collected while any worker is alive, so a worker that dies (without a result) does not block the portfolio.
+    model = None
+    reports = []
+    reported = set()
+    while len(reported) < len(workers):
+        try:
+            configuration, result, flips, seconds, error = results.get(timeout = 0.1)
+        except queue.Empty:
+            if any(worker.is_alive() for worker in workers):
+                continue
+            # The workers have exited, so the remaining results (if any) are already in the queue.
+            try:
+                configuration, result, flips, seconds, error = results.get(timeout = 1)
+            except queue.Empty:
+                break
+
+        reported.add(configuration)
+        reports.append((configuration, result is not None, flips, seconds))
+
+        if error is not None:
+            sys.stderr.write('Worker ' + str(configuration) + ' Failed: ' + error + '\n')
+
+        if result is not None and model is None:
+            model = result
+
+    for worker in workers:
+        worker.join()
+
+    # The workers that exited without a result are reported as unsolved.
+    for configuration, worker in zip(configurations, workers):
+        if configuration not in reported:
+            sys.stderr.write('Worker ' + str(configuration) + ' Exited: ' + str(worker.exitcode) + '\n')
+            reports.append((configuration, False, 0, time.time() - start_time))
+
+    return model, reports
+
+def print_reports(reports):
+    print('Seed  P-Value  Algorithm             Solved  Flips     Time (Seconds)')
+    for (seed, p_value, algo), solved, flips, seconds in reports:
+        print('{:<5} {:<8} {:<21} {:<7} {:<9} {:.3f}'.format(seed, p_value, algo, str(solved), flips, seconds))
+
+if __name__ == '__main__':
+    start_time = time.time()
+
+    # Usage: python3 portfolio.py [puzzle_name] [workers]
+    puzzle_name = sys.argv[1] if len(sys.argv) > 1 else 'data/puzzle_bonus'
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+
+    cnf_file_name = puzzle_name + '.cnf'
+    sol_file_name = puzzle_name + '.sol'
+
+    model, reports = portfolio_solve(cnf_file_name, default_configurations(workers))
+    print_reports(reports)
+
+    if model:
+        # Write the solution using the variable names from the CNF file.
+        sat = SAT(cnf_file_name)
+        sat.model = model
+        sat.write_solution(sol_file_name)
+        display_sudoku_solution(sol_file_name)
+
+    print('Time: ' + str(time.time() - start_time))
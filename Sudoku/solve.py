@@ -25,6 +25,8 @@ if __name__ == '__main__':
     sol_file_name = puzzle_name + '.sol'
 
     sat = SAT(cnf_file_name)
+    # sat.preprocess() # Simplify the clauses (in memory) before solving.
+
     result = sat.sat(p_value = 0.3, max_flips = 100000, algo = 'walksat', h_value = 0)
 
     if result:
@@ -0,0 +1,76 @@
+# test_preprocessor.py
+# A file to test the preprocessing stage against brute force (satisfiability, and the models reconstructed from the reduced clauses).
+# Carter Kruse (October 24, 2023)
+
+# Usage: python3 test_preprocessor.py [cases]
+
+import itertools
+import random
+import sys
+
+from ClauseDatabase import ClauseDatabase
+from Preprocessor import Preprocessor
+
+# Create a database from clauses given as lists of variable names (with an optional negation).
+def create_database(clauses):
+    database = ClauseDatabase()
+    for clause in clauses:
+        database.add_clause([database.literal(name) for name in clause])
+    return database
+
+def satisfies(database, model):
+    return all(any(model[abs(literal) - 1] == (literal > 0) for literal in clause) for clause in database.clauses())
+
+# Brute Force: Returns a model of the clauses, or None.
+def brute_force(database):
+    for values in itertools.product([False, True], repeat = database.index):
+        model = dict(enumerate(values))
+        if satisfies(database, model):
+            return model
+    return None
+
+# Clauses refuted by unit propagation are reported as unsatisfiable (rather than failing in the later steps).
+def test_unsatisfiable():
+    database = create_database([['1'], ['-1', '2'], ['-2'], ['3', '4'], ['3', '-4'], ['-3', '5']])
+    preprocessor = Preprocessor(database)
+    preprocessor.simplify()
+    assert preprocessor.unsatisfiable
+
+# The givens must be known variables, and the database is not modified.
+def test_unknown_given():
+    database = create_database([['1', '2'], ['-1', '2']])
+    try:
+        Preprocessor(database, givens = ['-3']).simplify()
+        assert False, "An unknown given should raise an error."
+    except ValueError:
+        pass
+    assert database.index == 2 and '3' not in database.variable_to_index
+
+# Random clauses: The preprocessor agrees with brute force, and the model of the reduced clauses extends to the original clauses.
+def test_random(cases = 3000):
+    random.seed(0)
+
+    for case in range(cases):
+        variables = random.randint(1, 8)
+        clauses = [[random.choice(['', '-']) + str(random.randint(1, variables)) for _ in range(random.randint(1, 3))]
+                   for _ in range(random.randint(1, 4 * variables))]
+        database = create_database(clauses)
+        expected = brute_force(database)
+
+        preprocessor = Preprocessor(database)
+        reduced = preprocessor.simplify()
+
+        if preprocessor.unsatisfiable:
+            assert expected is None, clauses
+            continue
+
+        model = brute_force(reduced)
+        assert (model is None) == (expected is None), clauses
+        if model is not None:
+            assert satisfies(database, preprocessor.extend_model(model)), clauses
+
+if __name__ == '__main__':
+    test_unsatisfiable()
+    test_unknown_given()
+    test_random(int(sys.argv[1]) if len(sys.argv) > 1 else 3000)
+    print("All Tests Passed")
@@ -0,0 +1,82 @@
+# test_sat.py
+# A file to test the incremental (weighted) make/break counts of the local search against a full recomputation.
+# Carter Kruse (October 24, 2023)
+
+# Usage: python3 test_sat.py [cases]
+
+import random
+import sys
+
+from ClauseDatabase import ClauseDatabase
+from SAT import SAT
+
+# Create a solver from clauses given as lists of variable names (with an optional negation).
+def create_sat(clauses):
+    database = ClauseDatabase()
+    for clause in clauses:
+        database.add_clause([database.literal(name) for name in clause])
+    return SAT(database = database)
+
+# Recompute the make/break counts from the values and weights (tautologies are always satisfied, so they count in neither).
+def recompute(sat):
+    make_count = [0] * sat.index
+    break_count = [0] * sat.index
+
+    for clause, literals in enumerate(sat.literal_clauses):
+        if any(-literal in literals for literal in literals):
+            continue
+
+        true_variables = [abs(literal) - 1 for literal in literals if sat.values[abs(literal) - 1] == (literal > 0)]
+        if not true_variables:
+            for literal in literals:
+                make_count[abs(literal) - 1] += sat.weights[clause]
+        elif len(true_variables) == 1:
+            break_count[true_variables[0]] += sat.weights[clause]
+
+    return make_count, break_count
+
+def assert_counts(sat, clauses):
+    make_count, break_count = recompute(sat)
+    assert all(abs(a - b) < 1e-9 for a, b in zip(sat.make_count, make_count)), clauses
+    assert all(abs(a - b) < 1e-9 for a, b in zip(sat.break_count, break_count)), clauses
+
+# Smoothing (SAPS) and decreasing (PAWS) every weight, including the weights of tautologies, keeps the counts exact.
+def test_tautology_weights():
+    clauses = [['1', '-1', '2'], ['1', '2'], ['-2', '3'], ['-1', '-3']]
+    sat = create_sat(clauses)
+    sat.values = [False, False, False]
+    sat.initialize_incremental(0)
+
+    for clause in range(len(sat.weights)):
+        sat.set_weight(clause, 0.8 * sat.weights[clause] + 0.2 * 2)
+    assert_counts(sat, clauses)
+
+    sat.flip(1)
+    for clause in range(len(sat.weights)):
+        sat.set_weight(clause, sat.weights[clause] + 1)
+    assert_counts(sat, clauses)
+
+# Random clauses (with tautologies): Random flips and weight changes.
+def test_random(cases = 500):
+    random.seed(0)
+
+    for case in range(cases):
+        variables = random.randint(1, 6)
+        clauses = [[random.choice(['', '-']) + str(random.randint(1, variables)) for _ in range(random.randint(1, 4))]
+                   for _ in range(random.randint(1, 4 * variables))]
+        sat = create_sat(clauses)
+        sat.values = [random.choice([True, False]) for _ in range(sat.index)]
+        sat.initialize_incremental(0)
+
+        for _ in range(20):
+            if random.random() < 0.5:
+                sat.flip(random.randrange(sat.index))
+            else:
+                for clause in range(len(sat.weights)):
+                    sat.set_weight(clause, sat.weights[clause] * random.uniform(0.5, 1.5))
+            assert_counts(sat, clauses)
+
+if __name__ == '__main__':
+    test_tautology_weights()
+    test_random(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
+    print("All Tests Passed")